@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Extraction Benchmark
+
+Compares the WebDriver extraction path against the snapshot-and-parse path
+on saved HTML fixtures. Every find_element / .text / get_attribute call is
+one browser round-trip on a live session, so the call count is what matters;
+wall time is reported for the local parsing cost.
+
+Usage:
+    python3 benchmark_extraction.py [--repeat N]
+"""
+
+import sys
+import time
+import argparse
+
+sys.path.append('linkedin_scraper')
+
+from selenium.webdriver.common.by import By
+
+from fixture_driver import FixtureDriver, load_fixture
+from linkedin_scraper import selectors
+from linkedin_scraper.person import Person
+from linkedin_scraper.snapshot import parse_html, select_all, take_snapshot
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+
+def bench_posts_webdriver(driver, person):
+    main = driver.find_element(By.TAG_NAME, "main")
+    return [person._extract_post_data(e) for e in main.find_elements(By.CSS_SELECTOR, selectors.POST)]
+
+
+def bench_posts_snapshot(driver, person):
+    main = driver.find_element(By.TAG_NAME, "main")
+    root = parse_html(take_snapshot(driver, main))
+    return [person._parse_post_data(n) for n in select_all(root, selectors.POST)]
+
+
+def bench_experiences_webdriver(driver, person):
+    person.experiences = []
+    person.get_experiences(snapshot=False)
+    return person.experiences
+
+
+def bench_experiences_snapshot(driver, person):
+    person.experiences = []
+    person.get_experiences(snapshot=True)
+    return person.experiences
+
+
+def bench_educations_webdriver(driver, person):
+    person.educations = []
+    person.get_educations(snapshot=False)
+    return person.educations
+
+
+def bench_educations_snapshot(driver, person):
+    person.educations = []
+    person.get_educations(snapshot=True)
+    return person.educations
+
+
+def bench_reactions_webdriver(driver, person):
+    elements = driver.find_elements(By.CSS_SELECTOR, selectors.REACTION_CONTAINERS[0])
+    return [person._extract_reaction_data(e) for e in elements]
+
+
+def bench_reactions_snapshot(driver, person):
+    rows = person.run_query_plan(person._reaction_queries(), container=selectors.REACTION_CONTAINERS)
+    return [person._reaction_data_from_values(values) for values in rows]
+
+
+BENCHMARKS = [
+    ("posts", "activity_posts.html", bench_posts_webdriver, bench_posts_snapshot),
+    ("experiences", "person/experience.html", bench_experiences_webdriver, bench_experiences_snapshot),
+    ("educations", "person/education.html", bench_educations_webdriver, bench_educations_snapshot),
+    ("reactions", "activity_reactions.html", bench_reactions_webdriver, bench_reactions_snapshot),
+]
+
+
+def run(repeat):
+    print(f"{'benchmark':<14}{'mode':<11}{'round-trips':>12}{'ms/run':>10}")
+    print("-" * 47)
+    for name, fixture, *modes in BENCHMARKS:
+        html = load_fixture(fixture)
+        for label, fn in zip(("webdriver", "snapshot"), modes):
+            driver = FixtureDriver(html)
+            person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+            fn(driver, person)
+            calls = driver.calls
+            start = time.perf_counter()
+            for _ in range(repeat):
+                fn(driver, person)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+            print(f"{name:<14}{label:<11}{calls:>12}{elapsed_ms:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark extraction paths against HTML fixtures')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per benchmark (default: 20)')
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,9 @@ from webdriver_manager.chrome import ChromeDriverManager
 sys.path.append('linkedin_scraper')
 from linkedin_scraper import actions
 from linkedin_scraper.job_search import JobSearch
-from linkedin_scraper.jobs import Job
+from linkedin_scraper.jobs import Job, DETAIL_TABS, DETAIL_LOADS_PER_SECOND
+from linkedin_scraper.objects import PAGE_LOAD_STRATEGY, Scraper
+from linkedin_scraper.readiness import RateLimiter
 
 
 def setup_driver():
@@ -51,6 +53,8 @@ def setup_driver():
     chrome_options.add_argument('--remote-debugging-port=9222')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Navigation returns once the DOM is parsed; scrapers wait for what they need
+    chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
     
     try:
         # Use webdriver-manager to automatically manage ChromeDriver
@@ -122,7 +126,8 @@ def extract_detailed_job_info(driver, job: Job) -> Dict[str, Any]:
     try:
         # Navigate to job details page
         if job.linkedin_url:
-            driver.get(job.linkedin_url)
+            # Switches to the job's tab when extract_detailed_job_infos preloaded it
+            Scraper(driver=driver).navigate(job.linkedin_url, None)
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
@@ -167,6 +172,17 @@ def extract_detailed_job_info(driver, job: Job) -> Dict[str, Any]:
     return job_data
 
 
+def extract_detailed_job_infos(driver, jobs: List[Job]) -> List[Dict[str, Any]]:
+    """Extract detailed information for several jobs, their pages loading a few tabs ahead"""
+    loaded = [job for job in jobs if job.linkedin_url]
+    tabs = Scraper(driver=driver).iter_tabs([job.linkedin_url for job in loaded], tabs=DETAIL_TABS,
+                                            limiter=RateLimiter(DETAIL_LOADS_PER_SECOND))
+    details = {}
+    for i, _ in enumerate(tabs):
+        details[id(loaded[i])] = extract_detailed_job_info(driver, loaded[i])
+    return [details.get(id(job)) or extract_detailed_job_info(driver, job) for job in jobs]
+
+
 def search_company_jobs(company_name: str, job_title: str, max_results: int = 50, detailed_scraping: bool = True) -> List[Dict[str, Any]]:
     """Search for jobs from a specific company with a specific title"""
     print(f"\n🔍 Searching for '{job_title}' positions at '{company_name}'...")
@@ -179,6 +195,7 @@ def search_company_jobs(company_name: str, job_title: str, max_results: int = 50
         raise ValueError("Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD environment variables")
     
     driver = None
+    matched = []
     matching_jobs = []
     
     try:
@@ -230,23 +247,22 @@ def search_company_jobs(company_name: str, job_title: str, max_results: int = 50
                 # Check if title matches
                 if is_title_match(job.job_title, job_title):
                     print(f"✅ Match found: {job.job_title} at {job.company}")
+                    matched.append(job)
                     
-                    if detailed_scraping:
-                        job_data = extract_detailed_job_info(driver, job)
-                    else:
-                        job_data = {
-                            'job_title': job.job_title,
-                            'company': job.company,
-                            'location': job.location,
-                            'linkedin_url': job.linkedin_url,
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                    
-                    matching_jobs.append(job_data)
-                    
-                    if len(matching_jobs) >= max_results:
+                    if len(matched) >= max_results:
                         break
         
+        if detailed_scraping:
+            matching_jobs = extract_detailed_job_infos(driver, matched)
+        else:
+            matching_jobs = [{
+                'job_title': job.job_title,
+                'company': job.company,
+                'location': job.location,
+                'linkedin_url': job.linkedin_url,
+                'scraped_at': datetime.now().isoformat()
+            } for job in matched]
+        
         print(f"🎯 Found {len(matching_jobs)} matching jobs")
         
     except Exception as e:
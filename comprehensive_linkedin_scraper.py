@@ -31,6 +31,7 @@ from selenium.webdriver.chrome.options import Options
 sys.path.append(os.path.join(os.path.dirname(__file__), 'linkedin_scraper'))
 
 from linkedin_scraper import Person, actions
+from linkedin_scraper.objects import PAGE_LOAD_STRATEGY
 
 def setup_driver():
     """Setup Chrome driver with stealth options and better timeout handling"""
@@ -43,6 +44,8 @@ def setup_driver():
     chrome_options.add_argument('--disable-extensions')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Navigation returns once the DOM is parsed; scrapers wait for what they need
+    chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
     
     # Set timeouts
     chrome_options.add_argument('--timeout=30')
@@ -119,7 +122,7 @@ def scrape_comprehensive_profile(profile_url, output_file=None):
         # 1. Scrape Person Details
         print("👤 Scraping person details...")
         try:
-            person.scrape(close_on_complete=False)
+            person.scrape(close_on_complete=False, parallel_tabs=True)
             
             # Extract person details
             person_details = {
@@ -180,82 +183,88 @@ def scrape_comprehensive_profile(profile_url, output_file=None):
             print(f"❌ Error scraping person details: {e}")
             comprehensive_data["scraping_status"]["person_details"] = f"error: {str(e)}"
         
-        # 2. Scrape Recent Posts
-        print("\n📝 Scraping recent 5 posts...")
+        # The three activity pages load side by side while each is read in turn
+        person.open_tabs(person.activity_urls())
         try:
-            posts = person.get_posts(hours_limit=24)
-            recent_posts = []
+            # 2. Scrape Recent Posts
+            print("\n📝 Scraping recent 5 posts...")
+            try:
+                posts = person.get_posts(hours_limit=24)
+                recent_posts = []
             
-            for i, post in enumerate(posts[:5]):
-                post_data = {
-                    "content": getattr(post, 'content', ''),
-                    "posted_date": getattr(post, 'posted_date', ''),
-                    "likes": getattr(post, 'likes', 0),
-                    "comments": getattr(post, 'comments', 0),
-                    "shares": getattr(post, 'shares', 0),
-                    "post_url": getattr(post, 'post_url', '')
-                }
-                recent_posts.append(post_data)
-                print(f"📄 Post {i+1}: {post_data['content'][:50]}...")
+                for i, post in enumerate(posts[:5]):
+                    post_data = {
+                        "content": getattr(post, 'content', ''),
+                        "posted_date": getattr(post, 'posted_date', ''),
+                        "likes": getattr(post, 'likes', 0),
+                        "comments": getattr(post, 'comments', 0),
+                        "shares": getattr(post, 'shares', 0),
+                        "post_url": getattr(post, 'post_url', '')
+                    }
+                    recent_posts.append(post_data)
+                    print(f"📄 Post {i+1}: {post_data['content'][:50]}...")
             
-            comprehensive_data["recent_posts"] = recent_posts
-            comprehensive_data["scraping_status"]["posts"] = "success"
-            print(f"✅ Extracted {len(recent_posts)} posts")
+                comprehensive_data["recent_posts"] = recent_posts
+                comprehensive_data["scraping_status"]["posts"] = "success"
+                print(f"✅ Extracted {len(recent_posts)} posts")
             
-        except Exception as e:
-            print(f"⚠️ Posts extraction failed: {e}")
-            comprehensive_data["scraping_status"]["posts"] = f"error: {str(e)}"
+            except Exception as e:
+                print(f"⚠️ Posts extraction failed: {e}")
+                comprehensive_data["scraping_status"]["posts"] = f"error: {str(e)}"
         
-        # 3. Scrape Recent Comments
-        print("\n💬 Scraping recent 5 comments...")
-        try:
-            comments = person.get_comments(comment_limit=5)
-            recent_comments = []
+            # 3. Scrape Recent Comments
+            print("\n💬 Scraping recent 5 comments...")
+            try:
+                comments = person.get_comments(comment_limit=5)
+                recent_comments = []
             
-            for i, comment in enumerate(comments[:5]):
-                comment_data = {
-                    "content": getattr(comment, 'content', ''),
-                    "commented_date": getattr(comment, 'commented_date', ''),
-                    "likes": getattr(comment, 'likes', 0),
-                    "replies": getattr(comment, 'replies', 0),
-                    "post_url": getattr(comment, 'post_url', ''),
-                    "author": getattr(comment, 'author', '')
-                }
-                recent_comments.append(comment_data)
-                print(f"💭 Comment {i+1}: {comment_data['content'][:50]}...")
+                for i, comment in enumerate(comments[:5]):
+                    comment_data = {
+                        "content": getattr(comment, 'content', ''),
+                        "commented_date": getattr(comment, 'commented_date', ''),
+                        "likes": getattr(comment, 'likes', 0),
+                        "replies": getattr(comment, 'replies', 0),
+                        "post_url": getattr(comment, 'post_url', ''),
+                        "author": getattr(comment, 'author', '')
+                    }
+                    recent_comments.append(comment_data)
+                    print(f"💭 Comment {i+1}: {comment_data['content'][:50]}...")
             
-            comprehensive_data["recent_comments"] = recent_comments
-            comprehensive_data["scraping_status"]["comments"] = "success"
-            print(f"✅ Extracted {len(recent_comments)} comments")
+                comprehensive_data["recent_comments"] = recent_comments
+                comprehensive_data["scraping_status"]["comments"] = "success"
+                print(f"✅ Extracted {len(recent_comments)} comments")
             
-        except Exception as e:
-            print(f"⚠️ Comments extraction failed: {e}")
-            comprehensive_data["scraping_status"]["comments"] = f"error: {str(e)}"
+            except Exception as e:
+                print(f"⚠️ Comments extraction failed: {e}")
+                comprehensive_data["scraping_status"]["comments"] = f"error: {str(e)}"
         
-        # 4. Scrape Recent Reactions
-        print("\n👍 Scraping recent 5 reactions...")
-        try:
-            reactions = person.get_reactions(reaction_limit=5)
-            recent_reactions = []
+            # 4. Scrape Recent Reactions
+            print("\n👍 Scraping recent 5 reactions...")
+            try:
+                reactions = person.get_reactions(reaction_limit=5)
+                recent_reactions = []
             
-            for i, reaction in enumerate(reactions[:5]):
-                reaction_data = {
-                    "reaction_type": getattr(reaction, 'reaction_type', ''),
-                    "reacted_date": getattr(reaction, 'reacted_date', ''),
-                    "post_content": getattr(reaction, 'post_content', ''),
-                    "post_author": getattr(reaction, 'post_author', ''),
-                    "post_url": getattr(reaction, 'post_url', '')
-                }
-                recent_reactions.append(reaction_data)
-                print(f"👍 Reaction {i+1}: {reaction_data['reaction_type']} on {reaction_data['post_content'][:30]}...")
+                for i, reaction in enumerate(reactions[:5]):
+                    reaction_data = {
+                        "reaction_type": getattr(reaction, 'reaction_type', ''),
+                        "reacted_date": getattr(reaction, 'reacted_date', ''),
+                        "post_content": getattr(reaction, 'post_content', ''),
+                        "post_author": getattr(reaction, 'post_author', ''),
+                        "post_url": getattr(reaction, 'post_url', '')
+                    }
+                    recent_reactions.append(reaction_data)
+                    print(f"👍 Reaction {i+1}: {reaction_data['reaction_type']} on {reaction_data['post_content'][:30]}...")
             
-            comprehensive_data["recent_reactions"] = recent_reactions
-            comprehensive_data["scraping_status"]["reactions"] = "success"
-            print(f"✅ Extracted {len(recent_reactions)} reactions")
+                comprehensive_data["recent_reactions"] = recent_reactions
+                comprehensive_data["scraping_status"]["reactions"] = "success"
+                print(f"✅ Extracted {len(recent_reactions)} reactions")
             
-        except Exception as e:
-            print(f"⚠️ Reactions extraction failed: {e}")
-            comprehensive_data["scraping_status"]["reactions"] = f"error: {str(e)}"
+            except Exception as e:
+                print(f"⚠️ Reactions extraction failed: {e}")
+                comprehensive_data["scraping_status"]["reactions"] = f"error: {str(e)}"
+        finally:
+            # Close the activity tabs, read or not, so they do not pile up across profiles
+            person.close_tabs()
         
     except Exception as e:
         print(f"❌ Critical error during scraping: {e}")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Fixture WebDriver
+
+A tiny stand-in for a Selenium driver that serves saved HTML pages from
+disk and counts every browser round-trip. It lets the extraction code be
+checked and benchmarked against fixtures without a live LinkedIn session.
+Only the parts of the WebDriver API the scrapers use are implemented.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append('linkedin_scraper')
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from linkedin_scraper.runtime import RUNTIME_JS, CALL_JS, CHAIN_JS
+from linkedin_scraper.snapshot import parse_html, select_all, node_text, node_attr, evaluate_query_plan
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name):
+    """Read a fixture file from the fixtures directory"""
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _find_nodes(node, by, value):
+    if by == By.CSS_SELECTOR:
+        return select_all(node, value)
+    if by == By.TAG_NAME:
+        return select_all(node, value)
+    if by == By.CLASS_NAME:
+        return select_all(node, "." + value.strip())
+    if by == By.ID:
+        return select_all(node, "#" + value)
+    if by == By.XPATH:
+        return [n for n in node.xpath(value) if isinstance(n.tag, str)]
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+class FixtureElement:
+    """WebElement look-alike backed by an lxml node"""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        self._driver.calls += 1
+        return node_text(self._node)
+
+    def get_attribute(self, name):
+        self._driver.calls += 1
+        return node_attr(self._node, name)
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find_element(self._node, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find_elements(self._node, by, value)
+
+    def is_enabled(self):
+        self._driver.calls += 1
+        return self._node.get("disabled") is None
+
+    def click(self):
+        self._driver.calls += 1
+        self._driver._clicked(self._node)
+
+    def clear(self):
+        self._driver.calls += 1
+        self._node.set("value", "")
+
+    def send_keys(self, *keys):
+        self._driver.calls += 1
+        self._node.set("value", (self._node.get("value") or "") + "".join(keys))
+
+
+class _FixtureAlert:
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def accept(self):
+        self._driver.calls += 1
+
+
+class _FixtureSwitchTo:
+
+    def __init__(self, driver):
+        self._driver = driver
+        self.alert = _FixtureAlert(driver)
+
+    def new_window(self, type_hint=None):
+        self._driver.calls += 1
+        self._driver._new_tab()
+
+    def window(self, handle):
+        self._driver.calls += 1
+        self._driver._switch_tab(handle)
+
+
+class FixtureDriver:
+    """
+    Serve saved pages as if they were live.
+
+    Args:
+        pages (dict or str): url -> HTML mapping, or a single HTML string served for every url
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = 0
+        self.current_url = None
+        self._root = None
+        self.switch_to = _FixtureSwitchTo(self)
+        self.runtime_loaded = False
+        self._observers = {}
+        self.implicit_wait = 0
+        self.stalls = 0
+        self.cdp_commands = []
+        if isinstance(pages, str):
+            self._root = parse_html(pages)
+        # Every tab's page state, the current one's kept in the attributes above
+        self._tabs = {"tab-0": None}
+        self.current_window_handle = "tab-0"
+        self._tab_count = 0
+        self.loads = []
+
+    @property
+    def window_handles(self):
+        return list(self._tabs)
+
+    def _tab_state(self):
+        return (self.current_url, self._root, self.runtime_loaded, self._observers)
+
+    def _switch_tab(self, handle):
+        if self.current_window_handle in self._tabs:
+            self._tabs[self.current_window_handle] = self._tab_state()
+        self.current_url, self._root, self.runtime_loaded, self._observers = self._tabs[handle]
+        self.current_window_handle = handle
+
+    def _new_tab(self):
+        self._tab_count += 1
+        handle = f"tab-{self._tab_count}"
+        self._tabs[handle] = (None, parse_html("<html><body></body></html>"), False, {})
+        self._switch_tab(handle)
+
+    def close(self):
+        self.calls += 1
+        del self._tabs[self.current_window_handle]
+
+    def get(self, url):
+        self.calls += 1
+        self.loads.append(url)
+        self.current_url = url
+        self.runtime_loaded = False
+        self._observers = {}
+        if isinstance(self.pages, dict):
+            self._root = parse_html(self.pages[url])
+
+    @property
+    def page_source(self):
+        self.calls += 1
+        return node_attr(self._root, "outerHTML")
+
+    def implicitly_wait(self, seconds):
+        self.calls += 1
+        self.implicit_wait = seconds
+
+    @property
+    def timeouts(self):
+        self.calls += 1
+        return SimpleNamespace(implicit_wait=self.implicit_wait)
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        if script.endswith(CALL_JS) or script.endswith(CHAIN_JS):
+            if script.startswith(RUNTIME_JS):
+                self.runtime_loaded = True
+            if not self.runtime_loaded:
+                return None
+            if script.endswith(CALL_JS):
+                return [self._runtime_call(*args)]
+            return [[self._runtime_call(name, call_args) for name, call_args in args[0]]]
+        if "scrollHeight" in script and script.strip().startswith("return"):
+            return 0
+        if script.strip() == "return document.readyState;":
+            return "complete"
+        if script.startswith("window.location.href"):
+            self.calls -= 1
+            self.get(args[0])
+            return None
+        return None
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.calls += 1
+        self.cdp_commands.append((cmd, cmd_args))
+        return {}
+
+    def _clicked(self, node):
+        # A saved page does not react to clicks
+        pass
+
+    def _node(self, element):
+        return element._node if element is not None else self._root
+
+    def _runtime_call(self, name, args):
+        # Python stand-ins for the window.__ss primitives; the page never scrolls
+        if name in ("height", "scrollTo", "scrollElement"):
+            return 0
+        if name in ("scrollIntoView", "click"):
+            return True
+        if name == "count":
+            selector, base = (list(args) + [None])[:2]
+            return len(select_all(self._node(base), selector))
+        if name == "probe":
+            selectors, base = (list(args) + [None])[:2]
+            return [bool(select_all(self._node(base), selector)) for selector in selectors]
+        if name == "expand":
+            xpath, base = (list(args) + [None])[:2]
+            return len(self._node(base).xpath(xpath))
+        if name == "extract":
+            plan, containers, base, limit = args
+            return evaluate_query_plan(self._node(base), plan, containers, limit)
+        if name == "observe":
+            key, container, item = args
+            state = self._observers.setdefault(key, {"seen": set(), "queue": []})
+            state.update(container=container, item=item)
+            if not select_all(self._root, container):
+                return -1
+            self._deliver_mutations(state)
+            return len(state["queue"])
+        if name == "drain":
+            key, plan, limit, ready = args
+            state = self._observers.get(key)
+            if state is None:
+                return {"containerIndex": -1, "rows": []}
+            self._deliver_mutations(state)
+            nodes, waiting = [], []
+            for node in state["queue"]:
+                if (limit is not None and len(nodes) >= limit) or (ready and not select_all(node, ready)):
+                    waiting.append(node)
+                else:
+                    nodes.append(node)
+            state["queue"] = waiting
+            return {"containerIndex": -1, "rows": [evaluate_query_plan(node, plan)["rows"][0] for node in nodes]}
+        if name == "disconnect":
+            self._observers.pop(args[0], None)
+            return True
+        if name == "ready":
+            # A saved page is loaded, idle and never changes
+            selector = args[0]
+            return {
+                "state": "complete",
+                "pending": 0,
+                "quietMs": float("inf"),
+                "idleMs": float("inf"),
+                "count": len(select_all(self._root, selector)) if selector else -1,
+            }
+        raise ValueError(f"Unknown runtime primitive: {name}")
+
+    def _deliver_mutations(self, state):
+        # Stands in for the MutationObserver callback: buffer items not seen before
+        for container in select_all(self._root, state["container"])[:1]:
+            for node in select_all(container, state["item"]):
+                if node not in state["seen"]:
+                    state["seen"].add(node)
+                    state["queue"].append(node)
+
+    def _find_elements(self, node, by, value):
+        self.calls += 1
+        elements = [FixtureElement(self, n) for n in _find_nodes(node, by, value)]
+        if not elements and self.implicit_wait:
+            # A live driver would sit out the implicit wait here
+            self.stalls += 1
+        return elements
+
+    def _find_element(self, node, by, value):
+        elements = self._find_elements(node, by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find_element(self._root, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find_elements(self._root, by, value)
@@ -1,9 +1,10 @@
 from os.path import dirname, basename, isfile
 from .person import Person
-from .objects import Institution, Experience, Education, Contact, Post, Comment
+from .objects import Institution, Experience, Education, Contact, Post, Comment, Query
 from .company import Company
 from .jobs import Job
 from .job_search import JobSearch
+from .pool import DriverPool
 
 __version__ = "2.11.5"
 
@@ -0,0 +1,298 @@
+"""
+Batch scraping from a file of URLs.
+
+URLs are handed out to worker processes that each own one signed-in browser
+(a DriverPool of one), so N workers scrape N pages at a time. Every finished
+URL is appended to a JSON-lines checkpoint journal, its scraped data or its
+error, and flushed to disk right away. A run that crashes or is stopped is
+resumed by starting it again with the same journal: URLs already scraped are
+skipped.
+
+    python -m linkedin_scraper.batch urls.txt --kind person --workers 4 --journal run.jsonl
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import util
+
+from .objects import Scraper
+from .offline import SCRAPERS
+from .pool import DriverPool
+
+# Scraper attributes that are browser state rather than scraped data
+_NOT_DATA = {"driver", "deadline"}
+
+
+def read_urls(path):
+    """URLs in the file at ``path``, one per line; blank lines, # comments and repeats are skipped"""
+    urls = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith("#"):
+                urls.setdefault(url, None)
+    return list(urls)
+
+
+def to_record(value):
+    """JSON-ready copy of a scraped object: dataclasses and scraper attributes become dicts"""
+    if isinstance(value, Scraper):
+        return {
+            key: to_record(item) for key, item in vars(value).items()
+            if not key.startswith("_") and key not in _NOT_DATA
+        }
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return to_record(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(key): to_record(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_record(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "__dict__"):
+        return {key: to_record(item) for key, item in vars(value).items() if not key.startswith("_")}
+    return str(value)
+
+
+class Journal:
+    """
+    Append-only JSON-lines record of finished URLs.
+
+    Each line is flushed and synced as it is written, so at most the line being
+    written when the process died is lost; such a torn line is ignored on load.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def load(self):
+        """url -> the last record written for it"""
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["url"]] = record
+        return records
+
+    def append(self, record):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+            if self._file.tell() and not self._ends_with_newline():
+                self._file.write("\n")  # end a torn line so the next record starts clean
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclasses.dataclass
+class BatchStats:
+    total: int = 0
+    skipped: int = 0
+    done: int = 0
+    failed: int = 0
+    started: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def per_minute(self):
+        elapsed = time.monotonic() - self.started
+        return 60 * (self.done + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        finished = self.skipped + self.done + self.failed
+        return f"{finished}/{self.total} URLs, {self.failed} failed, {self.per_minute:.1f} URLs/min"
+
+
+def print_progress(stats):
+    print(f"📊 {stats}")
+
+
+def scrape_one(pool, kind, url, kwargs):
+    """Scrape ``url`` on a session of ``pool``; the journal record, never an exception"""
+    started = time.monotonic()
+    try:
+        with pool.session() as driver:
+            scraped = SCRAPERS[kind](url, driver=driver, close_on_complete=False, **kwargs)
+        record = {"url": url, "kind": kind, "ok": True, "data": to_record(scraped)}
+    except Exception as e:
+        record = error_record(kind, url, e)
+    record["seconds"] = round(time.monotonic() - started, 2)
+    return record
+
+
+def error_record(kind, url, error):
+    """Journal record of a URL that could not be scraped"""
+    return {"url": url, "kind": kind, "ok": False, "error": f"{type(error).__name__}: {error}", "seconds": 0}
+
+
+# The worker process's own session, opened by _start_worker
+_worker_pool = None
+
+
+def _start_worker(pool_args):
+    global _worker_pool
+    _worker_pool = DriverPool(size=1, **pool_args)
+    # Quit the browser when the worker process exits
+    util.Finalize(_worker_pool, _worker_pool.close, exitpriority=10)
+
+
+def _worker_scrape(kind, url, kwargs):
+    return scrape_one(_worker_pool, kind, url, kwargs)
+
+
+def run_batch(kind, urls, journal_path, workers=2, email=None, password=None, cookie=None, factory=None, login=None,
+              retry_failed=True, progress=print_progress, report_every=10, **kwargs):
+    """
+    Scrape every url with worker processes, checkpointing to ``journal_path``.
+
+    Args:
+        kind (str): One of offline.SCRAPERS ("person", "company" or "job")
+        urls (list): URLs to scrape, e.g. from read_urls
+        journal_path (str): Checkpoint journal; URLs it already records as done are skipped
+        workers (int): Worker processes, each with its own signed-in browser.
+            1 scrapes in this process
+        email, password, cookie: Credentials for actions.login
+        factory, login (callable): Driver factory and login, as for DriverPool;
+            must be picklable with more than one worker
+        retry_failed (bool): Scrape URLs the journal records as failed again
+        progress (callable): Called with the BatchStats every ``report_every``
+            URLs and at the end
+        **kwargs: Passed on to the scraper class, e.g. budget_seconds for Person
+
+    Returns:
+        BatchStats
+    """
+    if kind not in SCRAPERS:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {sorted(SCRAPERS)}")
+    journal = Journal(journal_path)
+    previous = journal.load()
+    todo = [url for url in urls if url not in previous or (retry_failed and not previous[url]["ok"])]
+    stats = BatchStats(total=len(urls), skipped=len(urls) - len(todo))
+    pool_args = dict(email=email, password=password, cookie=cookie, factory=factory, login=login)
+
+    def finish(record):
+        journal.append(record)
+        if record["ok"]:
+            stats.done += 1
+        else:
+            stats.failed += 1
+        if progress and (stats.done + stats.failed) % report_every == 0:
+            progress(stats)
+
+    try:
+        if workers == 1 or len(todo) <= 1:
+            _run_in_process(kind, todo, pool_args, kwargs, finish)
+        else:
+            _run_in_processes(kind, todo, workers, pool_args, kwargs, finish)
+    finally:
+        journal.close()
+    if progress:
+        progress(stats)
+    return stats
+
+
+def _run_in_process(kind, urls, pool_args, kwargs, finish):
+    if not urls:
+        return
+    try:
+        pool = DriverPool(size=1, **pool_args)
+    except Exception as e:
+        # No session, so nothing can be scraped; journal every URL as failed
+        for url in urls:
+            finish(error_record(kind, url, e))
+        return
+    try:
+        for url in urls:
+            finish(scrape_one(pool, kind, url, kwargs))
+    finally:
+        pool.close()
+
+
+def _run_in_processes(kind, urls, workers, pool_args, kwargs, finish):
+    # Only a couple of URLs per worker are queued at a time, so a huge list is
+    # not pickled up front and results reach the journal as they come in
+    queue = iter(urls)
+    pending = {}
+    broken = None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker, initargs=(pool_args,)) as executor:
+        def submit_next():
+            nonlocal broken
+            url = next(queue, None)
+            if url is None:
+                return
+            if broken is not None:
+                finish(error_record(kind, url, broken))
+                return
+            try:
+                pending[executor.submit(_worker_scrape, kind, url, kwargs)] = url
+            except BrokenProcessPool as e:
+                broken = e
+                finish(error_record(kind, url, e))
+
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                url = pending.pop(future)
+                try:
+                    record = future.result()
+                except BrokenProcessPool as e:
+                    # A worker died, e.g. its login failed: the pool takes no more work
+                    broken = e
+                    record = error_record(kind, url, e)
+                except Exception as e:
+                    record = error_record(kind, url, e)
+                finish(record)
+                submit_next()
+        # URLs never submitted because the pool broke are journaled as failed
+        # too, so a resumed run retries every one of them
+        if broken is not None:
+            for url in queue:
+                finish(error_record(kind, url, broken))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape a file of LinkedIn URLs with checkpointing")
+    parser.add_argument("urls", help="File with one profile, company or job URL per line")
+    parser.add_argument("--kind", choices=sorted(SCRAPERS), default="person", help="What the URLs point to (default: person)")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes, one browser each (default: 2)")
+    parser.add_argument("--journal", default=None, help="Checkpoint journal (default: <urls>.journal.jsonl)")
+    parser.add_argument("--no-retry", action="store_true", help="Do not retry URLs that failed in an earlier run")
+    args = parser.parse_args(argv)
+
+    stats = run_batch(
+        args.kind,
+        read_urls(args.urls),
+        args.journal or args.urls + ".journal.jsonl",
+        workers=args.workers,
+        email=os.getenv("LINKEDIN_EMAIL"),
+        password=os.getenv("LINKEDIN_PASSWORD"),
+        cookie=os.getenv("LINKEDIN_COOKIE"),
+        retry_failed=not args.no_retry,
+    )
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,27 @@
 import requests
 from lxml import html
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Scraper
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from . import readiness
+from .objects import Scraper, Query, create_driver
 from .person import Person
-import time
+from .snapshot import load_pages, canonical_url, select_all, select_one, node_text
 import os
 import json
 
 AD_BANNER_CLASSNAME = ('ad-banner-container', '__ad')
+COMPANY_CARD_QUERIES = [
+    Query("linkedin_url", ".company-name-link", "href"),
+    Query("name", ".company-name-link", default=""),
+    Query("followers", ".company-followers-count", default=""),
+]
+EMPLOYEE_QUERIES = [
+    Query("text", None, default=""),
+    Query("linkedin_url", "a", "href"),
+]
+ABOUT_GRID_CLASSNAME = "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom"
 
 def getchildren(elem):
     return elem.find_elements(By.XPATH, ".//*")
@@ -49,7 +59,7 @@ class Company(Scraper):
     employees = []
     headcount = None
 
-    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True):
+    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True, get = True, page_load_strategy = None):
         self.linkedin_url = linkedin_url
         self.name = name
         self.about_us = about_us
@@ -64,18 +74,11 @@ class Company(Scraper):
         self.showcase_pages = showcase_pages
         self.affiliated_companies = affiliated_companies
 
-        if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(os.path.dirname(__file__), 'drivers/chromedriver')
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
-
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+        if driver is None and (get or scrape):
+            driver = create_driver(page_load_strategy)
 
-        driver.get(linkedin_url)
+        if get:
+            driver.get(linkedin_url)
         self.driver = driver
 
         if scrape:
@@ -93,6 +96,85 @@ class Company(Scraper):
         else:
             self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
 
+    @classmethod
+    def from_html(cls, source, linkedin_url = None):
+        """
+        Build a Company from a saved "about" page, without a browser.
+
+        Args:
+            source: The about page as a path, str or bytes, or a directory/dict of pages with an ``about`` page
+            linkedin_url (str): Company URL; defaults to the page's canonical URL
+
+        Returns:
+            Company
+        """
+        pages = load_pages(source, default = "about")
+        root = pages.get("about")
+        if root is None:
+            root = next(iter(pages.values()))
+        company = cls(linkedin_url = linkedin_url or canonical_url(root), showcase_pages = [], affiliated_companies = [], scrape = False, get = False)
+        company.employees = []
+        company._parse_about_page(root)
+        return company
+
+    def _apply_about_details(self, labels, values, text):
+        """Map the about page's dt/dd pairs onto attributes; ``text`` reads an element's text"""
+        num_attributes = min(len(labels), len(values))
+        x_off = 0
+        for i in range(num_attributes):
+            txt = text(labels[i]).strip()
+            if txt == 'Website':
+                self.website = text(values[i+x_off]).strip()
+            if txt == 'Phone':
+                self.phone = text(values[i+x_off]).strip()
+            elif txt == 'Industry':
+                self.industry = text(values[i+x_off]).strip()
+            elif txt == 'Company size':
+                self.company_size = text(values[i+x_off]).strip()
+                if len(values) > len(labels):
+                    x_off = 1
+            elif txt == 'Headquarters':
+                    self.headquarters = text(values[i+x_off]).strip()
+            elif txt == 'Type':
+                self.company_type = text(values[i+x_off]).strip()
+            elif txt == 'Founded':
+                self.founded = text(values[i+x_off]).strip()
+            elif txt == 'Specialties':
+                self.specialties = "\n".join(text(values[i+x_off]).strip().split(", "))
+
+    def _apply_headcount(self, span_texts):
+        for txt in span_texts:
+            txt = txt.strip()
+            if "See all" in txt and "employees on LinkedIn" in txt:
+                self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
+
+    def _parse_about_page(self, root):
+        """Fill name, about and details from an lxml snapshot of the about page"""
+        name = select_one(root, ".org-top-card-summary__title")
+        if name is not None:
+            self.name = node_text(name).strip()
+
+        grid = select_one(root, "." + ABOUT_GRID_CLASSNAME)
+        if grid is not None:
+            descWrapper = select_all(grid, "p")
+            if len(descWrapper) > 0:
+                self.about_us = node_text(descWrapper[0]).strip()
+            self._apply_about_details(select_all(grid, "dt"), select_all(grid, "dd"), node_text)
+
+        headcount_grid = select_one(root, ".mt1")
+        if headcount_grid is not None:
+            self._apply_headcount(node_text(span) for span in select_all(headcount_grid, "span"))
+
+    def __get_company_cards(self, company_list):
+        return [
+            CompanySummary(
+                linkedin_url = card["linkedin_url"],
+                name = card["name"].strip(),
+                followers = card["followers"].strip()
+            )
+            for card in self.run_query_plan(COMPANY_CARD_QUERIES, container=".org-company-card", base=company_list)
+        ]
+
     def __parse_employee__(self, employee_raw):
 
         try:
@@ -118,6 +200,17 @@ class Company(Scraper):
             # print(e)
             return None
 
+    def _employee_from_values(self, values):
+        """Employee record from an EMPLOYEE_QUERIES row, mirroring __parse_employee__"""
+        lines = values["text"].split("\n")
+        if len(lines) < 4 or values["linkedin_url"] is None:
+            return None
+        return {
+            'name': lines[0].strip(),
+            'designation': lines[3].strip(),
+            'linkedin_url': values["linkedin_url"],
+        }
+
     def get_employees(self, wait_time=10):
         total = []
         list_css = "list-style-none"
@@ -128,67 +221,44 @@ class Company(Scraper):
             see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
         except:
             pass
-        driver.get(os.path.join(self.linkedin_url, "people"))
-
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
-
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
-
-        results_list = driver.find_element(By.CLASS_NAME, list_css)
-        results_li = results_list.find_elements(By.TAG_NAME, "li")
-        for res in results_li:
-            total.append(self.__parse_employee__(res))
-
-        def is_loaded(previous_results):
-          loop = 0
-          driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-          results_li = results_list.find_elements(By.TAG_NAME, "li")
-          while len(results_li) == previous_results and loop <= 5:
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            loop += 1
-          return loop <= 5
-
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
-
-        results_li_len = len(results_li)
-        while is_loaded(results_li_len):
+        # The page buffers each result <li> once, as it is inserted, so every
+        # page only ships and parses the employees that are new since the last one
+        self.navigate(os.path.join(self.linkedin_url, "people"), list_css, By.CLASS_NAME)
+        self.observe("employees", "." + list_css, "li")
+
+        while True:
+            self.scroll_until("." + list_css + " li", max_delay=3)
+            for values in self.drain("employees", EMPLOYEE_QUERIES):
+                total.append(self._employee_from_values(values))
+            first = self._first_employee_link(list_css)
             try:
                 driver.find_element(By.XPATH,next_xpath).click()
             except:
-                pass
-            _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
-
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
-
-            get_data(results_li_len)
-            results_li_len = len(total)
+                break
+            # The old page's list is still there right after the click; wait
+            # until the first result changes, i.e. the next page has rendered
+            try:
+                WebDriverWait(driver, self.time_left(wait_time), poll_frequency=readiness.POLL_FREQUENCY).until(
+                    lambda d: self._first_employee_link(list_css) not in (None, first)
+                )
+            except TimeoutException:
+                break
+            # Re-attach to the next page's list; stop if it brought nobody new
+            if self.observe("employees", "." + list_css, "li") <= 0:
+                break
+        self.call("disconnect", "employees")
         return total
 
 
 
+    def _first_employee_link(self, list_css):
+        """Profile link of the first result in the people list, in one round-trip"""
+        return self.run_query_plan([Query("link", "." + list_css + " li a", "href")])["link"]
+
     def scrape_logged_in(self, get_employees = True, close_on_complete = True):
         driver = self.driver
 
-        driver.get(self.linkedin_url)
-
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
-
-        navigation = driver.find_element(By.CLASS_NAME, "org-page-navigation__items ")
+        navigation = self.navigate(self.linkedin_url, "org-page-navigation__items", By.CLASS_NAME)
 
         self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
 
@@ -199,10 +269,11 @@ class Company(Scraper):
             navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
           ).click()
         except:
-          driver.get(os.path.join(self.linkedin_url, "about"))
+          self.navigate(os.path.join(self.linkedin_url, "about"), None)
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
-        time.sleep(3)
+        _ = WebDriverWait(driver, self.time_left(3), poll_frequency=readiness.POLL_FREQUENCY).until(
+            EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
+        self.wait_until_settled(timeout=3)
 
         if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
             section_id = 4
@@ -210,75 +281,39 @@ class Company(Scraper):
             section_id = 3
        #section ID is no longer needed, we are using class name now.
         #grid = driver.find_elements_by_tag_name("section")[section_id]
-        grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
+        grid = driver.find_element(By.CLASS_NAME, ABOUT_GRID_CLASSNAME)
         print(grid)
         descWrapper = grid.find_elements(By.TAG_NAME, "p")
         if len(descWrapper) > 0:
             self.about_us = descWrapper[0].text.strip()
         labels = grid.find_elements(By.TAG_NAME, "dt")
         values = grid.find_elements(By.TAG_NAME, "dd")
-        num_attributes = min(len(labels), len(values))
         #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
         # if num_attributes == 0:
         #     exit()
-        x_off = 0
-        for i in range(num_attributes):
-            txt = labels[i].text.strip()
-            if txt == 'Website':
-                self.website = values[i+x_off].text.strip()
-            if txt == 'Phone':
-                self.phone = values[i+x_off].text.strip()
-            elif txt == 'Industry':
-                self.industry = values[i+x_off].text.strip()
-            elif txt == 'Company size':
-                self.company_size = values[i+x_off].text.strip()
-                if len(values) > len(labels):
-                    x_off = 1
-            elif txt == 'Headquarters':
-                    self.headquarters = values[i+x_off].text.strip()
-            elif txt == 'Type':
-                self.company_type = values[i+x_off].text.strip()
-            elif txt == 'Founded':
-                self.founded = values[i+x_off].text.strip()
-            elif txt == 'Specialties':
-                self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
+        self._apply_about_details(labels, values, lambda elem: elem.text)
 
         try:
             grid = driver.find_element(By.CLASS_NAME, "mt1")
             spans = grid.find_elements(By.TAG_NAME, "span")
-            for span in spans:
-                txt = span.text.strip()
-                if "See all" in txt and "employees on LinkedIn" in txt:
-                    self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
+            self._apply_headcount(span.text for span in spans)
         except NoSuchElementException: # Does not exist in page, skip it
             pass
 
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
+        self.call("scrollTo", 1/2)
 
 
         try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
+            _ = WebDriverWait(driver, self.time_left(3), poll_frequency=readiness.POLL_FREQUENCY).until(
+                EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
             showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
             driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
 
             # get showcase
-            for showcase_company in showcase.find_elements(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                        linkedin_url = showcase_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = showcase_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = showcase_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                    )
-                self.showcase_pages.append(companySummary)
+            self.showcase_pages.extend(self.__get_company_cards(showcase))
 
             # affiliated company
-
-            for affiliated_company in showcase.find_element(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                         linkedin_url = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = affiliated_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                        )
-                self.affiliated_companies.append(companySummary)
+            self.affiliated_companies.extend(self.__get_company_cards(affiliated))
 
         except:
             pass
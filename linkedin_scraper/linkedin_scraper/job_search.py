@@ -1,20 +1,34 @@
 import os
 from typing import List
-from time import sleep
 import urllib.parse
 
-from .objects import Scraper
+from .objects import Scraper, Query
 from . import constants as c
+from . import readiness
 from .jobs import Job
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 
 
+# A card's title link, missing while the card is still an empty placeholder
+JOB_CARD_TITLE = ".job-card-list__title"
+
+JOB_CARD_QUERIES = [
+    Query("job_title", JOB_CARD_TITLE, default=""),
+    Query("linkedin_url", JOB_CARD_TITLE, "href"),
+    Query("company", ".artdeco-entity-lockup__subtitle", default=""),
+    Query("location", ".job-card-container__metadata-wrapper", default=""),
+]
+
+
 class JobSearch(Scraper):
     AREAS = ["recommended_jobs", None, "still_hiring", "more_jobs"]
+    # Results per search page, the step of the start= offset
+    PAGE_SIZE = 25
 
     def __init__(self, driver, base_url="https://www.linkedin.com/jobs/", close_on_complete=False, scrape=True, scrape_recommended_jobs=True):
         super().__init__()
@@ -33,13 +47,22 @@ class JobSearch(Scraper):
 
 
     def scrape_job_card(self, base_element) -> Job:
-        job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
-        job_title = job_div.text.strip()
-        linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
-        job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
-        return job
+        self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
+        return self._job_from_card(self.run_query_plan(JOB_CARD_QUERIES, base=base_element))
+
+    def scrape_job_cards(self, container, base=None) -> List[Job]:
+        """Read every job card matching ``container`` in one round-trip"""
+        return [self._job_from_card(card) for card in self.run_query_plan(JOB_CARD_QUERIES, container=container, base=base)]
+
+    def _job_from_card(self, card) -> Job:
+        return Job(
+            linkedin_url=card["linkedin_url"],
+            job_title=card["job_title"].strip(),
+            company=card["company"],
+            location=card["location"],
+            scrape=False,
+            driver=self.driver,
+        )
 
 
     def scrape_logged_in(self, close_on_complete=True, scrape_recommended_jobs=True):
@@ -47,45 +70,74 @@ class JobSearch(Scraper):
         driver.get(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+            self.wait_until_settled(timeout=self.WAIT_FOR_ELEMENT_TIMEOUT)
             job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
             areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
             for i, area in enumerate(areas):
                 area_name = self.AREAS[i]
                 if not area_name:
                     continue
-                area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
-                    job = self.scrape_job_card(job_posting)
-                    area_results.append(job)
+                area_results = self.scrape_job_cards(".jobs-job-board-list__item", base=area)
                 setattr(self, area_name, area_results)
         return
 
 
-    def search(self, search_term: str) -> List[Job]:
+    def search(self, search_term: str, limit: int = None, pages: int = 1) -> List[Job]:
+        """
+        Search jobs, reading cards as they render while the results list is scrolled.
+
+        Args:
+            search_term (str): Keywords to search for
+            limit (int): Stop once this many jobs are found
+            pages (int): Results pages to read, PAGE_SIZE jobs each, through the start= offset
+
+        Returns:
+            list: Job objects, without duplicates across pages
+        """
+        jobs = []
+        seen = set()
+        for page in range(pages):
+            found = self._search_page(search_term, page * self.PAGE_SIZE, None if limit is None else limit - len(jobs))
+            fresh = [job for job in found if job.linkedin_url not in seen]
+            seen.update(job.linkedin_url for job in fresh)
+            jobs.extend(fresh)
+            if not fresh or (limit is not None and len(jobs) >= limit):
+                break
+        return jobs if limit is None else jobs[:limit]
+
+    def _search_page(self, search_term, start=0, limit=None) -> List[Job]:
         url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
-        self.driver.get(url)
-        self.scroll_to_bottom()
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
+        if start:
+            url += f"&start={start}"
         job_listing_class_name = "jobs-search-results-list"
-        job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
+        self.navigate(url, job_listing_class_name, By.CLASS_NAME)
         self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
-        job_results = []
-        for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
-            job = self.scrape_job_card(job_card)
-            job_results.append(job)
-        return job_results
+        # Cards are buffered in the page as they render and drained after every
+        # scroll, so each one is read once, in the order it appeared. A card is
+        # inserted as an empty placeholder before its title link renders; those
+        # stay buffered and are read once they are filled in
+        jobs = []
+        self.observe("jobs", "." + job_listing_class_name, ".job-card-list")
+
+        def collect(count=None):
+            cards = self.drain("jobs", JOB_CARD_QUERIES, ready=JOB_CARD_TITLE)
+            jobs.extend(self._job_from_card(card) for card in cards)
+            return limit is not None and len(jobs) >= limit
+
+        try:
+            # A full page stops at PAGE_SIZE cards without waiting for more
+            self.scroll_until(".job-card-list", target=self.PAGE_SIZE, stop=collect, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT * 3,
+                              max_delay=2, scroll_class_name=job_listing_class_name)
+            if not collect():
+                # Give placeholders left at the end a moment to render; any that
+                # never do are skipped rather than read as empty jobs
+                try:
+                    WebDriverWait(self.driver, self.time_left(self.WAIT_FOR_ELEMENT_TIMEOUT),
+                                  poll_frequency=readiness.POLL_FREQUENCY).until(
+                        lambda d: collect() or self.observe("jobs", "." + job_listing_class_name, ".job-card-list") <= 0)
+                except TimeoutException:
+                    pass
+        finally:
+            self.call("disconnect", "jobs")
+        return jobs
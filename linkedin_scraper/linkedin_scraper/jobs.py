@@ -1,14 +1,81 @@
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import re
 import time
 import urllib.parse
 
-from .objects import Scraper
+from .objects import Scraper, Query, run_query_plan
+from .readiness import RateLimiter
+from . import readiness, runtime, scrolling
 from . import constants as c
+from .snapshot import load_pages, canonical_url, select_all, select_one, node_text, node_attr
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# The "See more" button under the job description
+JOB_DESCRIPTION_EXPANDER = "(.//button)[1]"
+
+# Job pages scrape_company_jobs_detailed keeps loading at once, and how many it
+# starts per second; together these replace the old 2 s pause between jobs
+DETAIL_TABS = 4
+DETAIL_LOADS_PER_SECOND = 1
+
+# Every selector tried on a search result card by get_company_jobs
+JOB_CARD_SELECTORS = [
+    "a.base-card__full-link",
+    "a[href*='/jobs/view/']",
+    ".base-search-card a",
+    "a[data-tracking-id]",
+    "h3.base-search-card__title a span[title]",
+    "h3.base-search-card__title a",
+    "h3 a span",
+    "h4.base-search-card__subtitle a",
+    "h4 a",
+    ".job-search-card__location",
+    ".base-search-card__metadata span",
+]
+
+JOB_RESULTS_CARD = ".jobs-search__results-list li"
+
+# The same cascades, read for every card at once by Job.extract_result_cards
+JOB_RESULT_QUERIES = [
+    Query("linkedin_url", ["a.base-card__full-link", "a[href*='/jobs/view/']"], attribute="href", contains=("/jobs/view/",)),
+    Query("job_urn", ["[data-entity-urn*='jobPosting']", "[data-job-id]"], attribute=("data-entity-urn", "data-job-id")),
+    Query("job_title", ["h3.base-search-card__title a span[title]", "h3.base-search-card__title a", "h3 a span", "h3.base-search-card__title"], attribute=("title", "text")),
+    Query("company", ["h4.base-search-card__subtitle a", "h4 a", "h4.base-search-card__subtitle"]),
+    Query("location", [".job-search-card__location", ".base-search-card__metadata span"]),
+]
+
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{}/"
+_JOB_ID_PATTERNS = (
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)(?:[/?#]|$)"),
+    re.compile(r"currentJobId=(\d+)"),
+    re.compile(r"(?:jobPosting:|^)(\d+)$"),
+)
+
+
+def canonical_job_url(url=None, urn=None):
+    """
+    The canonical ``/jobs/view/<id>/`` URL for a job.
+
+    Args:
+        url (str): Any job link, e.g. with a slug or tracking parameters
+        urn (str): ``urn:li:jobPosting:<id>`` or a bare job id, used if the link has no id
+
+    Returns:
+        str: Canonical URL, or None if no job id could be found
+    """
+    for text in (url, urn):
+        if not text:
+            continue
+        for pattern in _JOB_ID_PATTERNS:
+            match = pattern.search(text.strip())
+            if match:
+                return JOB_VIEW_URL.format(match.group(1))
+    return None
+
+
 class Job(Scraper):
 
     def __init__(
@@ -50,6 +117,53 @@ class Job(Scraper):
         else:
             raise NotImplemented("This part is not implemented yet")
 
+    @classmethod
+    def from_html(cls, source, linkedin_url=None):
+        """
+        Build a Job from a saved job view page, without a browser.
+
+        Args:
+            source: The job page as a path, str or bytes, or a directory/dict of pages with a ``job`` page
+            linkedin_url (str): Job URL; defaults to the page's canonical URL
+
+        Returns:
+            Job
+        """
+        pages = load_pages(source, default="job")
+        root = pages.get("job")
+        if root is None:
+            root = next(iter(pages.values()))
+        job = cls(linkedin_url=linkedin_url or canonical_url(root), scrape=False)
+        job._parse_job_details(root)
+        return job
+
+    def _parse_job_details(self, root):
+        """Fill the job fields from an lxml snapshot of the job view page"""
+        title = select_one(root, ".job-details-jobs-unified-top-card__job-title")
+        if title is not None:
+            self.job_title = node_text(title).strip()
+        company = select_one(root, ".job-details-jobs-unified-top-card__company-name")
+        if company is not None:
+            self.company = node_text(company).strip()
+            self.company_linkedin_url = node_attr(select_one(company, "a"), "href")
+
+        primary_description = select_one(root, ".job-details-jobs-unified-top-card__primary-description-container")
+        if primary_description is not None:
+            texts = [node_text(span) for span in select_all(primary_description, "span")]
+            texts = [text for text in texts if text.strip() != ""]
+            if len(texts) > 0:
+                self.location = texts[0]
+            if len(texts) > 3:
+                self.posted_date = texts[3]
+
+        applicant_count = select_one(root, ".jobs-unified-top-card__applicant-count")
+        self.applicant_count = node_text(applicant_count).strip() if applicant_count is not None else 0
+        job_description = select_one(root, ".jobs-description")
+        if job_description is not None:
+            self.job_description = node_text(job_description).strip()
+        benefits = select_one(root, ".jobs-unified-description__salary-main-rail-card")
+        self.benefits = node_text(benefits).strip() if benefits is not None else None
+
     def to_dict(self):
         return {
             "linkedin_url": self.linkedin_url,
@@ -67,9 +181,9 @@ class Job(Scraper):
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         
-        driver.get(self.linkedin_url)
+        title = self.navigate(self.linkedin_url, "job-details-jobs-unified-top-card__job-title", By.CLASS_NAME)
         self.focus()
-        self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
+        self.job_title = title.text.strip()
         self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
         self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
         primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
@@ -82,9 +196,7 @@ class Job(Scraper):
         except TimeoutException:
             self.applicant_count = 0
         job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        job_description_elem.find_element(By.TAG_NAME, "button").click()
+        self.expand_all(JOB_DESCRIPTION_EXPANDER, base=job_description_elem)
         self.job_description = job_description_elem.text.strip()
         try:
             self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
@@ -95,7 +207,42 @@ class Job(Scraper):
             driver.close()
     
     @staticmethod
-    def get_company_jobs(driver, job_title="security engineer", company_name=None, max_jobs=25):
+    def extract_result_cards(driver, company_name=None, max_jobs=25):
+        """
+        Read every job card on the current search results page in one call
+        
+        No card is clicked or scrolled to; title, company, location and the
+        canonical /jobs/view/<id>/ URL all come from the listing itself.
+        
+        Args:
+            driver: Selenium WebDriver instance on a job search results page
+            company_name: Company to record when a card has none (optional)
+            max_jobs: Maximum number of cards to read (default: 25)
+            
+        Returns:
+            List of Job objects
+        """
+        jobs = []
+        for i, card in enumerate(run_query_plan(driver, JOB_RESULT_QUERIES, container=JOB_RESULTS_CARD, limit=max_jobs)):
+            job_url = canonical_job_url(card["linkedin_url"], card["job_urn"])
+            if not job_url:
+                print(f"Could not find job URL for job {i+1}")
+                continue
+            job = Job(
+                linkedin_url=job_url,
+                job_title=(card["job_title"] or "").strip() or "Unknown Title",
+                company=(card["company"] or "").strip() or company_name or "Unknown Company",
+                location=(card["location"] or "").strip() or "Unknown Location",
+                driver=driver,
+                scrape=False,
+                close_on_complete=False
+            )
+            jobs.append(job)
+            print(f"Found job {i+1}: {job.job_title} at {job.company} ({job.location})")
+        return jobs
+
+    @staticmethod
+    def get_company_jobs(driver, job_title="security engineer", company_name=None, max_jobs=25, fast=True):
         """
         Search for jobs with specific title and optionally filter by company on LinkedIn
         
@@ -104,18 +251,28 @@ class Job(Scraper):
             job_title: Job title to search for (default: "security engineer")
             company_name: Name of the company to filter by (optional)
             max_jobs: Maximum number of jobs to retrieve (default: 25)
+            fast: Read all cards in one call with extract_result_cards instead of
+                clicking through them one by one (default: True)
             
         Returns:
             List of Job objects
         """
         jobs = []
         
+        def pause(seconds):
+            # The slow path keeps its fixed pauses; the fast one waits at most
+            # that long, only until the page has gone quiet
+            if fast:
+                readiness.wait_until_settled(driver, seconds)
+            else:
+                time.sleep(seconds)
+        
         try:
             print(f"Searching for '{job_title}' jobs" + (f" at {company_name}" if company_name else "") + "...")
             
             # Navigate to LinkedIn jobs page first
             driver.get("https://www.linkedin.com/jobs/")
-            time.sleep(3)
+            pause(3)
             
             # Find and fill the search box with job title
             try:
@@ -135,7 +292,7 @@ class Job(Scraper):
                 search_url = f"https://www.linkedin.com/jobs/search/?keywords={encoded_title}&location=Worldwide"
                 driver.get(search_url)
             
-            time.sleep(5)
+            pause(5)
             
             # If company name is provided, apply company filter
             if company_name:
@@ -147,7 +304,7 @@ class Job(Scraper):
                         EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'All filters') or contains(text(), 'Show all filters')]"))
                     )
                     all_filters_button.click()
-                    time.sleep(2)
+                    pause(2)
                     
                     # Find and click on Company input field
                     company_input = WebDriverWait(driver, 10).until(
@@ -155,7 +312,7 @@ class Job(Scraper):
                     )
                     company_input.clear()
                     company_input.send_keys(company_name)
-                    time.sleep(2)
+                    pause(2)
                     
                     # Select the company from dropdown
                     try:
@@ -163,7 +320,7 @@ class Job(Scraper):
                             EC.element_to_be_clickable((By.XPATH, f"//div[contains(@class, 'basic-typeahead__triggered-content')]//span[contains(text(), '{company_name}')]"))
                         )
                         company_option.click()
-                        time.sleep(1)
+                        pause(1)
                     except Exception:
                         # Try alternative selector
                         try:
@@ -171,7 +328,7 @@ class Job(Scraper):
                                 EC.element_to_be_clickable((By.XPATH, f"//li[contains(@class, 'typeahead-result')]//span[contains(text(), '{company_name}')]"))
                             )
                             company_option.click()
-                            time.sleep(1)
+                            pause(1)
                         except Exception:
                             print(f"Could not select company {company_name} from dropdown")
                     
@@ -181,7 +338,7 @@ class Job(Scraper):
                             EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Show results') or contains(text(), 'Apply')]"))
                         )
                         apply_button.click()
-                        time.sleep(3)
+                        pause(3)
                     except Exception:
                         print("Could not find apply button, continuing...")
                         
@@ -204,26 +361,33 @@ class Job(Scraper):
                 return jobs
             
             # Scroll to load more jobs
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            jobs_collected = 0
-            
-            while jobs_collected < max_jobs:
-                # Scroll down
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                
-                # Check if new content loaded
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
+            if fast:
+                # Each scroll waits only as long as the next batch of cards takes
+                scrolling.scroll_until(driver, JOB_RESULTS_CARD, target=max_jobs, timeout=30, max_delay=2)
+            else:
+                last_height = runtime.call(driver, "height")
+                jobs_collected = 0
                 
-                # Get current job count
-                job_cards = driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list-item")
-                jobs_collected = len(job_cards)
+                while jobs_collected < max_jobs:
+                    # Scroll down
+                    runtime.call(driver, "scrollTo", 1)
+                    time.sleep(2)
+                    
+                    # Check if new content loaded, and get the current job count, in one round-trip
+                    new_height, jobs_collected = runtime.call_chain(driver, ("height",), ("count", ".jobs-search-results__list-item"))
+                    if new_height == last_height:
+                        break
+                    last_height = new_height
+            
+            if fast:
+                jobs = Job.extract_result_cards(driver, company_name, max_jobs)
+                if not jobs:
+                    print("No job cards found")
+                print(f"Successfully found {len(jobs)} jobs for '{job_title}'" + (f" at {company_name}" if company_name else ""))
+                return jobs
             
             # Extract job information using the correct LinkedIn selector
-            job_cards = driver.find_elements(By.CSS_SELECTOR, ".jobs-search__results-list li")
+            job_cards = driver.find_elements(By.CSS_SELECTOR, JOB_RESULTS_CARD)
             
             if not job_cards:
                 print("No job cards found")
@@ -235,17 +399,20 @@ class Job(Scraper):
                 try:
                     # Try to click on job card to load details
                     try:
-                        driver.execute_script("arguments[0].scrollIntoView(true);", card)
+                        runtime.call(driver, "scrollIntoView", card)
                         time.sleep(0.5)
                         card.click()
                         time.sleep(1)
                     except Exception:
                         pass  # Continue even if click fails
                     
+                    # Probe every selector of the cascades below at once, so misses fail fast
+                    find = runtime.probed_finder(driver, card, JOB_CARD_SELECTORS)
+                    
                     # Extract job URL from the base card link
                     job_url = None
                     try:
-                        job_link = card.find_element(By.CSS_SELECTOR, "a.base-card__full-link")
+                        job_link = find("a.base-card__full-link")
                         job_url = job_link.get_attribute("href")
                     except NoSuchElementException:
                         # Try alternative selectors
@@ -257,7 +424,7 @@ class Job(Scraper):
                         
                         for url_selector in url_selectors:
                             try:
-                                job_link = card.find_element(By.CSS_SELECTOR, url_selector)
+                                job_link = find(url_selector)
                                 job_url = job_link.get_attribute("href")
                                 if job_url and '/jobs/view/' in job_url:
                                     break
@@ -280,15 +447,15 @@ class Job(Scraper):
                     # Job Title - LinkedIn uses h3 with specific classes
                     job.job_title = "Unknown Title"
                     try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, "h3.base-search-card__title a span[title]")
+                        title_elem = find("h3.base-search-card__title a span[title]")
                         job.job_title = title_elem.get_attribute("title").strip()
                     except NoSuchElementException:
                         try:
-                            title_elem = card.find_element(By.CSS_SELECTOR, "h3.base-search-card__title a")
+                            title_elem = find("h3.base-search-card__title a")
                             job.job_title = title_elem.text.strip()
                         except NoSuchElementException:
                             try:
-                                title_elem = card.find_element(By.CSS_SELECTOR, "h3 a span")
+                                title_elem = find("h3 a span")
                                 job.job_title = title_elem.text.strip()
                             except NoSuchElementException:
                                 pass
@@ -296,13 +463,13 @@ class Job(Scraper):
                     # Company Name - LinkedIn uses h4 with specific classes
                     job.company = company_name if company_name else "Unknown Company"
                     try:
-                        company_elem = card.find_element(By.CSS_SELECTOR, "h4.base-search-card__subtitle a")
+                        company_elem = find("h4.base-search-card__subtitle a")
                         company_text = company_elem.text.strip()
                         if company_text:
                             job.company = company_text
                     except NoSuchElementException:
                         try:
-                            company_elem = card.find_element(By.CSS_SELECTOR, "h4 a")
+                            company_elem = find("h4 a")
                             company_text = company_elem.text.strip()
                             if company_text:
                                 job.company = company_text
@@ -312,14 +479,14 @@ class Job(Scraper):
                     # Location - LinkedIn uses specific metadata classes
                     job.location = "Unknown Location"
                     try:
-                        location_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
+                        location_elem = find(".job-search-card__location")
                         location_text = location_elem.text.strip()
                         if location_text:
                             job.location = location_text
                     except NoSuchElementException:
                         try:
                             # Try alternative location selector
-                            location_elem = card.find_element(By.CSS_SELECTOR, ".base-search-card__metadata span")
+                            location_elem = find(".base-search-card__metadata span")
                             location_text = location_elem.text.strip()
                             if location_text:
                                 job.location = location_text
@@ -341,7 +508,8 @@ class Job(Scraper):
         return jobs
     
     @staticmethod
-    def scrape_company_jobs_detailed(driver, job_title="security engineer", company_name=None, max_jobs=25):
+    def scrape_company_jobs_detailed(driver, job_title="security engineer", company_name=None, max_jobs=25,
+                                     tabs=DETAIL_TABS, loads_per_second=DETAIL_LOADS_PER_SECOND):
         """
         Get detailed information for jobs with specific title and optionally filter by company
         
@@ -350,25 +518,44 @@ class Job(Scraper):
             job_title: Job title to search for (default: "security engineer")
             company_name: Name of the company to filter by (optional)
             max_jobs: Maximum number of jobs to retrieve and scrape in detail
+            tabs: Job pages loading at once, each in its own tab (default: DETAIL_TABS)
+            loads_per_second: Rate limit on job page loads (default: DETAIL_LOADS_PER_SECOND)
             
         Returns:
             List of fully scraped Job objects with detailed information
         """
         # First get basic job list
         jobs = Job.get_company_jobs(driver, job_title, company_name, max_jobs)
-        
-        # Then scrape each job in detail
-        detailed_jobs = []
-        for i, job in enumerate(jobs):
-            try:
-                print(f"Scraping detailed info for job {i+1}/{len(jobs)}: {job.job_title}")
-                job.scrape_logged_in(close_on_complete=False)
-                detailed_jobs.append(job)
-                time.sleep(2)  # Be respectful to LinkedIn's servers
-            except Exception as e:
-                print(f"Error scraping detailed info for job {i+1}: {e}")
-                # Still add the job with basic info
-                detailed_jobs.append(job)
-                continue
-        
-        return detailed_jobs
+        return Job.scrape_details(driver, jobs, tabs=tabs, limiter=RateLimiter(loads_per_second))
+
+    @staticmethod
+    def scrape_details(driver, jobs, tabs=DETAIL_TABS, limiter=None):
+        """
+        Scrape the job pages of ``jobs`` in place, with ``tabs`` pages loading ahead.
+
+        Pages load concurrently in tabs of the same browser (see Scraper.iter_tabs)
+        and are read one at a time. A job whose page fails keeps its basic info.
+
+        Args:
+            driver: Selenium WebDriver instance (must be logged in)
+            jobs: Job objects with a linkedin_url, e.g. from get_company_jobs
+            tabs: Job pages loading at once
+            limiter: readiness.RateLimiter shared by the page loads (optional)
+
+        Returns:
+            The same jobs, in input order
+        """
+        by_url = {}
+        for job in jobs:
+            if job.linkedin_url:
+                by_url.setdefault(job.linkedin_url, []).append(job)
+        for i, url in enumerate(Scraper(driver=driver).iter_tabs(by_url, tabs=tabs, limiter=limiter)):
+            for job in by_url[url]:
+                try:
+                    print(f"Scraping detailed info for job {i+1}/{len(by_url)}: {job.job_title}")
+                    job.driver = driver
+                    job.scrape_logged_in(close_on_complete=False)
+                except Exception as e:
+                    print(f"Error scraping detailed info for job {i+1}: {e}")
+                    # Still keep the job with basic info
+        return list(jobs)
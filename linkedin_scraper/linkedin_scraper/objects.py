@@ -1,16 +1,53 @@
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import wraps
 from time import sleep
+from typing import Any, Tuple
 
 from selenium.webdriver import Chrome
 
 from . import constants as c
+from . import readiness
+from . import runtime
+from . import scrolling
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# "normal" waits for every image, ad and tracker; "eager" returns once the DOM is
+# parsed and "none" right away. Scrapers wait for the container they need instead.
+PAGE_LOAD_STRATEGY = "eager"
+# Starts a navigation without waiting for it, unlike driver.get
+_LOAD_URL_JS = "window.location.href = arguments[0];"
+
+
+def create_driver(page_load_strategy=None):
+    """
+    Chrome driver for scrapers that were not given one.
+
+    Uses the chromedriver at $CHROMEDRIVER or in the package's drivers/
+    directory when there is one, else lets Selenium find it.
+
+    Args:
+        page_load_strategy (str): "normal", "eager" or "none" (default: PAGE_LOAD_STRATEGY)
+    """
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = page_load_strategy or PAGE_LOAD_STRATEGY
+    driver_path = os.getenv("CHROMEDRIVER") or os.path.join(os.path.dirname(__file__), "drivers/chromedriver")
+    try:
+        driver = webdriver.Chrome(service=Service(driver_path), options=options)
+    except Exception:
+        driver = webdriver.Chrome(options=options)
+    emulate_focus(driver)
+    return driver
+
+
 @dataclass
 class Contact:
     name: str = None
@@ -70,6 +107,7 @@ class Post:
     media_type: str = None  # text, image, video, document, etc.
     author_name: str = None
     author_url: str = None
+    urn: str = None  # data-urn of the post; dates it exactly (see timestamps.py)
 
 
 @dataclass
@@ -84,6 +122,158 @@ class Comment:
     post_content_preview: str = None  # First 100 chars of the original post
     commenter_name: str = None
     commenter_url: str = None
+    urn: str = None  # data-id of the comment; dates it exactly (see timestamps.py)
+
+
+@dataclass
+class Query:
+    """
+    One named lookup in a query plan.
+
+    ``selector`` may be a single CSS selector, a list of fallbacks tried in
+    order, or None for the scoped element itself. The first selector that
+    yields a non-empty value wins. ``attribute`` is "text" or an attribute
+    name, or a tuple of them tried in order on the matched element. With
+    ``chain`` (a SelectorChain) the fallbacks come from the chain's current
+    ordering and the winner is recorded back into it. With ``ancestor`` (a
+    CSS selector) the lookup is scoped to the outermost ancestor of the
+    element that matches it, and finds nothing if there is none.
+    """
+    name: str
+    selector: Any = None
+    attribute: Any = "text"
+    contains: Tuple[str, ...] = ()
+    many: bool = False
+    default: Any = None
+    chain: Any = None
+    ancestor: str = None
+
+    def steps(self):
+        if self.chain is not None:
+            return self.chain.ordered()
+        if self.selector is None or isinstance(self.selector, str):
+            return [self.selector]
+        return list(self.selector)
+
+    def to_dict(self):
+        attributes = [self.attribute] if isinstance(self.attribute, str) else list(self.attribute)
+        return {
+            "name": self.name,
+            "steps": self.steps(),
+            "attributes": attributes,
+            "contains": list(self.contains),
+            "many": self.many,
+            "ancestor": self.ancestor,
+        }
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """
+    Zero the driver's implicit wait for the duration of the block.
+
+    Optional lookups that miss then fail in milliseconds instead of sitting
+    out the implicit wait. Nested blocks are free; the previous value is
+    restored when the outermost block exits.
+    """
+    if getattr(driver, "_implicit_wait_suspended", False):
+        yield
+        return
+    try:
+        previous = driver.timeouts.implicit_wait
+    except Exception:
+        previous = 0
+    driver._implicit_wait_suspended = True
+    try:
+        if previous:
+            driver.implicitly_wait(0)
+        yield
+    finally:
+        driver._implicit_wait_suspended = False
+        if previous:
+            driver.implicitly_wait(previous)
+
+
+def _finish_rows(queries, plan, rows):
+    """Apply query defaults to raw runtime rows and record SelectorChain winners"""
+    finished = []
+    for row in rows:
+        for query, step in zip(queries, plan):
+            if query.chain is not None:
+                query.chain.record_winner(step["steps"], row["index"][query.name])
+        finished.append({
+            query.name: query.default if row["values"][query.name] is None else row["values"][query.name]
+            for query in queries
+        })
+    return finished
+
+
+def run_query_plan(driver, queries, container=None, base=None, limit=None):
+    """
+    Run several lookups in a single browser round-trip.
+
+    Args:
+        driver: Selenium WebDriver
+        queries (list): Query objects
+        container: Optional CSS selector, list of fallback selectors or
+            SelectorChain for a repeated element; the queries then run
+            once per container, scoped to it
+        base: Element to search under (default: the whole document)
+        limit (int): Maximum number of containers to read
+
+    Returns:
+        dict of name -> value without a container, else a list of such dicts
+    """
+    plan = [query.to_dict() for query in queries]
+    if container is None:
+        containers = None
+    elif isinstance(container, str):
+        containers = [container]
+    else:
+        containers = list(container)
+    result = runtime.call(driver, "extract", plan, containers, base, limit)
+
+    if containers is not None and hasattr(container, "record_winner"):
+        container.record_winner(containers, result["containerIndex"])
+    rows = _finish_rows(queries, plan, result["rows"])
+    if containers is None:
+        return rows[0]
+    return rows
+
+
+def emulate_focus(driver):
+    """
+    Make the page behave as if its window had focus, for the rest of the session.
+
+    LinkedIn only renders some lazy content in a focused window. The DevTools
+    focus emulation keeps the browser in that state across navigations, so it
+    is switched on once per driver rather than faked before every read.
+
+    Returns:
+        bool: False if the driver has no DevTools access (not Chromium, or remote)
+    """
+    if getattr(driver, "_focus_emulated", False):
+        return True
+    try:
+        _enable_focus_emulation(driver)
+    except (AttributeError, WebDriverException):
+        return False
+    driver._focus_emulated = True
+    return True
+
+
+def _enable_focus_emulation(driver):
+    # DevTools commands go to the current tab; each new tab needs its own
+    driver.execute_cdp_cmd("Emulation.setFocusEmulationEnabled", {"enabled": True})
+
+
+def without_implicit_wait(method):
+    """Decorator running a Scraper method inside no_implicit_wait"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with no_implicit_wait(self.driver):
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 @dataclass
@@ -91,22 +281,59 @@ class Scraper:
     driver: Chrome = None
     WAIT_FOR_ELEMENT_TIMEOUT = 5
     TOP_CARD = "pv-top-card"
+    # A readiness.Deadline that every wait and scroll loop below is clipped to
+    deadline = None
 
     @staticmethod
     def wait(duration):
         sleep(int(duration))
 
+    def time_left(self, timeout):
+        """``timeout`` clipped to what is left of ``self.deadline``"""
+        return timeout if self.deadline is None else self.deadline.clip(timeout)
+
+    def out_of_time(self):
+        return self.deadline is not None and self.deadline.expired()
+
+    def wait_until_settled(self, timeout, quiet_ms=readiness.QUIET_MS):
+        """Wait at most ``timeout`` seconds for the page to go quiet (see readiness.wait_until_settled)"""
+        return readiness.wait_until_settled(self.driver, self.time_left(timeout), quiet_ms)
+
     def focus(self):
+        """Give the page focus; free once focus emulation is on (see emulate_focus)"""
+        if emulate_focus(self.driver):
+            return
         self.driver.execute_script('alert("Focus window")')
         self.driver.switch_to.alert.accept()
 
+    def expand_all(self, xpath, base=None, timeout=1, quiet_ms=readiness.QUIET_MS, before=()):
+        """
+        Click every "see more"-style expander matching ``xpath`` at once, then
+        wait a single time for the DOM to go quiet.
+
+        Args:
+            xpath (str): XPath of the expanders, relative to ``base`` if given
+            base: Element to search under (default: the whole document)
+            timeout (float): Seconds to wait at most for the expanded content
+            quiet_ms (int): How long the DOM must stay unchanged
+            before (tuple): Runtime calls, e.g. scrolls that render the expanders,
+                chained into the same round-trip ahead of the clicks
+
+        Returns:
+            int: Number of expanders clicked
+        """
+        *_, expanded = self.call_chain(*before, ("expand", xpath, base))
+        if expanded:
+            readiness.wait_for_dom_quiet(self.driver, self.time_left(timeout), quiet_ms)
+        return expanded
+
     def mouse_click(self, elem):
         action = webdriver.ActionChains(self.driver)
         action.move_to_element(elem).perform()
 
     def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+        return WebDriverWait(base, self.time_left(self.WAIT_FOR_ELEMENT_TIMEOUT)).until(
             EC.presence_of_element_located(
                 (
                     by,
@@ -115,9 +342,113 @@ class Scraper:
             )
         )
 
+    def navigate(self, url, wait_for="main", by=By.TAG_NAME):
+        """
+        Load ``url`` and wait only for the element the caller needs.
+
+        Under an eager or none page-load strategy driver.get returns before the
+        page has finished loading, so ``wait_for`` is what makes it usable. A
+        page already loading in a tab of open_tabs is switched to instead.
+
+        Returns:
+            The ``wait_for`` element, or None if ``wait_for`` is None
+        """
+        handle = self.tabs.pop(url, None) if self.tabs else None
+        if handle is None:
+            self.driver.get(url)
+        else:
+            self.driver.switch_to.window(handle)
+        if wait_for is None:
+            return None
+        return self.wait_for_element_to_load(by=by, name=wait_for)
+
+    @property
+    def tabs(self):
+        """url -> window handle of the pages open_tabs is loading, until navigate takes them"""
+        state = getattr(self.driver, "_scraper_tabs", None)
+        return None if state is None else state["urls"]
+
+    def open_tabs(self, urls, current=None, limiter=None):
+        """
+        Start loading ``urls`` in new tabs of the same browser, all at once.
+
+        navigate() to one of these urls then switches to its tab instead of
+        loading the page again, so the pages load concurrently and are read
+        one after another. The tabs belong to the driver, so any scraper
+        sharing it navigates into them. close_tabs() closes them.
+
+        Args:
+            urls (list): Pages about to be navigated to
+            current (str): URL of the page open now, so that navigating back to
+                it returns to this tab instead of reloading it
+            limiter (readiness.RateLimiter): Spaces out the page loads
+        """
+        self.close_tabs()
+        home = self.driver.current_window_handle
+        self.driver._scraper_tabs = {"home": home, "urls": {} if current is None else {current: home}, "opened": []}
+        for url in urls:
+            self._open_tab(url, limiter)
+        self.driver.switch_to.window(home)
+
+    def _open_tab(self, url, limiter=None):
+        driver = self.driver
+        driver.switch_to.new_window("tab")
+        if getattr(driver, "_focus_emulated", False):
+            _enable_focus_emulation(driver)
+        if limiter is not None:
+            limiter.wait()
+        driver.execute_script(_LOAD_URL_JS, url)
+        handle = driver.current_window_handle
+        driver._scraper_tabs["urls"][url] = handle
+        driver._scraper_tabs["opened"].append(handle)
+
+    def _close_tab(self, handle):
+        self.driver._scraper_tabs["opened"].remove(handle)
+        self.driver.switch_to.window(handle)
+        self.driver.close()
+
+    def close_tabs(self):
+        """Close the tabs of open_tabs and switch back to the tab it was called from"""
+        state = getattr(self.driver, "_scraper_tabs", None)
+        if state is None:
+            return
+        for handle in list(state["opened"]):
+            self._close_tab(handle)
+        self.driver.switch_to.window(state["home"])
+        self.driver._scraper_tabs = None
+
+    def iter_tabs(self, urls, tabs=4, limiter=None):
+        """
+        Yield ``urls`` in order while their pages load ``tabs`` at a time ahead of use.
+
+        When a url is yielded its page is loading or loaded in a tab of its own,
+        and navigate() to it switches there. Once the caller moves on that tab is
+        closed and the next url starts loading in a new one, so ``tabs`` pages
+        are always in flight.
+
+        Args:
+            urls (list): Pages to visit
+            tabs (int): Pages loading at once
+            limiter (readiness.RateLimiter): Spaces out the page loads
+        """
+        urls = list(urls)
+        self.open_tabs(urls[:tabs], limiter=limiter)
+        state = self.driver._scraper_tabs
+        try:
+            for i, url in enumerate(urls):
+                handle = state["urls"].get(url)
+                yield url
+                if handle in state["opened"]:
+                    self._close_tab(handle)
+                if i + tabs < len(urls):
+                    self._open_tab(urls[i + tabs], limiter)
+                self.driver.switch_to.window(state["home"])
+        finally:
+            self.close_tabs()
+
     def wait_for_all_elements_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+        return WebDriverWait(base, self.time_left(self.WAIT_FOR_ELEMENT_TIMEOUT)).until(
             EC.presence_of_all_elements_located(
                 (
                     by,
@@ -144,20 +475,39 @@ class Scraper:
             pass
         return False
 
+    def call(self, name, *args):
+        """Call a primitive of the in-page runtime (see runtime.py)"""
+        return runtime.call(self.driver, name, *args)
+
+    def call_chain(self, *calls):
+        """Call several runtime primitives, given as ``(name, *args)`` tuples, in one round-trip"""
+        return runtime.call_chain(self.driver, *calls)
+
+    def probe(self, selectors, base=None):
+        """The subset of ``selectors`` present under ``base``, tested in one round-trip"""
+        return runtime.probe(self.driver, selectors, base)
+
+    def probed_finder(self, base, selectors):
+        """CSS find_element for ``base`` that fails fast on selectors the probe did not find"""
+        return runtime.probed_finder(self.driver, base, selectors)
+
+    def no_implicit_wait(self):
+        """Context manager zeroing the implicit wait around optional lookups"""
+        return no_implicit_wait(self.driver)
+
     def scroll_to_half(self):
-        self.driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
+        return self.call("scrollTo", 0.5)
 
     def scroll_to_bottom(self):
-        self.driver.execute_script(
-            "window.scrollTo(0, document.body.scrollHeight);"
-        )
+        return self.call("scrollTo", 1)
+
+    def scroll_until(self, item, target=None, stop=None, timeout=60, max_scrolls=None, max_delay=3, scroll_class_name=None):
+        """Scroll an infinite list until ``target`` items, ``stop(count)`` or the end (see scrolling.scroll_until)"""
+        return scrolling.scroll_until(self.driver, item, target=target, stop=stop, timeout=self.time_left(timeout), max_scrolls=max_scrolls,
+                                      max_delay=max_delay, scroll_class_name=scroll_class_name)
 
     def scroll_class_name_element_to_page_percent(self, class_name:str, page_percent:float):
-        self.driver.execute_script(
-            f'elem = document.getElementsByClassName("{class_name}")[0]; elem.scrollTo(0, elem.scrollHeight*{str(page_percent)});'
-        )
+        return self.call("scrollElement", class_name, page_percent)
 
     def __find_element_by_class_name__(self, class_name):
         try:
@@ -188,3 +538,43 @@ class Scraper:
         for elem in args:
             if elem:
                 return elem[0]
+
+    def run_query_plan(self, queries, container=None, base=None, limit=None):
+        """Run several lookups in a single browser round-trip (see the module-level run_query_plan)"""
+        return run_query_plan(self.driver, queries, container, base, limit)
+
+    def observe(self, key, container, item):
+        """
+        Start (or re-attach) an in-page collector for ``item`` elements under ``container``.
+
+        Matching elements already present, and every one inserted later, are
+        buffered once in the page under ``key`` until drained.
+
+        Args:
+            key (str): Name of the buffer
+            container (str): CSS selector of the list element to watch
+            item (str): CSS selector of the elements to collect
+
+        Returns:
+            int: Elements waiting in the buffer, -1 if the container is missing
+        """
+        return self.call("observe", key, container, item)
+
+    def drain(self, key, queries, limit=None, ready=None):
+        """
+        Read and forget the elements buffered by ``observe`` with a query plan.
+
+        Args:
+            key (str): Name of the buffer
+            queries (list): Query objects, run once per buffered element
+            limit (int): Maximum number of elements to read
+            ready (str): CSS selector an element must contain to be read;
+                elements without it, e.g. placeholders that are still
+                rendering, stay buffered for the next drain
+
+        Returns:
+            list: One dict of name -> value per element, in insertion order
+        """
+        plan = [query.to_dict() for query in queries]
+        result = self.call("drain", key, plan, limit, ready)
+        return _finish_rows(queries, plan, result["rows"])
@@ -0,0 +1,56 @@
+"""
+Offline extraction from saved HTML.
+
+Re-runs the Person, Company and Job parsers over archived pages without a
+browser. Parsing is pure CPU work, so many pages can be handled in parallel
+with a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from .person import Person
+from .company import Company
+from .jobs import Job
+
+SCRAPERS = {
+    "person": Person,
+    "company": Company,
+    "job": Job,
+}
+
+
+def extract(kind, source, linkedin_url=None):
+    """
+    Extract one object from saved HTML.
+
+    Args:
+        kind (str): One of ``SCRAPERS`` ("person", "company" or "job")
+        source: Saved page(s) as accepted by the class's ``from_html``
+        linkedin_url (str): Optional URL to record on the object
+
+    Returns:
+        Person, Company or Job
+    """
+    try:
+        scraper = SCRAPERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {sorted(SCRAPERS)}")
+    return scraper.from_html(source, linkedin_url=linkedin_url)
+
+
+def extract_many(kind, sources, processes=None):
+    """
+    Extract objects from many saved pages in a process pool.
+
+    Args:
+        kind (str): One of ``SCRAPERS``
+        sources (list): Saved page(s) per object, as accepted by ``extract``
+        processes (int): Worker count; defaults to the CPU count. 1 runs in-process
+
+    Returns:
+        list: Extracted objects, in the same order as ``sources``
+    """
+    sources = list(sources)
+    if processes == 1 or len(sources) <= 1:
+        return [extract(kind, source) for source in sources]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(extract, [kind] * len(sources), sources))
@@ -1,14 +1,22 @@
 import requests
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact, Post, Comment
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from .readiness import Deadline
+from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact, Post, Comment, Query, without_implicit_wait, create_driver
+from .snapshot import take_snapshot, parse_html, load_pages, canonical_url, children, select_all, select_one, node_text, node_attr
 import os
 from datetime import datetime, timedelta
 import re
-from linkedin_scraper import selectors
+from linkedin_scraper import selectors, timestamps
+from linkedin_scraper.selectors import selector_chain, save_selector_stats
+
+
+# Optional sections found per layout fingerprint (see Person.probe_sections)
+_layout_sections = {}
+
+CONNECTIONS_URL = "https://www.linkedin.com/mynetwork/invite-connect/connections/"
 
 
 class Person(Scraper):
@@ -33,6 +41,9 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
+        budget_seconds=None,
+        page_load_strategy=None,
+        parallel_tabs=False,
     ):
         self.linkedin_url = linkedin_url
         self.name = name
@@ -45,27 +56,21 @@ class Person(Scraper):
         self.contacts = contacts or []
         self.posts = []
         self.comments = []
+        # Sections of scrape() skipped or cut short by its time budget
+        self.partial_sections = []
 
-        if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(
-                        os.path.dirname(__file__), "drivers/chromedriver"
-                    )
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
-
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+        if driver is None and (get or scrape):
+            driver = create_driver(page_load_strategy)
 
         if get:
             driver.get(linkedin_url)
 
         self.driver = driver
+        self.location = None
+        self.open_to_work = False
 
         if scrape:
-            self.scrape(close_on_complete)
+            self.scrape(close_on_complete, budget_seconds=budget_seconds, parallel_tabs=parallel_tabs)
 
     def add_about(self, about):
         self.about.append(about)
@@ -94,11 +99,115 @@ class Person(Scraper):
     def add_comment(self, comment):
         self.comments.append(comment)
 
-    def scrape(self, close_on_complete=True):
-        if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete)
-        else:
-            print("you are not logged in!")
+    def scrape(self, close_on_complete=True, budget_seconds=None, parallel_tabs=False):
+        """
+        Scrape the profile.
+
+        Args:
+            close_on_complete (bool): Quit the driver when done
+            budget_seconds (float): Time budget for the whole scrape. Every wait
+                and scroll loop is clipped to it; sections it does not leave time
+                for are skipped and listed in ``partial_sections``
+            parallel_tabs (bool): Load the experience, education and connections
+                pages in tabs of their own while the profile is read, instead
+                of one after another
+        """
+        self.deadline = Deadline(budget_seconds)
+        try:
+            if self.is_signed_in():
+                self.scrape_logged_in(close_on_complete=close_on_complete, parallel_tabs=parallel_tabs)
+            else:
+                print("you are not logged in!")
+        finally:
+            self.deadline = None
+
+    def _scrape_section(self, name, scrape_section):
+        """
+        Run one section of scrape_logged_in within the deadline.
+
+        The section is skipped if no time is left, and flagged as partial if it
+        timed out or ran past the deadline with its waits cut short.
+        """
+        if self.out_of_time():
+            self.partial_sections.append(name)
+            return
+        try:
+            scrape_section()
+        except TimeoutException:
+            if self.deadline is None or self.deadline.at is None:
+                raise
+            self.partial_sections.append(name)
+            return
+        if self.out_of_time():
+            self.partial_sections.append(name)
+
+    def section_urls(self):
+        """Pages scrape_logged_in visits after the profile, in visiting order"""
+        return [
+            os.path.join(self.linkedin_url, "details/experience"),
+            os.path.join(self.linkedin_url, "details/education"),
+            CONNECTIONS_URL,
+        ]
+
+    def activity_urls(self):
+        """Activity pages read by get_posts, get_comments and get_reactions, for open_tabs"""
+        return [self._activity_url(kind) for kind in ("all", "comments", "reactions")]
+
+    def _activity_url(self, kind):
+        return f"{self.linkedin_url.rstrip('/')}/recent-activity/{kind}/"
+
+    def probe_sections(self):
+        """
+        Names of the optional selectors.PROFILE_SECTIONS the loaded profile page has.
+
+        The layout markers present fingerprint the layout, and the sections
+        are looked up once per layout and cached. Each call costs one probe
+        round-trip; a layout not seen before may cost a second one.
+        """
+        layouts = list(selectors.PROFILE_LAYOUTS.items())
+        sections = list(selectors.PROFILE_SECTIONS.items())
+        # Until some layout is cached, probe the sections along with the markers
+        probed = layouts if _layout_sections else layouts + sections
+        present = self.probe([selector for _, selector in probed])
+        fingerprint = frozenset(name for name, selector in layouts if selector in present)
+        if fingerprint not in _layout_sections:
+            if probed is layouts:
+                present |= self.probe([selector for _, selector in sections])
+            _layout_sections[fingerprint] = frozenset(name for name, selector in sections if selector in present)
+        return _layout_sections[fingerprint]
+
+    @classmethod
+    def from_html(cls, source, linkedin_url=None):
+        """
+        Build a Person from saved pages, without a browser.
+        
+        Args:
+            source: A directory or dict of pages named ``profile``, ``experience``,
+                ``education`` and ``activity`` (any may be missing), or a single
+                profile page as a path, str or bytes
+            linkedin_url (str): Profile URL; defaults to the profile page's canonical URL
+            
+        Returns:
+            Person: Filled from whichever pages were given
+        """
+        pages = load_pages(source, default="profile")
+        if linkedin_url is None:
+            ordered = sorted(pages, key=lambda name: name != "profile")
+            linkedin_url = next(filter(None, (canonical_url(pages[name]) for name in ordered)), None)
+        person = cls(linkedin_url=linkedin_url, get=False, scrape=False)
+        
+        if "profile" in pages:
+            person._parse_top_card(pages["profile"])
+        if "experience" in pages:
+            person._parse_experiences(pages["experience"])
+        if "education" in pages:
+            person._parse_educations(pages["education"])
+        if "activity" in pages:
+            for post_node in select_all(pages["activity"], selectors.POST) or select_all(pages["activity"], selectors.POST_FALLBACK):
+                post_data = person._parse_post_data(post_node)
+                if post_data:
+                    person.add_post(Post(**post_data))
+        return person
 
     def _click_see_more_by_class_name(self, class_name):
         try:
@@ -116,27 +225,28 @@ class Person(Scraper):
         except:
             return False
 
-    def get_experiences(self):
-        url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
+    def get_experiences(self, snapshot=True):
+        """
+        Scrape the experience details page.
+        
+        Args:
+            snapshot (bool): Parse one snapshot of ``main`` locally instead of
+                walking each position over WebDriver (default True)
+        """
+        main = self.navigate(self.section_urls()[0], "main", By.TAG_NAME)
         self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
         
-        # Try to click "Show more" buttons to expand descriptions
-        try:
-            show_more_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Show more') or contains(text(), 'Show more') or contains(@aria-label, 'see more') or contains(text(), 'see more')]")
-            for button in show_more_buttons:
-                try:
-                    self.driver.execute_script("arguments[0].click();", button)
-                    self.wait(1)  # Wait a bit for content to load
-                except:
-                    continue
-        except:
-            pass
+        # Scroll, then click every "Show more" button to expand descriptions, in one round-trip
+        self.expand_all(selectors.SHOW_MORE_BUTTONS, before=(("scrollTo", 0.5), ("scrollTo", 1)))
             
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        if snapshot:
+            self._parse_experiences(parse_html(take_snapshot(self.driver, main)))
+        else:
+            self._walk_experiences(main_list)
+
+    def _walk_experiences(self, main_list):
+        """Element-by-element WebDriver walk of the experience list"""
         for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
             position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
             
@@ -270,14 +380,25 @@ class Person(Scraper):
                 )
                 self.add_experience(experience)
 
-    def get_educations(self):
-        url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
+    def get_educations(self, snapshot=True):
+        """
+        Scrape the education details page.
+        
+        Args:
+            snapshot (bool): Parse one snapshot of ``main`` locally instead of
+                walking each entry over WebDriver (default True)
+        """
+        main = self.navigate(self.section_urls()[1], "main", By.TAG_NAME)
         self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
+        self.call_chain(("scrollTo", 0.5), ("scrollTo", 1))
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        if snapshot:
+            self._parse_educations(parse_html(take_snapshot(self.driver, main)))
+        else:
+            self._walk_educations(main_list)
+
+    def _walk_educations(self, main_list):
+        """Element-by-element WebDriver walk of the education list"""
         for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
             try:
                 position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
@@ -343,6 +464,216 @@ class Person(Scraper):
                 # Skip this education entry if elements are missing
                 continue
 
+    def _split_work_times(self, work_times):
+        """Split 'Jan 2020 - Present · 4 yrs' into (from_date, to_date, duration)"""
+        if work_times:
+            parts = work_times.split("·")
+            times = parts[0].strip() if parts else ""
+            duration = parts[1].strip() if len(parts) > 1 else None
+        else:
+            times = ""
+            duration = None
+        
+        from_date = " ".join(times.split(" ")[:2]) if times else ""
+        to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+        return from_date, to_date, duration
+
+    def _parse_experiences(self, root):
+        """
+        Parse the experience details page from a snapshot.
+        
+        Mirrors the element walk in get_experiences, but on an lxml tree, so a
+        whole page costs one round-trip (or none, for saved pages).
+        
+        Args:
+            root: lxml element containing the page's ``pvs-list__container``
+        """
+        main_list = select_one(root, ".pvs-list__container")
+        if main_list is None:
+            return
+        for position in select_all(main_list, ".pvs-list__paged-list-item"):
+            position = select_one(position, "div[data-view-name='profile-component-entity']")
+            if position is None:
+                continue
+            
+            elements = children(position)
+            if len(elements) < 2:
+                continue
+            company_logo_elem, position_details = elements[0], elements[1]
+            
+            # company elem
+            company_links = children(company_logo_elem)
+            company_linkedin_url = node_attr(company_links[0], "href") if company_links else None
+            if not company_linkedin_url:
+                continue
+            
+            # position details
+            position_details_list = children(position_details)
+            position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+            position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+            
+            if position_summary_details is None or not children(position_summary_details):
+                continue
+            
+            outer_positions = children(children(position_summary_details)[0])
+            
+            def span_text(elem):
+                return node_text(select_one(elem, "span"))
+            
+            if len(outer_positions) == 4:
+                position_title = span_text(outer_positions[0])
+                company = span_text(outer_positions[1])
+                work_times = span_text(outer_positions[2])
+                location = span_text(outer_positions[3])
+            elif len(outer_positions) == 3:
+                if "·" in node_text(outer_positions[2]):
+                    position_title = span_text(outer_positions[0])
+                    company = span_text(outer_positions[1])
+                    work_times = span_text(outer_positions[2])
+                    location = ""
+                else:
+                    position_title = ""
+                    company = span_text(outer_positions[0])
+                    work_times = span_text(outer_positions[1])
+                    location = span_text(outer_positions[2])
+            else:
+                position_title = ""
+                company = span_text(outer_positions[0]) if outer_positions else ""
+                work_times = span_text(outer_positions[1]) if len(outer_positions) > 1 else ""
+                location = ""
+            
+            from_date, to_date, duration = self._split_work_times(work_times)
+            
+            inner_positions = []
+            if position_summary_text is not None and any(element.get("class") == "pvs-list__container" for element in children(position_summary_text)):
+                try:
+                    inner_list = children(children(children(select_one(position_summary_text, ".pvs-list__container"))[0])[0])[0]
+                    inner_positions = select_all(inner_list, ".pvs-list__paged-list-item")
+                except IndexError:
+                    inner_positions = []
+            
+            if len(inner_positions) > 1:
+                for desc_element in inner_positions:
+                    try:
+                        res = children(select_one(desc_element, "a"))
+                        position_title_elem = res[0] if len(res) > 0 else None
+                        work_times_elem = res[1] if len(res) > 1 else None
+                        location_elem = res[2] if len(res) > 2 else None
+                        
+                        location = node_text(children(location_elem)[0]) if location_elem is not None else None
+                        position_title = node_text(select_all(children(position_title_elem)[0], "*")[0]) if position_title_elem is not None else ""
+                        work_times = node_text(children(work_times_elem)[0]) if work_times_elem is not None else ""
+                        from_date, to_date, duration = self._split_work_times(work_times)
+                        
+                        self.add_experience(Experience(
+                            position_title=position_title,
+                            from_date=from_date,
+                            to_date=to_date,
+                            duration=duration,
+                            location=location,
+                            description=node_text(desc_element),
+                            institution_name=company,
+                            linkedin_url=company_linkedin_url
+                        ))
+                    except (TypeError, IndexError):
+                        # Skip this description if elements are missing
+                        continue
+            else:
+                self.add_experience(Experience(
+                    position_title=position_title,
+                    from_date=from_date,
+                    to_date=to_date,
+                    duration=duration,
+                    location=location,
+                    description=node_text(position_summary_text) if position_summary_text is not None else "",
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url
+                ))
+
+    def _parse_educations(self, root):
+        """
+        Parse the education details page from a snapshot.
+        
+        Args:
+            root: lxml element containing the page's ``pvs-list__container``
+        """
+        main_list = select_one(root, ".pvs-list__container")
+        if main_list is None:
+            return
+        for position in select_all(main_list, ".pvs-list__paged-list-item"):
+            try:
+                position = select_one(position, "div[data-view-name='profile-component-entity']")
+                if position is None:
+                    continue
+                
+                elements = children(position)
+                if len(elements) < 2:
+                    continue
+                institution_logo_elem, position_details = elements[0], elements[1]
+                
+                # institution elem
+                institution_links = children(institution_logo_elem)
+                institution_linkedin_url = node_attr(institution_links[0], "href") if institution_links else None
+                
+                # position details
+                position_details_list = children(position_details)
+                position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+                position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+                
+                if position_summary_details is None:
+                    continue
+                
+                outer_positions = children(children(position_summary_details)[0])
+                
+                institution_name = node_text(select_one(outer_positions[0], "span")) if outer_positions else ""
+                degree = node_text(select_one(outer_positions[1], "span")) if len(outer_positions) > 1 else None
+                
+                from_date = None
+                to_date = None
+                if len(outer_positions) > 2:
+                    times = node_text(select_one(outer_positions[2], "span"))
+                    if times and "-" in times:
+                        split_times = times.split(" ")
+                        dash_index = split_times.index("-") if "-" in split_times else -1
+                        
+                        if dash_index > 0:
+                            from_date = split_times[dash_index-1]
+                        if dash_index < len(split_times) - 1:
+                            to_date = split_times[-1]
+                
+                self.add_education(Education(
+                    from_date=from_date,
+                    to_date=to_date,
+                    description=node_text(position_summary_text) if position_summary_text is not None else "",
+                    degree=degree,
+                    institution_name=institution_name,
+                    linkedin_url=institution_linkedin_url
+                ))
+            except IndexError:
+                # Skip this education entry if elements are missing
+                continue
+
+    def _parse_top_card(self, root):
+        """
+        Parse name, location, about and open-to-work status from a profile page snapshot.
+        
+        Args:
+            root: lxml element for the profile page
+        """
+        top_panel = root.xpath("//*[@class='mt2 relative']")
+        if top_panel:
+            self.name = node_text(select_one(top_panel[0], "h1")) or None
+        location = root.xpath("//*[@class='text-body-small inline t-black--light break-words']")
+        if location:
+            self.location = node_text(location[0])
+        
+        about = root.xpath("//*[@id='about']")
+        about_text = node_text(select_one(about[0].getparent(), ".display-flex")) if about else ""
+        self.about = about_text or None
+        
+        picture = select_one(root, ".pv-top-card-profile-picture img")
+        self.open_to_work = picture is not None and "#OPEN_TO_WORK" in (picture.get("title") or "")
+
     def get_name_and_location(self):
         top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
         self.name = top_panel.find_element(By.TAG_NAME, "h1").text
@@ -355,40 +686,54 @@ class Person(Scraper):
             about=None
         self.about = about
 
-    def get_posts(self, hours_limit=24):
-        """Scrape posts from the last specified hours (default 24 hours)"""
+    def get_posts(self, hours_limit=24, snapshot=True):
+        """
+        Scrape posts from the last specified hours (default 24 hours)
+
+        Args:
+            hours_limit (int): Number of hours to look back for posts (default: 24)
+            snapshot (bool): Pull the activity feed's HTML in one call and parse it
+                locally instead of querying every field through the driver (default: True)
+        """
         # Navigate to the person's activity page
-        activity_url = os.path.join(self.linkedin_url, "recent-activity/all/")
-        self.driver.get(activity_url)
+        activity_url = self._activity_url("all")
+        self.navigate(activity_url, "main", By.TAG_NAME)
         self.focus()
         
         # Wait for the page to load
-        self.wait(3)
-        
-        # Scroll to load more posts
-        self.scroll_to_half()
-        self.scroll_to_bottom()
+        self.wait_until_settled(timeout=3)
         
         # Calculate the cutoff time
         cutoff_time = datetime.now() - timedelta(hours=hours_limit)
         
+        # Scroll until the oldest loaded post falls outside the time window
+        self._scroll_posts_past(cutoff_time)
+        
         try:
             # Find all post containers
             posts_container = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
             
-            # Look for posts in the activity feed
-            post_elements = posts_container.find_elements(By.CSS_SELECTOR, "[data-urn*='urn:li:activity']")
-            
-            if not post_elements:
-                # Try alternative selector for posts
-                post_elements = posts_container.find_elements(By.CSS_SELECTOR, ".feed-shared-update-v2")
+            if snapshot:
+                # One round-trip for the whole feed, then parse locally
+                root = parse_html(take_snapshot(self.driver, posts_container))
+                post_elements = select_all(root, selectors.POST) or select_all(root, selectors.POST_FALLBACK)
+                extract_post_data = self._parse_post_data
+            else:
+                # Look for posts in the activity feed
+                post_elements = posts_container.find_elements(By.CSS_SELECTOR, selectors.POST)
+                
+                if not post_elements:
+                    # Try alternative selector for posts
+                    post_elements = posts_container.find_elements(By.CSS_SELECTOR, selectors.POST_FALLBACK)
+                extract_post_data = self._extract_post_data
             
             for post_element in post_elements:
                 try:
                     # Extract post data
-                    post_data = self._extract_post_data(post_element)
+                    post_data = extract_post_data(post_element)
                     
-                    if post_data and self._is_within_time_limit(post_data['posted_date'], cutoff_time):
+                    if post_data and self._is_within_time_limit(post_data['posted_date'], cutoff_time,
+                                                                (post_data['urn'], post_data['post_url'])):
                         post = Post(
                             content=post_data['content'],
                             posted_date=post_data['posted_date'],
@@ -398,10 +743,11 @@ class Person(Scraper):
                             post_url=post_data['post_url'],
                             media_type=post_data['media_type'],
                             author_name=post_data['author_name'],
-                            author_url=post_data['author_url']
+                            author_url=post_data['author_url'],
+                            urn=post_data['urn']
                         )
                         self.add_post(post)
-                    elif post_data and not self._is_within_time_limit(post_data['posted_date'], cutoff_time):
+                    elif post_data:
                         # If we've reached posts older than our limit, stop processing
                         break
                         
@@ -412,6 +758,29 @@ class Person(Scraper):
         except Exception as e:
             print(f"Error scraping posts: {e}")
             
+    def _scroll_posts_past(self, cutoff_time, timeout=60):
+        """
+        Load posts until the oldest one is older than ``cutoff_time``, or the feed ends.
+
+        Newly loaded posts are buffered in the page as they appear, and only
+        their dates are read after each scroll.
+        """
+        item = f"{selectors.POST}, {selectors.POST_FALLBACK}"
+        date_queries = [
+            Query("posted_date", selectors.POST_DATE, ("datetime", "text"), default=""),
+            Query("urn", None, "data-urn", default=""),
+        ]
+        self.observe("posts", "main", item)
+
+        def window_exhausted(count):
+            rows = self.drain("posts", date_queries)
+            return bool(rows) and not self._is_within_time_limit(rows[-1]["posted_date"], cutoff_time, (rows[-1]["urn"],))
+
+        try:
+            return self.scroll_until(item, stop=window_exhausted, timeout=timeout)
+        finally:
+            self.call("disconnect", "posts")
+
     def _extract_post_data(self, post_element):
         """Extract data from a single post element"""
         try:
@@ -424,19 +793,22 @@ class Person(Scraper):
                 'post_url': '',
                 'media_type': 'text',
                 'author_name': '',
-                'author_url': ''
+                'author_url': '',
+                'urn': ''
             }
             
             # Extract post content
             try:
-                content_element = post_element.find_element(By.CSS_SELECTOR, ".feed-shared-text, .feed-shared-update-v2__description")
+                content_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_CONTENT)
                 post_data['content'] = content_element.text.strip()
             except:
                 pass
             
+            post_data['urn'] = post_element.get_attribute('data-urn') or ''
+            
             # Extract posted date
             try:
-                time_element = post_element.find_element(By.CSS_SELECTOR, "time, .feed-shared-actor__sub-description time")
+                time_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_DATE)
                 post_data['posted_date'] = time_element.get_attribute('datetime') or time_element.text
             except:
                 pass
@@ -444,7 +816,7 @@ class Person(Scraper):
             # Extract engagement metrics
             try:
                 # Likes count
-                likes_element = post_element.find_element(By.CSS_SELECTOR, "[aria-label*='reaction'], .social-counts-reactions__count")
+                likes_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_LIKES)
                 likes_text = likes_element.text or likes_element.get_attribute('aria-label')
                 post_data['likes_count'] = self._extract_number_from_text(likes_text)
             except:
@@ -452,7 +824,7 @@ class Person(Scraper):
                 
             try:
                 # Comments count
-                comments_element = post_element.find_element(By.CSS_SELECTOR, "[aria-label*='comment'], .social-counts-comments")
+                comments_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_COMMENTS)
                 comments_text = comments_element.text or comments_element.get_attribute('aria-label')
                 post_data['comments_count'] = self._extract_number_from_text(comments_text)
             except:
@@ -460,7 +832,7 @@ class Person(Scraper):
                 
             try:
                 # Shares count
-                shares_element = post_element.find_element(By.CSS_SELECTOR, "[aria-label*='repost'], .social-counts-reposts")
+                shares_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_SHARES)
                 shares_text = shares_element.text or shares_element.get_attribute('aria-label')
                 post_data['shares_count'] = self._extract_number_from_text(shares_text)
             except:
@@ -468,24 +840,22 @@ class Person(Scraper):
             
             # Extract post URL
             try:
-                post_link = post_element.find_element(By.CSS_SELECTOR, "a[href*='/posts/'], a[href*='/activity/']")
+                post_link = post_element.find_element(By.CSS_SELECTOR, selectors.POST_URL)
                 post_data['post_url'] = post_link.get_attribute('href')
             except:
                 pass
             
             # Determine media type
-            if post_element.find_elements(By.CSS_SELECTOR, "img, .feed-shared-image"):
-                post_data['media_type'] = 'image'
-            elif post_element.find_elements(By.CSS_SELECTOR, "video, .feed-shared-video"):
-                post_data['media_type'] = 'video'
-            elif post_element.find_elements(By.CSS_SELECTOR, ".feed-shared-document"):
-                post_data['media_type'] = 'document'
+            for media_type, media_selector in selectors.POST_MEDIA_TYPES:
+                if post_element.find_elements(By.CSS_SELECTOR, media_selector):
+                    post_data['media_type'] = media_type
+                    break
             
             # Extract author information
             try:
-                author_element = post_element.find_element(By.CSS_SELECTOR, ".feed-shared-actor__name, .feed-shared-actor__title")
+                author_element = post_element.find_element(By.CSS_SELECTOR, selectors.POST_AUTHOR_NAME)
                 post_data['author_name'] = author_element.text.strip()
-                author_link = post_element.find_element(By.CSS_SELECTOR, ".feed-shared-actor__container-link")
+                author_link = post_element.find_element(By.CSS_SELECTOR, selectors.POST_AUTHOR_LINK)
                 post_data['author_url'] = author_link.get_attribute('href')
             except:
                 post_data['author_name'] = self.name or 'Unknown'
@@ -496,6 +866,72 @@ class Person(Scraper):
         except Exception as e:
             print(f"Error extracting post data: {e}")
             return None
+
+    def _parse_post_data(self, post_node):
+        """
+        Snapshot counterpart of _extract_post_data.
+
+        Args:
+            post_node: lxml element of a single post, parsed from the feed's outerHTML
+
+        Returns:
+            dict: Post data in the same shape as _extract_post_data, or None if parsing fails
+        """
+        try:
+            post_data = {
+                'content': '',
+                'posted_date': '',
+                'likes_count': 0,
+                'comments_count': 0,
+                'shares_count': 0,
+                'post_url': '',
+                'media_type': 'text',
+                'author_name': '',
+                'author_url': '',
+                'urn': ''
+            }
+
+            content_node = select_one(post_node, selectors.POST_CONTENT)
+            if content_node is not None:
+                post_data['content'] = node_text(content_node).strip()
+
+            post_data['urn'] = node_attr(post_node, 'data-urn') or ''
+
+            time_node = select_one(post_node, selectors.POST_DATE)
+            if time_node is not None:
+                post_data['posted_date'] = node_attr(time_node, 'datetime') or node_text(time_node)
+
+            for key, selector in (('likes_count', selectors.POST_LIKES),
+                                  ('comments_count', selectors.POST_COMMENTS),
+                                  ('shares_count', selectors.POST_SHARES)):
+                count_node = select_one(post_node, selector)
+                if count_node is not None:
+                    count_text = node_text(count_node) or node_attr(count_node, 'aria-label')
+                    post_data[key] = self._extract_number_from_text(count_text)
+
+            link_node = select_one(post_node, selectors.POST_URL)
+            if link_node is not None:
+                post_data['post_url'] = node_attr(link_node, 'href')
+
+            for media_type, media_selector in selectors.POST_MEDIA_TYPES:
+                if select_one(post_node, media_selector) is not None:
+                    post_data['media_type'] = media_type
+                    break
+
+            author_node = select_one(post_node, selectors.POST_AUTHOR_NAME)
+            author_link = select_one(post_node, selectors.POST_AUTHOR_LINK)
+            if author_node is not None and author_link is not None:
+                post_data['author_name'] = node_text(author_node).strip()
+                post_data['author_url'] = node_attr(author_link, 'href')
+            else:
+                post_data['author_name'] = self.name or 'Unknown'
+                post_data['author_url'] = self.linkedin_url
+
+            return post_data
+
+        except Exception as e:
+            print(f"Error parsing post data: {e}")
+            return None
     
     def _extract_number_from_text(self, text):
         """Extract number from text like '5 reactions' or '12 comments'"""
@@ -508,145 +944,97 @@ class Person(Scraper):
             return int(numbers[0])
         return 0
     
-    def _is_within_time_limit(self, posted_date, cutoff_time):
-        """Check if the post is within the specified time limit"""
-        if not posted_date:
+    def _is_within_time_limit(self, posted_date, cutoff_time, urns=()):
+        """
+        Check if the post is within the specified time limit.
+
+        The exact time decoded from ``urns`` (data-urn values or URLs) is used
+        when there is one; the displayed ``posted_date`` only as a fallback.
+        """
+        posted_at = timestamps.activity_time(urns, posted_date)
+        if posted_at is None:
             return True  # If we can't determine the date, include it
-        
-        try:
-            # Handle different date formats
-            if 'ago' in posted_date.lower():
-                return self._parse_relative_date(posted_date, cutoff_time)
-            else:
-                # Try to parse absolute date
-                post_time = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
-                return post_time >= cutoff_time
-        except:
-            return True  # If parsing fails, include the post
+        return posted_at >= timestamps.as_utc(cutoff_time)
     
     def _parse_relative_date(self, date_text, cutoff_time):
         """Parse relative dates like '2h ago', '1d ago'"""
-        try:
-            date_text = date_text.lower()
-            now = datetime.now()
-            
-            if 'minute' in date_text or 'm ago' in date_text:
-                minutes = int(re.findall(r'\d+', date_text)[0])
-                post_time = now - timedelta(minutes=minutes)
-            elif 'hour' in date_text or 'h ago' in date_text:
-                hours = int(re.findall(r'\d+', date_text)[0])
-                post_time = now - timedelta(hours=hours)
-            elif 'day' in date_text or 'd ago' in date_text:
-                days = int(re.findall(r'\d+', date_text)[0])
-                post_time = now - timedelta(days=days)
-            elif 'week' in date_text or 'w ago' in date_text:
-                weeks = int(re.findall(r'\d+', date_text)[0])
-                post_time = now - timedelta(weeks=weeks)
-            else:
-                return True  # Unknown format, include it
-            
-            return post_time >= cutoff_time
-        except:
-            return True  # If parsing fails, include the post
+        post_time = timestamps.parse_date_text(date_text)
+        if post_time is None:
+            return True  # Unknown format, include it
+        return post_time >= timestamps.as_utc(cutoff_time)
 
-    def get_comments(self, hours_limit=24, comment_limit=None):
+    @without_implicit_wait
+    def get_comments(self, hours_limit=24, comment_limit=None, batch=True):
         """
         Scrape comments made by this person on posts.
         
         Args:
             hours_limit (int): Number of hours to look back for comments (default: 24)
             comment_limit (int): Maximum number of latest comments to get (overrides hours_limit if set)
+            batch (bool): Extract all comments with a single in-page script instead of
+                one WebDriver call per selector (default: True)
         """
         try:
             # Navigate to the person's activity page
-            activity_url = f"{self.linkedin_url.rstrip('/')}/recent-activity/comments/"
+            activity_url = self._activity_url("comments")
             print(f"🌐 Navigating to: {activity_url}")
-            self.driver.get(activity_url)
-            self.wait(5)  # Increased wait time for page load
+            self.navigate(activity_url, None)
             
-            # Wait for page to be fully loaded
+            # Wait for the feed container, then for the page to settle
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, self.time_left(10)).until(
                     EC.presence_of_element_located((By.TAG_NAME, "main"))
                 )
                 print("✅ Page loaded successfully")
             except:
                 print("⚠️  Page load timeout, continuing anyway")
+            self.wait_until_settled(timeout=5)
             
             # Calculate cutoff time (only used if comment_limit is not set)
             cutoff_time = datetime.now() - timedelta(hours=hours_limit) if not comment_limit else None
             
-            # Scroll to load more comments with improved logic
+            # Scroll to load more comments, stopping early once comment_limit are loaded
             print("📜 Starting to scroll and load comments...")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_attempts = 0
-            max_scrolls = 15  # Increased scroll attempts
-            
-            while scroll_attempts < max_scrolls:
-                # Scroll down
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.wait(3)  # Increased wait time between scrolls
-                
-                # Check if new content loaded
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                scroll_attempts += 1
-                
-                # Check for comments after each scroll
-                try:
-                    current_comments = self.driver.find_elements(By.CSS_SELECTOR, ".comments-comment-entity")
-                    print(f"📊 Scroll {scroll_attempts}: Found {len(current_comments)} comment elements")
-                    
-                    # Break early if we have enough comments and using comment_limit
-                    if comment_limit and len(current_comments) >= comment_limit:
-                        print(f"🎯 Found {len(current_comments)} comments, stopping scroll (limit: {comment_limit})")
-                        break
-                except Exception as e:
-                    print(f"⚠️  Error checking comments during scroll: {e}")
-                
-                # Stop if no new content loaded
-                if new_height == last_height:
-                    print(f"📄 No new content loaded after scroll {scroll_attempts}")
-                    break
-                    
-                last_height = new_height
-            
-            # Use the correct LinkedIn comment selectors based on DOM analysis
-            comment_selectors = [
-                # Actual LinkedIn comment structure (from DOM analysis)
-                ".comments-comment-entity",  # Individual comment containers
-                "article.comments-comment-entity",  # More specific comment articles
-                ".comments-comment-item",  # Alternative comment items
-                "[data-id*='comment']",  # Comments with data-id attributes
-                # Fallback selectors for different LinkedIn layouts
-                ".feed-shared-update-v2 .comments-comment-entity",
-                ".comments-comments-list .comments-comment-entity",
-                ".comments-comment-list__container .comments-comment-entity"
-            ]
-            
-            comment_elements = []
-            for selector in comment_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        print(f"✅ Found {len(elements)} elements with selector: {selector}")
-                        
-                        # Debug: Show sample element info
-                        for i, elem in enumerate(elements[:3]):
-                            try:
-                                classes = elem.get_attribute('class') or 'no-class'
-                                data_urn = elem.get_attribute('data-urn') or 'no-urn'
-                                text_preview = (elem.text or 'no-text')[:100].replace('\n', ' ')
-                                print(f"  Sample [{i+1}]: class='{classes[:50]}...' urn='{data_urn[:30]}...' text='{text_preview}...'")
-                            except Exception as debug_e:
-                                print(f"  Sample [{i+1}]: Error getting info - {debug_e}")
-                        
-                        comment_elements = elements
-                        break
-                    else:
-                        print(f"❌ No elements found with selector: {selector}")
-                except Exception as e:
-                    print(f"⚠️  Error with selector {selector}: {e}")
-                    continue
+            current_comments = self.scroll_until(".comments-comment-entity", target=comment_limit or None, timeout=45, max_scrolls=15, max_delay=3)
+            print(f"📊 Found {current_comments} comment elements after scrolling")
+            
+            comment_elements = None
+            extract_comment_data = self._extract_comment_data
+            if batch:
+                # One query plan round-trip extracts every comment on the page
+                comment_elements = self._extract_comments_batch()
+                extract_comment_data = self._comment_data_from_script
+            
+            if comment_elements is None:
+                comment_elements = []
+                extract_comment_data = self._extract_comment_data
+                container_chain = selector_chain('comment_containers', selectors.COMMENT_CONTAINERS)
+                present = self.probe(container_chain)
+                for selector in container_chain:
+                    try:
+                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector) if selector in present else []
+                        if elements:
+                            container_chain.hit(selector)
+                            print(f"✅ Found {len(elements)} elements with selector: {selector}")
+                            
+                            # Debug: Show sample element info
+                            for i, elem in enumerate(elements[:3]):
+                                try:
+                                    classes = elem.get_attribute('class') or 'no-class'
+                                    data_urn = elem.get_attribute('data-urn') or 'no-urn'
+                                    text_preview = (elem.text or 'no-text')[:100].replace('\n', ' ')
+                                    print(f"  Sample [{i+1}]: class='{classes[:50]}...' urn='{data_urn[:30]}...' text='{text_preview}...'")
+                                except Exception as debug_e:
+                                    print(f"  Sample [{i+1}]: Error getting info - {debug_e}")
+                            
+                            comment_elements = elements
+                            break
+                        else:
+                            container_chain.miss(selector)
+                            print(f"❌ No elements found with selector: {selector}")
+                    except Exception as e:
+                        print(f"⚠️  Error with selector {selector}: {e}")
+                        continue
             
             if not comment_elements:
                 print("🔍 No comment elements found with any selector. Checking page content...")
@@ -685,7 +1073,7 @@ class Person(Scraper):
                     break
                     
                 try:
-                    comment_data = self._extract_comment_data(comment_element)
+                    comment_data = extract_comment_data(comment_element)
                     if comment_data:
                         # If using comment_limit, just take the first N comments
                         if comment_limit:
@@ -699,13 +1087,15 @@ class Person(Scraper):
                                 post_author=comment_data['post_author'],
                                 post_content_preview=comment_data['post_content_preview'],
                                 commenter_name=comment_data['commenter_name'],
-                                commenter_url=comment_data['commenter_url']
+                                commenter_url=comment_data['commenter_url'],
+                                urn=comment_data['urn']
                             )
                             self.add_comment(comment)
                             comments_found += 1
                             print(f"📝 Added comment {comments_found}/{comment_limit}")
                         # If using time-based filtering
-                        elif self._is_within_time_limit(comment_data['commented_date'], cutoff_time):
+                        elif self._is_within_time_limit(comment_data['commented_date'], cutoff_time,
+                                                        (comment_data['urn'], comment_data['comment_url'])):
                             comment = Comment(
                                 content=comment_data['content'],
                                 commented_date=comment_data['commented_date'],
@@ -716,11 +1106,12 @@ class Person(Scraper):
                                 post_author=comment_data['post_author'],
                                 post_content_preview=comment_data['post_content_preview'],
                                 commenter_name=comment_data['commenter_name'],
-                                commenter_url=comment_data['commenter_url']
+                                commenter_url=comment_data['commenter_url'],
+                                urn=comment_data['urn']
                             )
                             self.add_comment(comment)
                             comments_found += 1
-                        elif not self._is_within_time_limit(comment_data['commented_date'], cutoff_time):
+                        else:
                             # If we hit a comment older than our limit, stop processing
                             print(f"⏰ Reached time limit, stopping at {comments_found} comments")
                             break
@@ -735,7 +1126,10 @@ class Person(Scraper):
             
         except Exception as e:
             print(f"Error scraping comments: {e}")
+        finally:
+            save_selector_stats()
     
+    @without_implicit_wait
     def _extract_comment_data(self, comment_element):
         """
         Extract data from a comment element.
@@ -747,112 +1141,73 @@ class Person(Scraper):
             dict: Comment data or None if extraction fails
         """
         try:
+            # One probe up front, so selectors that are not there never reach find_element
+            find = self.probed_finder(comment_element, [
+                *selectors.COMMENT_CONTENT, *selectors.ACTIVITY_DATE, *selectors.COMMENT_LIKES,
+                *selectors.COMMENT_REPLIES, selectors.COMMENT_PERMALINK,
+            ])
+            
             # Extract comment content using comment-specific selectors
-            content = ""
-            
-            # Use the correct comment content selectors based on DOM analysis
-            comment_content_selectors = [
-                # Primary comment content selectors (from DOM analysis)
-                ".comments-comment-item__main-content",  # Main comment text container
-                ".comments-comment-item__main-content .update-components-text",  # Nested text content
-                ".feed-shared-main-content--comment",  # Alternative main content
-                ".comments-comment-entity__content .update-components-text",  # Content within entity
-                ".feed-shared-inline-show-more-text .update-components-text",  # Show more text content
-                # Fallback selectors
-                ".comments-comment-item-content-body",
-                ".comment-item__main-content",
-                ".feed-shared-comment__main-content",
-                ".comments-comment-item .feed-shared-inline-show-more-text",
-                ".activity-item__commentary"
-            ]
-            
-            for selector in comment_content_selectors:
-                try:
-                    content_element = comment_element.find_element(By.CSS_SELECTOR, selector)
-                    content = content_element.text.strip()
-                    if content and self._is_valid_comment_content(content):
-                        print(f"🔍 Found comment content with selector '{selector}': {content[:100]}...")
-                        break
-                except:
-                    continue
+            content_chain = selector_chain('comment_content', selectors.COMMENT_CONTENT)
             
-            # If no content found with comment selectors, try getting text from the element but filter it
-            if not content:
-                try:
-                    full_text = comment_element.text.strip()
-                    if full_text:
-                        # Try to extract just the comment part from the full text
-                        content = self._extract_comment_from_full_text(full_text)
-                        if content and self._is_valid_comment_content(content):
-                            print(f"🔍 Extracted comment from element text: {content[:100]}...")
-                        else:
-                            content = "[Comment content not available]"
-                except:
-                    content = "[Comment content not available]"
+            def content_candidates():
+                for selector in content_chain:
+                    try:
+                        content_element = find(selector)
+                        content = content_element.text.strip()
+                    except:
+                        content_chain.miss(selector)
+                        continue
+                    yield selector, content
+            
+            content = self._pick_comment_content(content_candidates(), lambda: comment_element.text.strip(), content_chain)
             
             # Extract comment date with multiple fallback selectors
             commented_date = ""
-            date_selectors = [
-                "time",
-                ".feed-shared-actor__sub-description time",
-                "[data-test-id='feed-shared-actor__sub-description'] time",
-                ".feed-shared-actor__sub-description",
-                "[aria-label*='ago']"
-            ]
-            
-            for selector in date_selectors:
+            date_chain = selector_chain('comment_date', selectors.ACTIVITY_DATE)
+            for selector in date_chain:
                 try:
-                    date_element = comment_element.find_element(By.CSS_SELECTOR, selector)
+                    date_element = find(selector)
                     commented_date = date_element.get_attribute('datetime') or date_element.text.strip()
                     if commented_date:
+                        date_chain.hit(selector)
                         break
                 except:
-                    continue
+                    pass
+                date_chain.miss(selector)
             
             # Extract likes count with multiple fallback selectors
             likes_count = 0
-            likes_selectors = [
-                ".social-counts-reactions__count",
-                ".feed-shared-social-action-bar__reaction-count",
-                "[aria-label*='reaction']",
-                "[aria-label*='like']",
-                ".social-action-bar__reaction-count",
-                ".feed-shared-social-counts__num-likes"
-            ]
-            
-            for selector in likes_selectors:
+            likes_chain = selector_chain('comment_likes', selectors.COMMENT_LIKES)
+            for selector in likes_chain:
                 try:
-                    likes_element = comment_element.find_element(By.CSS_SELECTOR, selector)
+                    likes_element = find(selector)
                     likes_text = likes_element.text.strip() or likes_element.get_attribute('aria-label') or "0"
                     likes_count = self._extract_number_from_text(likes_text)
+                    likes_chain.hit(selector)
                     break
                 except:
+                    likes_chain.miss(selector)
                     continue
             
             # Extract replies count with multiple fallback selectors
             replies_count = 0
-            replies_selectors = [
-                ".feed-shared-social-action-bar__comment-count",
-                ".social-counts-comments__count",
-                "[aria-label*='comment']",
-                "[aria-label*='repl']",
-                ".social-action-bar__comment-count",
-                ".feed-shared-social-counts__num-comments"
-            ]
-            
-            for selector in replies_selectors:
+            replies_chain = selector_chain('comment_replies', selectors.COMMENT_REPLIES)
+            for selector in replies_chain:
                 try:
-                    replies_element = comment_element.find_element(By.CSS_SELECTOR, selector)
+                    replies_element = find(selector)
                     replies_text = replies_element.text.strip() or replies_element.get_attribute('aria-label') or "0"
                     replies_count = self._extract_number_from_text(replies_text)
+                    replies_chain.hit(selector)
                     break
                 except:
+                    replies_chain.miss(selector)
                     continue
             
             # Extract comment URL
             comment_url = ""
             try:
-                permalink_element = comment_element.find_element(By.CSS_SELECTOR, "a[href*='/feed/update/']")
+                permalink_element = find(selectors.COMMENT_PERMALINK)
                 comment_url = permalink_element.get_attribute('href') if permalink_element else ""
             except:
                 pass
@@ -864,18 +1219,18 @@ class Person(Scraper):
             
             try:
                 # Find the original post container
-                post_container = comment_element.find_element(By.XPATH, "./ancestor::*[contains(@class, 'feed-shared-update-v2')]")
+                post_container = comment_element.find_element(By.XPATH, f"./ancestor::*[contains(@class, '{selectors.COMMENT_POST_CONTAINER_CLASS}')]")
                 
                 # Extract post URL
-                post_link = post_container.find_element(By.CSS_SELECTOR, "a[href*='/posts/'], a[href*='/feed/update/']")
+                post_link = post_container.find_element(By.CSS_SELECTOR, selectors.COMMENT_POST_URL)
                 post_url = post_link.get_attribute('href') if post_link else ""
                 
                 # Extract post author
-                author_element = post_container.find_element(By.CSS_SELECTOR, ".feed-shared-actor__name, .feed-shared-actor__title")
+                author_element = post_container.find_element(By.CSS_SELECTOR, selectors.COMMENT_POST_AUTHOR)
                 post_author = author_element.text.strip() if author_element else ""
                 
                 # Extract post content preview (first 100 chars)
-                post_content_element = post_container.find_element(By.CSS_SELECTOR, ".feed-shared-text, .attributed-text-segment-list__content")
+                post_content_element = post_container.find_element(By.CSS_SELECTOR, selectors.COMMENT_POST_CONTENT)
                 full_content = post_content_element.text.strip() if post_content_element else ""
                 post_content_preview = full_content[:100] + "..." if len(full_content) > 100 else full_content
                 
@@ -896,7 +1251,135 @@ class Person(Scraper):
                 'post_author': post_author,
                 'post_content_preview': post_content_preview,
                 'commenter_name': commenter_name,
-                'commenter_url': commenter_url
+                'commenter_url': commenter_url,
+                'urn': comment_element.get_attribute('data-id') or comment_element.get_attribute('data-urn') or ''
+            }
+            
+        except Exception as e:
+            print(f"Error extracting comment data: {e}")
+            return None
+
+    def _pick_comment_content(self, candidates, get_full_text, chain):
+        """
+        Choose the comment text from the content selector cascade.
+        
+        Args:
+            candidates: Iterable of (selector, text) pairs for the content selectors that matched, in order
+            get_full_text: Callable returning the whole comment element's text, used as a last resort
+            chain (SelectorChain): Chain the candidates came from, updated with the outcome
+            
+        Returns:
+            str: Comment content, or a placeholder if none could be found
+        """
+        content = ""
+        for selector, content in candidates:
+            if content and self._is_valid_comment_content(content):
+                chain.hit(selector)
+                print(f"🔍 Found comment content with selector '{selector}': {content[:100]}...")
+                break
+            chain.miss(selector)
+        
+        # If no content found with comment selectors, try getting text from the element but filter it
+        if not content:
+            try:
+                full_text = get_full_text()
+                if full_text:
+                    # Try to extract just the comment part from the full text
+                    content = self._extract_comment_from_full_text(full_text)
+                    if content and self._is_valid_comment_content(content):
+                        print(f"🔍 Extracted comment from element text: {content[:100]}...")
+                    else:
+                        content = "[Comment content not available]"
+            except:
+                content = "[Comment content not available]"
+        return content
+
+    def _extract_comments_batch(self):
+        """
+        Extract every comment on the page with a single query plan round-trip.
+        
+        The plan runs the same selector cascades as _extract_comment_data, with
+        each content selector as a query of its own so that every candidate can
+        still be judged by _pick_comment_content. _comment_data_from_script turns
+        the rows into comment data.
+        
+        Returns:
+            list: One row of raw values per comment, or None if the plan could not run
+        """
+        content_order = selector_chain('comment_content', selectors.COMMENT_CONTENT).ordered()
+        post = f"[class*='{selectors.COMMENT_POST_CONTAINER_CLASS}']"
+        queries = [Query(f"content_{i}", selector) for i, selector in enumerate(content_order)] + [
+            Query("full_text", None, default=""),
+            Query("date", attribute=("datetime", "text"), default="", chain=selector_chain('comment_date', selectors.ACTIVITY_DATE)),
+            Query("likes", attribute=("text", "aria-label"), chain=selector_chain('comment_likes', selectors.COMMENT_LIKES)),
+            Query("replies", attribute=("text", "aria-label"), chain=selector_chain('comment_replies', selectors.COMMENT_REPLIES)),
+            Query("comment_url", selectors.COMMENT_PERMALINK, "href", default=""),
+            Query("urn", None, ("data-id", "data-urn"), default=""),
+            # The post the comment was left on, read from its outermost post container
+            Query("post_url", selectors.COMMENT_POST_URL, "href", default="", ancestor=post),
+            Query("post_author", selectors.COMMENT_POST_AUTHOR, default="", ancestor=post),
+            Query("post_content", selectors.COMMENT_POST_CONTENT, default="", ancestor=post),
+        ]
+        try:
+            rows = self.run_query_plan(queries, container=selector_chain('comment_containers', selectors.COMMENT_CONTAINERS))
+        except Exception as e:
+            print(f"⚠️  Batch comment extraction failed, falling back to per-element extraction: {e}")
+            return None
+        
+        if rows:
+            print(f"✅ Found {len(rows)} comment elements in one round-trip")
+        for row in rows:
+            row['content'] = [(content_order[i], row.pop(f"content_{i}")) for i in range(len(content_order))]
+        return rows
+
+    def _comment_data_from_script(self, raw):
+        """
+        Build comment data from one row returned by _extract_comments_batch.
+        
+        Args:
+            raw (dict): Values read in the page for a single comment
+            
+        Returns:
+            dict: Comment data in the same shape as _extract_comment_data
+        """
+        try:
+            content_chain = selector_chain('comment_content', selectors.COMMENT_CONTENT)
+            
+            def content_candidates():
+                for selector, text in raw['content']:
+                    if text is None:
+                        content_chain.miss(selector)
+                        continue
+                    yield selector, text.strip()
+            
+            content = self._pick_comment_content(content_candidates(), lambda: raw['full_text'].strip(), content_chain)
+            
+            likes_count = 0
+            if raw['likes'] is not None:
+                likes_count = self._extract_number_from_text(raw['likes'].strip())
+            
+            replies_count = 0
+            if raw['replies'] is not None:
+                replies_count = self._extract_number_from_text(raw['replies'].strip())
+            
+            # Like the WebDriver path, the author needs the post link and the content the author
+            post_url = raw['post_url']
+            post_author = raw['post_author'].strip() if post_url else ""
+            post_content = raw['post_content'].strip() if post_author else ""
+            post_content_preview = post_content[:100] + "..." if len(post_content) > 100 else post_content
+            
+            return {
+                'content': content,
+                'commented_date': raw['date'].strip(),
+                'likes_count': likes_count,
+                'replies_count': replies_count,
+                'comment_url': raw['comment_url'],
+                'post_url': post_url,
+                'post_author': post_author,
+                'post_content_preview': post_content_preview,
+                'commenter_name': self.name or "",
+                'commenter_url': self.linkedin_url or "",
+                'urn': raw['urn']
             }
             
         except Exception as e:
@@ -983,64 +1466,47 @@ class Person(Scraper):
                 
         return ""
 
-    def get_reactions(self, reaction_limit=5):
+    @without_implicit_wait
+    def get_reactions(self, reaction_limit=5, batch=True):
         """
         Scrape posts that this person reacted to.
         
         Args:
             reaction_limit (int): Maximum number of latest reactions to get (default: 5)
+            batch (bool): Read all reactions with one query plan instead of
+                per-element WebDriver lookups (default True)
         """
         try:
             # Navigate to the person's reactions activity page
-            reactions_url = f"{self.linkedin_url.rstrip('/')}/recent-activity/reactions/"
+            reactions_url = self._activity_url("reactions")
             print(f"🔍 Navigating to reactions page: {reactions_url}")
-            self.driver.get(reactions_url)
-            self.wait(3)
-            
-            # Scroll to load more reactions
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_attempts = 0
-            max_scrolls = 5
-            
-            while scroll_attempts < max_scrolls:
-                # Scroll down
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.wait(2)
-                
-                # Check if new content loaded
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                    
-                last_height = new_height
-                scroll_attempts += 1
-                
-                # Check if we have enough reactions and break early
-                current_reactions = self.driver.find_elements(By.CSS_SELECTOR, ".feed-shared-update-v2, .activity-item, [data-urn*='activity']")
-                if len(current_reactions) >= reaction_limit:
-                    break
+            self.navigate(reactions_url, "main", By.TAG_NAME)
+            self.wait_until_settled(timeout=3)
             
-            # Try multiple selectors for reaction items
-            reaction_selectors = [
-                ".feed-shared-update-v2",
-                ".activity-item", 
-                "[data-urn*='activity']",
-                ".feed-shared-mini-update-v2",
-                "article[data-urn]",
-                ".feed-shared-activity"
-            ]
+            # Scroll to load more reactions, stopping early once reaction_limit are loaded
+            self.scroll_until(".feed-shared-update-v2, .activity-item, [data-urn*='activity']", target=reaction_limit, timeout=10, max_scrolls=5, max_delay=2)
             
+            # Try multiple selectors for reaction items
+            reaction_chain = selector_chain('reaction_containers', selectors.REACTION_CONTAINERS)
             reaction_elements = []
-            for selector in reaction_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        print(f"✅ Found {len(elements)} reaction elements with selector: {selector}")
-                        reaction_elements = elements
-                        break
-                except Exception as e:
-                    print(f"⚠️  Selector '{selector}' failed: {e}")
-                    continue
+            if batch:
+                reaction_elements = self.run_query_plan(self._reaction_queries(), container=reaction_chain, limit=reaction_limit)
+                extract_reaction = self._reaction_data_from_values
+            else:
+                extract_reaction = self._extract_reaction_data
+                present = self.probe(reaction_chain)
+                for selector in reaction_chain:
+                    try:
+                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector) if selector in present else []
+                        if elements:
+                            reaction_chain.hit(selector)
+                            print(f"✅ Found {len(elements)} reaction elements with selector: {selector}")
+                            reaction_elements = elements
+                            break
+                        reaction_chain.miss(selector)
+                    except Exception as e:
+                        print(f"⚠️  Selector '{selector}' failed: {e}")
+                        continue
             
             if not reaction_elements:
                 print("❌ No reaction elements found with any selector")
@@ -1055,7 +1521,7 @@ class Person(Scraper):
                 if processed_count >= reaction_limit:
                     break
                     
-                reaction_data = self._extract_reaction_data(element)
+                reaction_data = extract_reaction(element)
                 if reaction_data:
                     reactions.append(reaction_data)
                     processed_count += 1
@@ -1067,7 +1533,10 @@ class Person(Scraper):
         except Exception as e:
             print(f"❌ Error scraping reactions: {e}")
             return []
+        finally:
+            save_selector_stats()
 
+    @without_implicit_wait
     def _extract_reaction_data(self, reaction_element):
         """
         Extract data from a reaction element.
@@ -1079,24 +1548,25 @@ class Person(Scraper):
             dict: Reaction data or None if extraction fails
         """
         try:
+            # One probe up front, so selectors that are not there never reach find_element
+            find = self.probed_finder(reaction_element, [
+                *selectors.REACTION_CONTENT, *selectors.ACTIVITY_DATE, *selectors.REACTION_AUTHOR,
+                *selectors.REACTION_POST_URL,
+            ])
+            
             # Extract post content/preview
             post_preview = ""
-            content_selectors = [
-                ".feed-shared-inline-show-more-text",
-                ".feed-shared-text",
-                ".feed-shared-update-v2__description",
-                ".feed-shared-actor__description",
-                ".activity-item__description"
-            ]
-            
-            for selector in content_selectors:
+            content_chain = selector_chain('reaction_content', selectors.REACTION_CONTENT)
+            for selector in content_chain:
                 try:
-                    content_element = reaction_element.find_element(By.CSS_SELECTOR, selector)
+                    content_element = find(selector)
                     post_preview = content_element.text.strip()
                     if post_preview:
+                        content_chain.hit(selector)
                         break
                 except:
-                    continue
+                    pass
+                content_chain.miss(selector)
             
             # If no content found with selectors, try getting text from the element
             if not post_preview:
@@ -1114,79 +1584,51 @@ class Person(Scraper):
             
             # Extract reaction date
             reacted_date = ""
-            date_selectors = [
-                "time",
-                ".feed-shared-actor__sub-description time",
-                "[data-test-id='feed-shared-actor__sub-description'] time",
-                ".feed-shared-actor__sub-description",
-                "[aria-label*='ago']"
-            ]
-            
-            for selector in date_selectors:
+            date_chain = selector_chain('reaction_date', selectors.ACTIVITY_DATE)
+            for selector in date_chain:
                 try:
-                    date_element = reaction_element.find_element(By.CSS_SELECTOR, selector)
+                    date_element = find(selector)
                     reacted_date = date_element.get_attribute('datetime') or date_element.text.strip()
                     if reacted_date:
+                        date_chain.hit(selector)
                         break
                 except:
-                    continue
+                    pass
+                date_chain.miss(selector)
             
             # Extract post author
             post_author = ""
-            author_selectors = [
-                ".feed-shared-actor__name",
-                ".feed-shared-actor__title",
-                "[data-test-id='feed-shared-actor__name']",
-                ".feed-shared-update-v2__actor-name"
-            ]
-            
-            for selector in author_selectors:
+            author_chain = selector_chain('reaction_author', selectors.REACTION_AUTHOR)
+            for selector in author_chain:
                 try:
-                    author_element = reaction_element.find_element(By.CSS_SELECTOR, selector)
+                    author_element = find(selector)
                     post_author = author_element.text.strip()
                     if post_author:
+                        author_chain.hit(selector)
                         break
                 except:
-                    continue
+                    pass
+                author_chain.miss(selector)
             
             # Extract post URL
             post_url = ""
-            url_selectors = [
-                "a[href*='/posts/']",
-                "a[href*='/feed/update/']",
-                ".feed-shared-control-menu__trigger"
-            ]
-            
-            for selector in url_selectors:
+            url_chain = selector_chain('reaction_post_url', selectors.REACTION_POST_URL)
+            for selector in url_chain:
                 try:
-                    url_element = reaction_element.find_element(By.CSS_SELECTOR, selector)
+                    url_element = find(selector)
                     post_url = url_element.get_attribute('href')
                     if post_url and ('/posts/' in post_url or '/feed/update/' in post_url):
+                        url_chain.hit(selector)
                         break
                 except:
-                    continue
+                    pass
+                url_chain.miss(selector)
             
             # Extract reaction type (like, love, etc.)
             reaction_type = "like"  # Default to like
             try:
-                reaction_elements = reaction_element.find_elements(By.CSS_SELECTOR, "[aria-label*='reaction'], .reaction-icon, [data-test-id*='reaction']")
-                for elem in reaction_elements:
-                    aria_label = elem.get_attribute('aria-label') or ""
-                    if 'love' in aria_label.lower():
-                        reaction_type = "love"
-                        break
-                    elif 'celebrate' in aria_label.lower():
-                        reaction_type = "celebrate"
-                        break
-                    elif 'support' in aria_label.lower():
-                        reaction_type = "support"
-                        break
-                    elif 'insightful' in aria_label.lower():
-                        reaction_type = "insightful"
-                        break
-                    elif 'funny' in aria_label.lower():
-                        reaction_type = "funny"
-                        break
+                reaction_elements = reaction_element.find_elements(By.CSS_SELECTOR, selectors.REACTION_TYPE)
+                reaction_type = self._reaction_type(elem.get_attribute('aria-label') for elem in reaction_elements)
             except:
                 pass
             
@@ -1204,11 +1646,62 @@ class Person(Scraper):
             print(f"⚠️  Error extracting reaction data: {e}")
             return None
 
-    def scrape_logged_in(self, close_on_complete=True):
+    def _reaction_type(self, aria_labels):
+        """Reaction type named by the first matching aria-label, "like" if none is"""
+        for aria_label in aria_labels:
+            aria_label = (aria_label or "").lower()
+            for reaction_type in ("love", "celebrate", "support", "insightful", "funny"):
+                if reaction_type in aria_label:
+                    return reaction_type
+        return "like"
+
+    def _reaction_queries(self):
+        """Query plan reading one reaction container, same cascades as _extract_reaction_data"""
+        return [
+            Query("post_preview", chain=selector_chain('reaction_content', selectors.REACTION_CONTENT), default=""),
+            Query("element_text", None, default=""),
+            Query("reacted_date", attribute=("datetime", "text"), chain=selector_chain('reaction_date', selectors.ACTIVITY_DATE), default=""),
+            Query("post_author", chain=selector_chain('reaction_author', selectors.REACTION_AUTHOR), default=""),
+            Query("post_url", attribute="href", contains=("/posts/", "/feed/update/"), chain=selector_chain('reaction_post_url', selectors.REACTION_POST_URL), default=""),
+            Query("aria_labels", selectors.REACTION_TYPE, attribute="aria-label", many=True, default=[]),
+        ]
+
+    def _reaction_data_from_values(self, values):
+        """
+        Build reaction data from one row of the reaction query plan.
+        
+        Args:
+            values (dict): Values returned by run_query_plan for _reaction_queries
+            
+        Returns:
+            dict: Reaction data, in the same shape as _extract_reaction_data
+        """
+        post_preview = values['post_preview'].strip()
+        
+        # If no content found with selectors, take the first meaningful line of the element
+        if not post_preview:
+            post_preview = values['element_text'].strip()
+            for line in post_preview.split('\n'):
+                line = line.strip()
+                if line and len(line) > 10 and not line.endswith('ago'):
+                    post_preview = line
+                    break
+        
+        return {
+            'post_preview': post_preview[:200] if post_preview else "[Content not available]",
+            'post_author': values['post_author'].strip(),
+            'post_url': values['post_url'],
+            'reacted_date': values['reacted_date'].strip(),
+            'reaction_type': self._reaction_type(values['aria_labels']),
+            'reactor_name': self.name or "",
+            'reactor_url': self.linkedin_url
+        }
+
+    def scrape_logged_in(self, close_on_complete=True, parallel_tabs=False):
         driver = self.driver
         duration = None
 
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+        root = WebDriverWait(driver, self.time_left(self.__WAIT_FOR_ELEMENT_TIMEOUT)).until(
             EC.presence_of_element_located(
                 (
                     By.TAG_NAME,
@@ -1217,7 +1710,12 @@ class Person(Scraper):
             )
         )
         self.focus()
-        self.wait(5)
+        self.wait_until_settled(timeout=5)
+        # Which optional sections this layout has, so absent ones cost no waits
+        sections = self.probe_sections()
+        if parallel_tabs:
+            # The other pages load in their own tabs while this one is read
+            self.open_tabs(self.section_urls(), current=self.linkedin_url)
 
         # get name and location
         self.get_name_and_location()
@@ -1226,25 +1724,39 @@ class Person(Scraper):
 
         # get about
         self.get_about()
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
-        )
+        self.call_chain(("scrollTo", 0.5), ("scrollTo", 1 / 1.5))
+
+        try:
+            # get experience
+            self._scrape_section("experiences", self.get_experiences)
+
+            # get education
+            self._scrape_section("educations", self.get_educations)
 
-        # get experience
-        self.get_experiences()
+            if sections and not self.out_of_time():
+                self.navigate(self.linkedin_url, None)
 
-        # get education
-        self.get_educations()
+            # get interest
+            if "interests" in sections:
+                self._scrape_section("interests", self.get_interests)
 
-        driver.get(self.linkedin_url)
+            # get accomplishment
+            if "accomplishments" in sections:
+                self._scrape_section("accomplishments", self.get_accomplishments)
 
-        # get interest
+            # get connections
+            self._scrape_section("connections", self.get_connections)
+        finally:
+            self.close_tabs()
+
+        if close_on_complete:
+            driver.quit()
+
+    def get_interests(self):
+        driver = self.driver
         try:
 
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+            _ = WebDriverWait(driver, self.time_left(self.__WAIT_FOR_ELEMENT_TIMEOUT)).until(
                 EC.presence_of_element_located(
                     (
                         By.XPATH,
@@ -1265,9 +1777,10 @@ class Person(Scraper):
         except:
             pass
 
-        # get accomplishment
+    def get_accomplishments(self):
+        driver = self.driver
         try:
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+            _ = WebDriverWait(driver, self.time_left(self.__WAIT_FOR_ELEMENT_TIMEOUT)).until(
                 EC.presence_of_element_located(
                     (
                         By.XPATH,
@@ -1290,12 +1803,10 @@ class Person(Scraper):
         except:
             pass
 
-        # get connections
+    def get_connections(self):
+        driver = self.driver
         try:
-            driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
-            )
+            self.navigate(CONNECTIONS_URL, "mn-connections", By.CLASS_NAME)
             connections = driver.find_element(By.CLASS_NAME, "mn-connections")
             if connections is not None:
                 for conn in connections.find_elements(By.CLASS_NAME, "mn-connection-card"):
@@ -1309,9 +1820,6 @@ class Person(Scraper):
         except:
             connections = None
 
-        if close_on_complete:
-            driver.quit()
-
     @property
     def company(self):
         if self.experiences:
@@ -0,0 +1,128 @@
+"""
+Pipelined scraping: the browser loads while Python parses.
+
+A scrape normally navigates, waits, extracts and only then navigates again,
+so the browser is idle while Python works and the other way round. Here the
+browser only loads pages and takes snapshots of them. The snapshots go
+through a bounded queue to a few parser threads that build the objects
+offline (see offline.py), while the browser is already loading the next
+page. lxml releases the GIL while it parses, so the threads really do
+overlap with the browser.
+
+Optionally the next pages also load ahead in tabs of their own (see
+Scraper.iter_tabs), so the browser has a page ready whenever it is done
+taking a snapshot.
+"""
+
+import os
+import queue
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from . import selectors
+from .objects import Scraper
+from .offline import extract
+from .snapshot import take_snapshot
+
+# The pages each kind is built from, as (page name for from_html, path under
+# the object's URL, (by, value) of the element to wait for)
+PAGES = {
+    "person": [
+        ("profile", "", (By.TAG_NAME, "main")),
+        ("experience", "details/experience", (By.TAG_NAME, "main")),
+        ("education", "details/education", (By.TAG_NAME, "main")),
+    ],
+    "company": [
+        ("about", "about", (By.TAG_NAME, "main")),
+    ],
+    "job": [
+        ("job", "", (By.CLASS_NAME, "job-details-jobs-unified-top-card__job-title")),
+    ],
+}
+
+# Marks the end of the snapshots for the parser threads
+_DONE = object()
+
+
+def page_urls(kind, url):
+    """(page name, url, wait_for) of every page ``kind`` is built from"""
+    return [(name, os.path.join(url, path) if path else url, wait_for) for name, path, wait_for in PAGES[kind]]
+
+
+def run_pipeline(driver, kind, urls, parsers=2, queue_size=4, lookahead=0, limiter=None):
+    """
+    Scrape ``urls`` with page loads and parsing overlapped.
+
+    Args:
+        driver: Selenium WebDriver instance (must be logged in)
+        kind (str): One of PAGES ("person", "company" or "job")
+        urls (list): Profile, company or job URLs
+        parsers (int): Parser threads
+        queue_size (int): Snapshots waiting to be parsed at most; the browser
+            waits when the parsers fall this far behind
+        lookahead (int): Pages loading ahead in tabs of their own; 0 loads
+            each page in the current tab when its turn comes
+        limiter (readiness.RateLimiter): Spaces out the page loads
+
+    Returns:
+        list: Person, Company or Job objects in the same order as ``urls``;
+        None for an object whose pages could not be loaded or parsed
+    """
+    if kind not in PAGES:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {sorted(PAGES)}")
+    urls = list(urls)
+    results = [None] * len(urls)
+    snapshots = queue.Queue(maxsize=queue_size)
+
+    def parse():
+        while True:
+            item = snapshots.get()
+            if item is _DONE:
+                return
+            index, url, pages = item
+            try:
+                results[index] = extract(kind, pages, linkedin_url=url)
+            except Exception as e:
+                print(f"⚠️  Could not parse {url}: {e}")
+
+    threads = [threading.Thread(target=parse, daemon=True) for _ in range(parsers)]
+    for thread in threads:
+        thread.start()
+    try:
+        _fetch(Scraper(driver=driver), kind, urls, snapshots, lookahead, limiter)
+    finally:
+        for _ in threads:
+            snapshots.put(_DONE)
+        for thread in threads:
+            thread.join()
+    return results
+
+
+def _fetch(scraper, kind, urls, snapshots, lookahead, limiter):
+    """Browser stage: load every page in turn and queue each object's snapshots"""
+    plan = [(index, url, page) for index, url in enumerate(urls) for page in page_urls(kind, url)]
+    if lookahead:
+        order = scraper.iter_tabs([page_url for _, _, (_, page_url, _) in plan], tabs=lookahead, limiter=limiter)
+    else:
+        order = (page_url for _, _, (_, page_url, _) in plan)
+
+    pages = {}
+    for step, page_url in enumerate(order):
+        index, url, (name, _, (by, wait_for)) = plan[step]
+        if not lookahead and limiter is not None:
+            limiter.wait()
+        try:
+            scraper.navigate(page_url, wait_for, by)
+            scraper.focus()
+            # Open lazily loaded lists and "see more" text before the snapshot
+            scraper.expand_all(selectors.SHOW_MORE_BUTTONS, before=(("scrollTo", 0.5), ("scrollTo", 1)))
+            pages[name] = take_snapshot(scraper.driver)
+        except WebDriverException as e:
+            print(f"⚠️  Could not load {page_url}: {e}")
+        last_page = step + 1 == len(plan) or plan[step + 1][0] != index
+        if last_page:
+            if pages:
+                snapshots.put((index, url, pages))
+            pages = {}
@@ -0,0 +1,156 @@
+"""
+Pool of signed-in browser sessions.
+
+Starting Chrome and logging in costs far more than scraping one profile, so
+a batch keeps a few sessions open and lends them out job by job. A session
+that comes back signed out (an auth wall, a dead browser) is quit and
+replaced by a fresh, logged-in one before it is lent again.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from . import actions
+from .objects import Scraper, create_driver
+
+
+class DriverPool:
+    """
+    Keep ``size`` logged-in WebDriver sessions warm for Person, Company and Job scrapes.
+
+    Args:
+        size (int): Number of sessions, i.e. how many scrapes run at once
+        email (str): LinkedIn email, passed to actions.login
+        password (str): LinkedIn password, passed to actions.login
+        cookie (str): li_at cookie, used instead of email and password
+        factory (callable): Returns a new driver (default: objects.create_driver)
+        login (callable): Signs a new driver in (default: actions.login with the credentials above)
+    """
+
+    # A returned session is on a page its job already waited for, so the nav
+    # bar is either there or the session is signed out
+    HEALTH_CHECK_TIMEOUT = 2
+
+    def __init__(self, size=2, email=None, password=None, cookie=None, factory=None, login=None):
+        self.size = size
+        self.factory = factory or create_driver
+        self.login = login or (lambda driver: actions.login(driver, email, password, cookie=cookie))
+        self.recycled = 0
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._drivers = []
+        # Sessions start in parallel, each login being mostly waiting on the network
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(self._open) for _ in range(size)]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            # Do not leave the sessions that did start running
+            self.close()
+            raise errors[0]
+        for future in futures:
+            self._idle.put(future.result())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open(self):
+        driver = self.factory()
+        try:
+            self.login(driver)
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.remove(driver)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def healthy(self, driver):
+        """Whether ``driver`` is still signed in, judged by the page it is on"""
+        checker = Scraper(driver=driver)
+        checker.WAIT_FOR_ELEMENT_TIMEOUT = self.HEALTH_CHECK_TIMEOUT
+        return checker.is_signed_in()
+
+    @contextmanager
+    def session(self):
+        """
+        Borrow a signed-in driver for one job, blocking until one is free.
+
+        The driver is health-checked when it is handed back and replaced with
+        a new session if it is no longer signed in. If the replacement cannot
+        be opened the slot is kept empty (None) and reopened on its next
+        checkout, so the pool never shrinks and the job's own error is not
+        masked by the failed login.
+        """
+        driver = self._idle.get()
+        if driver is None:
+            try:
+                driver = self._open()
+            except Exception:
+                self._idle.put(None)
+                raise
+        try:
+            yield driver
+        finally:
+            if not self.healthy(driver):
+                self._discard(driver)
+                try:
+                    driver = self._open()
+                except Exception as e:
+                    print(f"⚠️  Could not replace a signed-out session: {e}")
+                    driver = None
+            self._idle.put(driver)
+
+    def map(self, fn, items):
+        """
+        Run ``fn(driver, item)`` for every item, ``size`` at a time.
+
+        Returns:
+            list: Results in the same order as ``items``; the first exception is re-raised
+        """
+        def run(item):
+            with self.session() as driver:
+                return fn(driver, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def scrape(self, scraper, urls, **kwargs):
+        """
+        Scrape every url with ``scraper`` (Person, Company or Job) on the pooled sessions.
+
+        Args:
+            scraper: Scraper class taking ``linkedin_url`` and ``driver``
+            urls (list): Profile, company or job URLs
+            **kwargs: Passed on to the scraper, e.g. budget_seconds for Person
+
+        Returns:
+            list: Scraped objects, in the same order as ``urls``
+        """
+        return self.map(lambda driver, url: scraper(url, driver=driver, close_on_complete=False, **kwargs), urls)
+
+    def close(self):
+        """Quit every session"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,153 @@
+"""
+Readiness waits.
+
+Each wait polls the page, one ``ready`` runtime call per poll (see
+runtime.py), until a condition holds, and gives up at a deadline. A page
+that is ready early is left early, so the deadline only matters for pages
+that never settle. The waits return False on timeout instead of raising,
+since they stand in for fixed sleeps that never failed a scrape either.
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from . import runtime
+from .actions import page_has_loaded
+
+POLL_FREQUENCY = 0.1
+# How long the DOM / network must stay still to count as settled
+QUIET_MS = 500
+
+
+class Deadline:
+    """
+    A point in time that waits and scroll loops are clipped to.
+
+    Args:
+        seconds (float): Budget from now; None for no deadline
+    """
+
+    def __init__(self, seconds=None):
+        self.at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left, never negative; None without a deadline"""
+        return None if self.at is None else max(0, self.at - time.monotonic())
+
+    def expired(self):
+        return self.at is not None and time.monotonic() >= self.at
+
+    def clip(self, timeout):
+        """``timeout`` cut down to the time that is left"""
+        return timeout if self.at is None else min(timeout, self.remaining())
+
+
+class RateLimiter:
+    """
+    Spaces out page loads to at most ``per_second`` a second.
+
+    One limiter can be shared by several tabs or threads; each wait() takes
+    the next free slot.
+    """
+
+    def __init__(self, per_second):
+        self.interval = 1 / per_second
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next)
+            self._next = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+
+def _wait(driver, condition, timeout):
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _wait_for_state(driver, condition, timeout, selector=None):
+    return _wait(driver, lambda d: condition(runtime.call(d, "ready", selector)), timeout)
+
+
+def wait_for_document_complete(driver, timeout):
+    """Wait for document.readyState to reach "complete"; False on timeout"""
+    return _wait(driver, page_has_loaded, timeout)
+
+
+def wait_for_network_idle(driver, timeout, idle_ms=QUIET_MS):
+    """Wait until no XHR/fetch request has been in flight for ``idle_ms``; False on timeout"""
+    return _wait_for_state(driver, lambda state: state["idleMs"] >= idle_ms, timeout)
+
+
+def wait_for_dom_quiet(driver, timeout, quiet_ms=QUIET_MS):
+    """
+    Wait until the DOM has not changed for ``quiet_ms``; False on timeout.
+
+    Scrolls and clicks made through the runtime count as changes, so a wait
+    right after a scroll does not return before the page had a chance to react.
+    """
+    return _wait_for_state(driver, lambda state: state["quietMs"] >= quiet_ms, timeout)
+
+
+def wait_for_count_stable(driver, selector, timeout, stable_ms=QUIET_MS):
+    """
+    Wait until the number of elements matching ``selector`` stops growing.
+
+    Args:
+        driver: Selenium WebDriver
+        selector (str): CSS selector to count
+        timeout (float): Seconds to wait at most
+        stable_ms (int): How long the count must stay unchanged
+
+    Returns:
+        bool: False if the count was still changing at the deadline
+    """
+    last = {"count": None, "since": None}
+
+    def stable(state):
+        now = time.monotonic()
+        if state["count"] != last["count"]:
+            last.update(count=state["count"], since=now)
+        return (now - last["since"]) * 1000 >= stable_ms
+
+    return _wait_for_state(driver, stable, timeout, selector)
+
+
+def wait_until_settled(driver, timeout, quiet_ms=QUIET_MS):
+    """
+    Wait until the document is parsed, no request is pending and both the
+    network and the DOM have been quiet for ``quiet_ms``.
+
+    The load event is not waited for, so pages opened under an eager or none
+    page-load strategy are not held up by slow images or third-party assets.
+    Requests the page sent before the runtime was installed cannot be counted
+    as pending; they only show up when they finish, which restarts the quiet
+    period. One still running after a full quiet period is not waited for.
+
+    Args:
+        driver: Selenium WebDriver
+        timeout (float): Seconds to wait at most, typically the fixed sleep this replaces
+        quiet_ms (int): Quiet period in milliseconds
+
+    Returns:
+        bool: False if the page was still busy at the deadline
+    """
+    def settled(state):
+        return (
+            state["state"] != "loading"
+            and state["pending"] == 0
+            and state["idleMs"] >= quiet_ms
+            and state["quietMs"] >= quiet_ms
+        )
+
+    return _wait_for_state(driver, settled, timeout)
@@ -0,0 +1,321 @@
+"""
+In-page helper runtime.
+
+A small library of scroll, expand, count, extract, observe and readiness
+primitives that is installed once per document as ``window.__ss``. Python then calls the
+primitives by name, so each round-trip only ships a name and arguments
+instead of fresh script source, and several primitives can be chained
+into a single round-trip.
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+RUNTIME_JS = """
+if (!window.__ss) {
+    window.__ss = (() => {
+        // Query plans (see objects.Query): read one row of named values from a scope element
+        const read = (el, attribute) => {
+            if (attribute === 'text') return el.innerText;
+            if ((attribute === 'href' || attribute === 'src') && el[attribute]) return el[attribute];
+            return el.getAttribute(attribute);
+        };
+        const valueOf = (el, query) => {
+            for (const attribute of query.attributes) {
+                const value = read(el, attribute);
+                if (value && value.trim() && (!query.contains.length || query.contains.some(part => value.includes(part)))) {
+                    return value;
+                }
+            }
+            return null;
+        };
+        const outermost = (el, selector) => {
+            let found = null;
+            for (let parent = el.parentElement; parent; parent = parent.parentElement) {
+                if (parent.matches(selector)) found = parent;
+            }
+            return found;
+        };
+        const run = (el, query) => {
+            const scope = query.ancestor ? outermost(el, query.ancestor) : el;
+            if (!scope) return [null, -1];
+            for (let i = 0; i < query.steps.length; i++) {
+                const selector = query.steps[i];
+                let found;
+                try {
+                    found = selector === null ? [scope] : (query.many ? Array.from(scope.querySelectorAll(selector)) : [scope.querySelector(selector)]);
+                } catch (e) {
+                    continue;
+                }
+                const values = found.filter(Boolean).map(el => valueOf(el, query)).filter(value => value !== null);
+                if (values.length) return [query.many ? values : values[0], i];
+            }
+            return [null, -1];
+        };
+        const row = (scope, plan) => {
+            const values = {}, index = {};
+            for (const query of plan) {
+                [values[query.name], index[query.name]] = run(scope, query);
+            }
+            return {values, index};
+        };
+
+        // Elements collected by MutationObservers, per key
+        const buffers = {};
+
+        // Page activity for the readiness waits (see readiness.py): the last DOM
+        // change, scroll or click, and the XHR/fetch requests in flight. Requests
+        // open longer than LONG_REQUEST_MS (realtime streams, long polls) are not
+        // counted as pending, or the page would never look idle.
+        // Only requests sent after this runtime is installed can be counted as
+        // pending. Earlier ones (an eager page is still fetching when scripts
+        // run) are seen through their resource timing entries once they finish,
+        // and installing counts as network activity, so the network only looks
+        // idle after a full quiet window in which none of them finished.
+        const LONG_REQUEST_MS = 5000;
+        const NETWORK_INITIATORS = new Set(['fetch', 'xmlhttprequest', 'beacon']);
+        const activity = {last: performance.now(), network: performance.now(), inflight: new Set()};
+        const finished = entries => {
+            for (const entry of entries) {
+                if (NETWORK_INITIATORS.has(entry.initiatorType)) activity.network = Math.max(activity.network, entry.responseEnd);
+            }
+        };
+        const touch = () => { activity.last = performance.now(); };
+        const request = () => {
+            const started = {at: performance.now()};
+            activity.inflight.add(started);
+            touch();
+            return () => {
+                activity.inflight.delete(started);
+                activity.network = performance.now();
+                touch();
+            };
+        };
+        new MutationObserver(touch).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        try {
+            new PerformanceObserver(list => finished(list.getEntries())).observe({type: 'resource', buffered: true});
+        } catch (e) {
+            // No PerformanceObserver: ready() still reads the resource timing buffer
+        }
+        if (window.fetch) {
+            const fetch = window.fetch;
+            window.fetch = function () {
+                const done = request();
+                return fetch.apply(this, arguments).finally(done);
+            };
+        }
+        const send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            this.addEventListener('loadend', request(), {once: true});
+            return send.apply(this, arguments);
+        };
+
+        return {
+            version: 4,
+            height: () => document.body.scrollHeight,
+            scrollTo: fraction => {
+                touch();
+                window.scrollTo(0, Math.ceil(document.body.scrollHeight * fraction));
+                return document.body.scrollHeight;
+            },
+            scrollElement: (className, fraction) => {
+                const el = document.getElementsByClassName(className)[0];
+                if (!el) return null;
+                touch();
+                el.scrollTo(0, el.scrollHeight * fraction);
+                return el.scrollHeight;
+            },
+            scrollIntoView: el => {
+                touch();
+                el.scrollIntoView(true);
+                return true;
+            },
+            click: el => {
+                touch();
+                el.click();
+                return true;
+            },
+            count: (selector, base) => (base || document).querySelectorAll(selector).length,
+            probe: (selectors, base) => selectors.map(selector => {
+                try {
+                    return (base || document).querySelector(selector) !== null;
+                } catch (e) {
+                    return false;
+                }
+            }),
+            expand: (xpath, base) => {
+                const found = document.evaluate(xpath, base || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                let clicked = 0;
+                touch();
+                for (let i = 0; i < found.snapshotLength; i++) {
+                    try {
+                        found.snapshotItem(i).click();
+                        clicked++;
+                    } catch (e) {}
+                }
+                return clicked;
+            },
+            extract: (plan, containers, base, limit) => {
+                const root = base || document;
+                if (containers === null) return {containerIndex: -1, rows: [row(root, plan)]};
+                for (let i = 0; i < containers.length; i++) {
+                    let scopes;
+                    try {
+                        scopes = Array.from(root.querySelectorAll(containers[i]));
+                    } catch (e) {
+                        continue;
+                    }
+                    if (scopes.length) {
+                        if (limit !== null) scopes = scopes.slice(0, limit);
+                        return {containerIndex: i, rows: scopes.map(scope => row(scope, plan))};
+                    }
+                }
+                return {containerIndex: -1, rows: []};
+            },
+            // Buffer every `item` element under `container`, now and as it is inserted.
+            // Re-observing after the container node was replaced re-attaches the observer;
+            // elements already buffered are never buffered again. Returns the backlog size,
+            // -1 while the container is missing.
+            observe: (key, container, item) => {
+                const state = buffers[key] = buffers[key] || {seen: new WeakSet(), queue: [], target: null, observer: null};
+                const target = document.querySelector(container);
+                if (!target) return -1;
+                const add = node => {
+                    if (node.nodeType !== Node.ELEMENT_NODE) return;
+                    const found = node.matches(item) ? [node] : [];
+                    found.push(...node.querySelectorAll(item));
+                    for (const el of found) {
+                        if (!state.seen.has(el)) {
+                            state.seen.add(el);
+                            state.queue.push(el);
+                        }
+                    }
+                };
+                if (target !== state.target) {
+                    if (state.observer) state.observer.disconnect();
+                    state.observer = new MutationObserver(mutations => mutations.forEach(m => m.addedNodes.forEach(add)));
+                    state.observer.observe(target, {childList: true, subtree: true});
+                    state.target = target;
+                    target.querySelectorAll(item).forEach(add);
+                }
+                return state.queue.length;
+            },
+            // Read and forget up to `limit` buffered elements with a query plan. With `ready`,
+            // elements without a match for it (placeholders still rendering) stay buffered
+            drain: (key, plan, limit, ready) => {
+                const state = buffers[key];
+                if (!state) return {containerIndex: -1, rows: []};
+                const nodes = [], waiting = [];
+                for (const el of state.queue) {
+                    if (!el.isConnected) continue;
+                    if ((limit !== null && nodes.length >= limit) || (ready && !el.querySelector(ready))) waiting.push(el);
+                    else nodes.push(el);
+                }
+                state.queue = waiting;
+                return {containerIndex: -1, rows: nodes.map(el => row(el, plan))};
+            },
+            disconnect: key => {
+                const state = buffers[key];
+                if (state && state.observer) state.observer.disconnect();
+                delete buffers[key];
+                return true;
+            },
+            // One poll of page readiness; `selector` is optionally counted as well
+            ready: selector => {
+                // Entries not yet delivered to the PerformanceObserver are in the buffer
+                finished(performance.getEntriesByType('resource'));
+                const now = performance.now();
+                const pending = Array.from(activity.inflight).filter(started => now - started.at < LONG_REQUEST_MS).length;
+                return {
+                    state: document.readyState,
+                    pending: pending,
+                    quietMs: now - activity.last,
+                    idleMs: pending ? 0 : now - activity.network,
+                    count: selector ? document.querySelectorAll(selector).length : -1,
+                };
+            },
+        };
+    })();
+}
+"""
+
+# Both return null while the runtime is missing, so the caller can resend
+# them with RUNTIME_JS prepended; results are wrapped so a null result is
+# still told apart from a missing runtime.
+CALL_JS = "return window.__ss ? [window.__ss[arguments[0]].apply(null, arguments[1])] : null;"
+CHAIN_JS = "return window.__ss ? [arguments[0].map(([name, args]) => window.__ss[name].apply(null, args))] : null;"
+
+
+def _run(driver, script, *args):
+    result = driver.execute_script(script, *args)
+    if result is None:
+        # New document: install the runtime and retry in the same call
+        result = driver.execute_script(RUNTIME_JS + script, *args)
+    return result[0]
+
+
+def call(driver, name, *args):
+    """
+    Call one runtime primitive.
+
+    Args:
+        driver: Selenium WebDriver
+        name (str): Primitive name, e.g. "scrollTo", "count", "expand", "extract"
+        *args: Arguments for the primitive; WebElements are passed through
+
+    Returns:
+        The primitive's return value
+    """
+    return _run(driver, CALL_JS, name, list(args))
+
+
+def call_chain(driver, *calls):
+    """
+    Call several runtime primitives in one round-trip.
+
+    Args:
+        driver: Selenium WebDriver
+        *calls: ``(name, *args)`` tuples, run in order
+
+    Returns:
+        list: Each primitive's return value
+    """
+    return _run(driver, CHAIN_JS, [[name, list(args)] for name, *args in calls])
+
+
+def probe(driver, selectors, base=None):
+    """
+    Test many CSS selectors for presence in one round-trip.
+
+    Unlike find_element, a miss costs nothing extra: the implicit wait does
+    not apply to in-page queries.
+
+    Args:
+        driver: Selenium WebDriver
+        selectors (list): CSS selectors
+        base: Element to search under (default: the whole document)
+
+    Returns:
+        set: The selectors that matched at least one element
+    """
+    selectors = list(dict.fromkeys(selectors))
+    found = call(driver, "probe", selectors, base)
+    return {selector for selector, present in zip(selectors, found) if present}
+
+
+def probed_finder(driver, base, selectors):
+    """
+    Probe ``selectors`` under ``base`` once, and return a CSS find_element for it.
+
+    The returned function raises NoSuchElementException straight away for
+    selectors the probe did not find, instead of letting the driver sit out
+    its implicit wait.
+    """
+    present = probe(driver, selectors, base)
+
+    def find(selector):
+        if selector not in present:
+            raise NoSuchElementException(f"css selector={selector}")
+        return base.find_element(By.CSS_SELECTOR, selector)
+
+    return find
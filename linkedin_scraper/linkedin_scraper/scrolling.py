@@ -0,0 +1,90 @@
+"""
+Adaptive infinite scroll.
+
+One loop for every lazily loaded list: scroll to the bottom, wait for the
+item count to grow, repeat. The wait after each scroll is not fixed; it
+follows how long new items actually took to appear so far, so fast pages
+are scrolled quickly while a slow batch still gets the full delay before
+the list is considered exhausted.
+"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from . import runtime
+from .readiness import POLL_FREQUENCY
+
+
+def _wait_for_growth(driver, item, count, timeout):
+    """The item count once it exceeds ``count``, or None if it did not within ``timeout``"""
+    def grown(d):
+        now = runtime.call(d, "count", item)
+        return now if now > count else False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(grown)
+    except TimeoutException:
+        return None
+
+
+def scroll_until(driver, item, target=None, stop=None, timeout=60, max_scrolls=None, min_delay=0.2, max_delay=3,
+                 scroll_class_name=None):
+    """
+    Scroll the page until enough ``item`` elements are loaded or the list runs dry.
+
+    Args:
+        driver: Selenium WebDriver
+        item (str): CSS selector of one list item
+        target (int): Stop once this many items are present
+        stop (callable): Called with the item count after each batch; stop when it returns True
+        timeout (float): Overall deadline in seconds
+        max_scrolls (int): Stop after this many scrolls
+        min_delay (float): Shortest wait for a batch after a scroll
+        max_delay (float): Longest wait for a batch; a scroll that brings nothing
+            within it ends the loop
+        scroll_class_name (str): Scroll the first element of this class instead
+            of the window, for lists in their own scroll pane
+
+    Returns:
+        int: Number of items present when scrolling stopped
+    """
+    deadline = time.monotonic() + timeout
+    scroll = ("scrollElement", scroll_class_name, 1) if scroll_class_name else ("scrollTo", 1)
+    count = runtime.call(driver, "count", item)
+    latency = None
+    patience = max_delay
+    scrolls = 0
+
+    while True:
+        if target is not None and count >= target:
+            break
+        if stop is not None and stop(count):
+            break
+        if max_scrolls is not None and scrolls >= max_scrolls:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        _, now = runtime.call_chain(driver, scroll, ("count", item))
+        scrolls += 1
+        started = time.monotonic()
+        if now <= count:
+            now = _wait_for_growth(driver, item, count, min(patience, remaining))
+
+        if now is None:
+            if patience >= max_delay:
+                break
+            # Maybe just a slow batch: give the next scroll the full delay
+            patience = max_delay
+            continue
+
+        # Wait about twice the typical time a batch takes to show up
+        observed = time.monotonic() - started
+        latency = observed if latency is None else (latency + observed) / 2
+        patience = min(max(2 * latency, min_delay), max_delay)
+        count = now
+
+    return count
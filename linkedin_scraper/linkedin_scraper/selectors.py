@@ -1 +1,279 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are only serialised within one process
+    fcntl = None
+
 NAME = 'text-heading-xlarge'
+
+# Activity feed posts (Person.get_posts)
+POST = "[data-urn*='urn:li:activity']"
+POST_FALLBACK = ".feed-shared-update-v2"
+POST_CONTENT = ".feed-shared-text, .feed-shared-update-v2__description"
+POST_DATE = "time, .feed-shared-actor__sub-description time"
+POST_LIKES = "[aria-label*='reaction'], .social-counts-reactions__count"
+POST_COMMENTS = "[aria-label*='comment'], .social-counts-comments"
+POST_SHARES = "[aria-label*='repost'], .social-counts-reposts"
+POST_URL = "a[href*='/posts/'], a[href*='/activity/']"
+POST_AUTHOR_NAME = ".feed-shared-actor__name, .feed-shared-actor__title"
+POST_AUTHOR_LINK = ".feed-shared-actor__container-link"
+# Checked in order, first match wins; posts matching none are 'text'
+POST_MEDIA_TYPES = (
+    ("image", "img, .feed-shared-image"),
+    ("video", "video, .feed-shared-video"),
+    ("document", ".feed-shared-document"),
+)
+
+# Comments made by a person (Person.get_comments)
+COMMENT_CONTAINERS = [
+    # Actual LinkedIn comment structure (from DOM analysis)
+    ".comments-comment-entity",  # Individual comment containers
+    "article.comments-comment-entity",  # More specific comment articles
+    ".comments-comment-item",  # Alternative comment items
+    "[data-id*='comment']",  # Comments with data-id attributes
+    # Fallback selectors for different LinkedIn layouts
+    ".feed-shared-update-v2 .comments-comment-entity",
+    ".comments-comments-list .comments-comment-entity",
+    ".comments-comment-list__container .comments-comment-entity"
+]
+COMMENT_CONTENT = [
+    # Primary comment content selectors (from DOM analysis)
+    ".comments-comment-item__main-content",  # Main comment text container
+    ".comments-comment-item__main-content .update-components-text",  # Nested text content
+    ".feed-shared-main-content--comment",  # Alternative main content
+    ".comments-comment-entity__content .update-components-text",  # Content within entity
+    ".feed-shared-inline-show-more-text .update-components-text",  # Show more text content
+    # Fallback selectors
+    ".comments-comment-item-content-body",
+    ".comment-item__main-content",
+    ".feed-shared-comment__main-content",
+    ".comments-comment-item .feed-shared-inline-show-more-text",
+    ".activity-item__commentary"
+]
+COMMENT_LIKES = [
+    ".social-counts-reactions__count",
+    ".feed-shared-social-action-bar__reaction-count",
+    "[aria-label*='reaction']",
+    "[aria-label*='like']",
+    ".social-action-bar__reaction-count",
+    ".feed-shared-social-counts__num-likes"
+]
+COMMENT_REPLIES = [
+    ".feed-shared-social-action-bar__comment-count",
+    ".social-counts-comments__count",
+    "[aria-label*='comment']",
+    "[aria-label*='repl']",
+    ".social-action-bar__comment-count",
+    ".feed-shared-social-counts__num-comments"
+]
+COMMENT_PERMALINK = "a[href*='/feed/update/']"
+# The post a comment was left on, looked up from the comment's ancestor
+COMMENT_POST_CONTAINER_CLASS = "feed-shared-update-v2"
+COMMENT_POST_URL = "a[href*='/posts/'], a[href*='/feed/update/']"
+COMMENT_POST_AUTHOR = ".feed-shared-actor__name, .feed-shared-actor__title"
+COMMENT_POST_CONTENT = ".feed-shared-text, .attributed-text-segment-list__content"
+
+# Activity dates, shared by comments and reactions
+ACTIVITY_DATE = [
+    "time",
+    ".feed-shared-actor__sub-description time",
+    "[data-test-id='feed-shared-actor__sub-description'] time",
+    ".feed-shared-actor__sub-description",
+    "[aria-label*='ago']"
+]
+
+# Reactions made by a person (Person.get_reactions)
+REACTION_CONTAINERS = [
+    ".feed-shared-update-v2",
+    ".activity-item",
+    "[data-urn*='activity']",
+    ".feed-shared-mini-update-v2",
+    "article[data-urn]",
+    ".feed-shared-activity"
+]
+REACTION_CONTENT = [
+    ".feed-shared-inline-show-more-text",
+    ".feed-shared-text",
+    ".feed-shared-update-v2__description",
+    ".feed-shared-actor__description",
+    ".activity-item__description"
+]
+REACTION_AUTHOR = [
+    ".feed-shared-actor__name",
+    ".feed-shared-actor__title",
+    "[data-test-id='feed-shared-actor__name']",
+    ".feed-shared-update-v2__actor-name"
+]
+REACTION_POST_URL = [
+    "a[href*='/posts/']",
+    "a[href*='/feed/update/']",
+    ".feed-shared-control-menu__trigger"
+]
+SHOW_MORE_BUTTONS = "//button[contains(@aria-label, 'Show more') or contains(text(), 'Show more') or contains(@aria-label, 'see more') or contains(text(), 'see more')]"
+REACTION_TYPE = "[aria-label*='reaction'], .reaction-icon, [data-test-id*='reaction']"
+
+# Profile page layout markers (Person.probe_sections); the set present fingerprints the layout
+PROFILE_LAYOUTS = {
+    "top_card": ".pv-top-card",
+    "text_details": ".pv-text-details__left-panel",
+    "profile_cards": "section[data-view-name='profile-card']",
+    "legacy_sections": ".pv-profile-section",
+}
+# Optional profile sections that exist only in some layouts (Person.scrape_logged_in)
+PROFILE_SECTIONS = {
+    "interests": ".pv-profile-section.pv-interests-section",
+    "accomplishments": ".pv-profile-section.pv-accomplishments-section",
+}
+
+
+# Where learned selector statistics are kept between runs. Set the
+# environment variable to an empty string to keep them in memory only.
+SELECTOR_STATS_PATH = os.getenv(
+    "LINKEDIN_SCRAPER_SELECTOR_STATS",
+    os.path.join(os.path.expanduser("~"), ".linkedin_scraper", "selector_stats.json"),
+)
+# Counts are halved past this many probes so a layout change is picked up quickly
+MAX_SELECTOR_SAMPLES = 500
+
+
+class SelectorChain:
+    """
+    A fallback list of selectors that learns which one wins.
+
+    Every probe is recorded as a hit or a miss, and iterating the chain yields
+    the selectors ordered by hit rate, so the layout that currently matches is
+    tried first. Selectors with no history keep their declared order.
+    """
+
+    def __init__(self, name, selectors, stats=None):
+        self.name = name
+        self.selectors = list(selectors)
+        self.stats = {selector: [0, 0] for selector in self.selectors}
+        for selector, counts in (stats or {}).items():
+            if selector in self.stats:
+                self.stats[selector] = list(counts)
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return iter(self.ordered())
+
+    def __len__(self):
+        return len(self.selectors)
+
+    def hit_rate(self, selector):
+        hits, misses = self.stats[selector]
+        return (hits + 1) / (hits + misses + 2)
+
+    def ordered(self):
+        """Selectors, best hit rate first"""
+        return sorted(self.selectors, key=lambda selector: -self.hit_rate(selector))
+
+    def record(self, selector, hit):
+        with self._lock:
+            counts = self.stats[selector]
+            counts[0 if hit else 1] += 1
+            if sum(counts) > MAX_SELECTOR_SAMPLES:
+                counts[0] //= 2
+                counts[1] //= 2
+
+    def hit(self, selector):
+        self.record(selector, True)
+
+    def miss(self, selector):
+        self.record(selector, False)
+
+    def record_winner(self, order, index):
+        """
+        Record a cascade that was run elsewhere (e.g. in the page).
+
+        Args:
+            order (list): Selectors in the order they were tried
+            index (int): Position of the selector that won, or -1 if none did
+        """
+        tried = order if index < 0 else order[:index]
+        for selector in tried:
+            self.miss(selector)
+        if index >= 0:
+            self.hit(order[index])
+
+    def to_dict(self):
+        with self._lock:
+            return {selector: list(counts) for selector, counts in self.stats.items()}
+
+
+_chains = {}
+_saved_stats = None
+_registry_lock = threading.Lock()
+
+
+def _read_stats(path):
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_stats():
+    global _saved_stats
+    if _saved_stats is None:
+        _saved_stats = _read_stats(SELECTOR_STATS_PATH)
+    return _saved_stats
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive lock on ``path`` against other processes, e.g. batch workers"""
+    if fcntl is None:
+        yield
+        return
+    with open(path + ".lock", 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def selector_chain(name, selectors):
+    """Shared SelectorChain for ``name``, seeded with any statistics saved by earlier runs"""
+    with _registry_lock:
+        chain = _chains.get(name)
+        if chain is None or chain.selectors != list(selectors):
+            chain = SelectorChain(name, selectors, _load_stats().get(name))
+            _chains[name] = chain
+        return chain
+
+
+def save_selector_stats(path=None):
+    """Write the statistics of every chain used so far to disk"""
+    path = path or SELECTOR_STATS_PATH
+    if not path:
+        return
+    with _registry_lock:
+        chains = {name: chain.to_dict() for name, chain in _chains.items()}
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with _registry_lock, _locked(path):
+            # Re-read under the lock so chains other processes saved meanwhile are kept
+            stats = _read_stats(path)
+            stats.update(chains)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory or '.', prefix=os.path.basename(path) + '.',
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(stats, f, indent=2)
+            try:
+                os.replace(f.name, path)
+            except OSError:
+                os.remove(f.name)
+                raise
+    except OSError as e:
+        print(f"⚠️  Could not save selector statistics to {path}: {e}")
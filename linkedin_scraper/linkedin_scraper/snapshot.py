@@ -0,0 +1,234 @@
+"""
+Snapshot-and-parse helpers.
+
+Instead of walking the page with one WebDriver round-trip per field, grab an
+element's ``outerHTML`` in a single call and run the same CSS selectors
+locally with lxml. The helpers here mirror the WebElement behaviour the
+scrapers rely on (``find_element`` scoping, ``.text``, ``get_attribute``) so
+that the live and snapshot code paths return the same values.
+"""
+import os
+from functools import lru_cache
+from urllib.parse import urljoin
+
+from cssselect import HTMLTranslator
+from lxml import html
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+_SKIPPED_TAGS = {"script", "style", "noscript", "template", "head"}
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tr", "ul",
+}
+_URL_ATTRIBUTES = {"href", "src"}
+_PARSER = html.HTMLParser(encoding="utf-8")
+
+
+def take_snapshot(driver, element=None):
+    """Return the ``outerHTML`` of ``element`` (or the whole document) in one call"""
+    if element is None:
+        return driver.page_source
+    return element.get_attribute("outerHTML")
+
+
+def parse_html(source):
+    """Parse an HTML string or bytes into an lxml element"""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    return html.fromstring(source, parser=_PARSER)
+
+
+def load_html(source):
+    """
+    Parse saved HTML.
+
+    Args:
+        source: Markup as str or bytes, or the path of a saved page
+
+    Returns:
+        lxml element for the document
+    """
+    if isinstance(source, bytes):
+        return parse_html(source)
+    if isinstance(source, str) and source.lstrip().startswith("<"):
+        return parse_html(source)
+    with open(source, "rb") as f:
+        return parse_html(f.read())
+
+
+def load_pages(source, default="page"):
+    """
+    Parse a set of saved pages.
+
+    Args:
+        source: A dict of page name -> HTML source, a directory of ``<page name>.html``
+            files, or a single HTML source (returned under ``default``)
+        default (str): Page name for a single source
+
+    Returns:
+        dict: Page name -> lxml element
+    """
+    if isinstance(source, dict):
+        return {name: load_html(page) for name, page in source.items()}
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        pages = {}
+        for filename in sorted(os.listdir(source)):
+            name, ext = os.path.splitext(filename)
+            if ext.lower() in (".html", ".htm"):
+                pages[name] = load_html(os.path.join(source, filename))
+        return pages
+    return {default: load_html(source)}
+
+
+def canonical_url(root):
+    """The page's canonical URL, if it declares one"""
+    for selector, attribute in (("link[rel='canonical']", "href"), ("meta[property='og:url']", "content")):
+        node = select_one(root, selector)
+        if node is not None and node.get(attribute):
+            return node.get(attribute)
+    return None
+
+
+def children(node):
+    """Element children of ``node``, like find_elements(By.XPATH, "*")"""
+    return [child for child in node if isinstance(child.tag, str)]
+
+
+@lru_cache(maxsize=256)
+def _css_to_xpath(selector):
+    # Like WebElement.find_element, only descendants match - never the node itself.
+    return HTMLTranslator().css_to_xpath(selector, prefix="descendant::")
+
+
+def select_all(node, selector):
+    """All descendants of ``node`` matching a CSS selector, in document order"""
+    return node.xpath(_css_to_xpath(selector))
+
+
+def select_one(node, selector):
+    """First descendant of ``node`` matching a CSS selector, or None"""
+    matches = select_all(node, selector)
+    return matches[0] if matches else None
+
+
+def _is_hidden(node):
+    if node.get("hidden") is not None:
+        return True
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def _collect_text(node, parts):
+    if not isinstance(node.tag, str):
+        return
+    tag = node.tag.lower()
+    if tag in _SKIPPED_TAGS or _is_hidden(node):
+        return
+    if tag == "br":
+        parts.append("\n")
+        return
+    block = tag in _BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if node.text:
+        parts.append(node.text)
+    for child in node:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def node_text(node):
+    """Rendered text of ``node``, approximating WebElement.text"""
+    if node is None:
+        return ""
+    parts = []
+    _collect_text(node, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def node_attr(node, name, base_url=LINKEDIN_BASE_URL):
+    """Attribute value of ``node``; like Selenium, ``href``/``src`` are made absolute"""
+    if node is None:
+        return None
+    if name == "outerHTML":
+        return html.tostring(node, encoding="unicode")
+    value = node.get(name)
+    if value is not None and name in _URL_ATTRIBUTES and base_url:
+        value = urljoin(base_url, value)
+    return value
+
+
+def _read(node, attribute):
+    if attribute == "text":
+        return node_text(node)
+    return node_attr(node, attribute)
+
+
+def _query_value(node, query):
+    for attribute in query["attributes"]:
+        value = _read(node, attribute)
+        if value and value.strip() and (not query["contains"] or any(part in value for part in query["contains"])):
+            return value
+    return None
+
+
+def _outermost(node, selector):
+    matches = set(select_all(node.getroottree().getroot(), selector))
+    found = [ancestor for ancestor in node.iterancestors() if ancestor in matches]
+    return found[-1] if found else None
+
+
+def _run_query(scope, query):
+    if query.get("ancestor"):
+        scope = _outermost(scope, query["ancestor"])
+        if scope is None:
+            return None, -1
+    for i, selector in enumerate(query["steps"]):
+        if selector is None:
+            found = [scope]
+        else:
+            try:
+                found = select_all(scope, selector)
+            except Exception:
+                continue
+            if not query["many"]:
+                found = found[:1]
+        values = [value for value in (_query_value(node, query) for node in found) if value is not None]
+        if values:
+            return (values if query["many"] else values[0]), i
+    return None, -1
+
+
+def _query_row(scope, plan):
+    values, index = {}, {}
+    for query in plan:
+        values[query["name"]], index[query["name"]] = _run_query(scope, query)
+    return {"values": values, "index": index}
+
+
+def evaluate_query_plan(root, plan, containers=None, limit=None):
+    """
+    Run a query plan on an lxml tree.
+
+    Local counterpart of the runtime's ``extract`` primitive, taking the same arguments
+    and returning the same structure, for saved pages and tests.
+    """
+    if containers is None:
+        return {"containerIndex": -1, "rows": [_query_row(root, plan)]}
+    for i, selector in enumerate(containers):
+        try:
+            scopes = select_all(root, selector)
+        except Exception:
+            continue
+        if scopes:
+            if limit is not None:
+                scopes = scopes[:limit]
+            return {"containerIndex": i, "rows": [_query_row(scope, plan) for scope in scopes]}
+    return {"containerIndex": -1, "rows": []}
@@ -0,0 +1,114 @@
+"""
+Timestamps of LinkedIn activity.
+
+Activity, share, ugcPost and comment IDs are 64-bit numbers whose top 41
+bits hold the creation time in milliseconds since the Unix epoch, so a URN
+such as ``urn:li:activity:7241234567890123456`` dates its item exactly. The
+page itself only shows a rounded relative age like "2h" or "1w", which is
+used here as a fallback when no URN is at hand.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+# 41-bit millisecond timestamps, as they appear in URNs and in URLs built from them
+_ID = re.compile(r"(?<!\d)\d{18,20}(?!\d)")
+# IDs decoding to earlier than this are not activity IDs
+_EARLIEST = datetime(2010, 1, 1, tzinfo=timezone.utc)
+
+_RELATIVE = re.compile(r"(\d+)\s*(mo|yr|[smhdwy])[a-z]*\b")
+_UNITS = {
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "mo": timedelta(days=30),
+    "y": timedelta(days=365),
+    "yr": timedelta(days=365),
+}
+# Full unit words, e.g. "3 months ago", that the short forms above do not tell apart
+_WORDS = {"minute": "m", "month": "mo", "year": "y"}
+
+
+def as_utc(value):
+    """Aware UTC datetime; naive datetimes are taken as local time, like datetime.now()"""
+    return value.astimezone(timezone.utc)
+
+
+def id_to_datetime(activity_id):
+    """
+    Creation time encoded in an activity, share, ugcPost or comment ID.
+
+    Args:
+        activity_id (int or str): The numeric part of the URN
+
+    Returns:
+        datetime: Aware UTC datetime
+    """
+    return datetime.fromtimestamp((int(activity_id) >> 22) / 1000, tz=timezone.utc)
+
+
+def urn_datetime(*sources):
+    """
+    Creation time from the first of ``sources`` that holds an activity ID.
+
+    Sources may be URNs, data-urn/data-id attribute values or URLs that embed
+    an ID, URL-encoded or not. When one source holds several IDs, as a
+    comment URN holds its post's ID and its own, the latest one wins: that is
+    the item itself, since it cannot predate what it belongs to.
+
+    Returns:
+        datetime: Aware UTC datetime, or None if no source holds an ID
+    """
+    latest = datetime.now(timezone.utc) + timedelta(days=1)
+    for source in sources:
+        if not source:
+            continue
+        found = [id_to_datetime(match) for match in _ID.findall(str(source))]
+        found = [moment for moment in found if _EARLIEST <= moment <= latest]
+        if found:
+            return max(found)
+    return None
+
+
+def parse_date_text(text, now=None):
+    """
+    Time from a date as the page displays it.
+
+    Understands ISO 8601 datetimes (the ``datetime`` attribute of <time>) and
+    relative ages such as "2h", "3d ago", "1w •", "2mo" or "5 minutes ago".
+
+    Returns:
+        datetime: Aware UTC datetime, or None if the text is not a date
+    """
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return as_utc(datetime.fromisoformat(text.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+
+    lowered = text.lower()
+    for word, unit in _WORDS.items():
+        lowered = re.sub(rf"(\d+)\s*{word}s?\b", rf"\1{unit}", lowered)
+    match = _RELATIVE.search(lowered)
+    if match is None:
+        return None
+    now = datetime.now(timezone.utc) if now is None else as_utc(now)
+    return now - int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def activity_time(urns=(), text=None):
+    """
+    Best known creation time of an item: from its URNs, else from its date text.
+
+    Args:
+        urns (iterable): URNs or URLs to decode, in order of preference
+        text (str): Displayed date, parsed only when no URN holds an ID
+
+    Returns:
+        datetime: Aware UTC datetime, or None if neither gives a time
+    """
+    return urn_datetime(*urns) or parse_date_text(text)
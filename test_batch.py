@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test Batch Runner
+
+Checks that run_batch journals every URL as it finishes, resumes from the
+journal after an interrupted run, and gives the same records with worker
+processes as in-process.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.batch import Journal, read_urls, run_batch
+
+JOB_URLS = [f"https://www.linkedin.com/jobs/view/39900000{n}/" for n in (1, 2, 3)]
+MISSING_URL = "https://www.linkedin.com/jobs/view/404/"
+
+
+def factory():
+    # Job pages as a signed-in session sees them, with the global nav bar
+    page = load_fixture('job_view.html').replace("<body>", '<body><a class="global-nav__primary-link">Home</a>', 1)
+    return FixtureDriver({url: page for url in ["login"] + JOB_URLS})
+
+
+def login(driver):
+    driver.get("login")
+
+
+def failing_login(driver):
+    raise RuntimeError("login rejected")
+
+
+def journal_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_batch_resumes_from_journal():
+    with tempfile.TemporaryDirectory() as directory:
+        journal = os.path.join(directory, "run.jsonl")
+        reports = []
+
+        stats = run_batch("job", JOB_URLS[:2] + [MISSING_URL], journal, workers=1, factory=factory, login=login, progress=reports.append)
+
+        assert (stats.done, stats.failed, stats.skipped) == (2, 1, 0)
+        records = journal_lines(journal)
+        assert [record["url"] for record in records] == JOB_URLS[:2] + [MISSING_URL]
+        assert records[0]["data"]["job_title"] == "Detection Engineer" and "driver" not in records[0]["data"]
+        assert records[2]["error"].startswith("KeyError")
+        assert reports[-1] is stats
+
+        # A crash mid-write leaves a torn last line behind
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write('{"url": "https://www.linkedin.com/jobs/view/3990')
+
+        stats = run_batch("job", JOB_URLS + [MISSING_URL], journal, workers=1, factory=factory, login=login,
+                          retry_failed=False, progress=None)
+        assert (stats.done, stats.failed, stats.skipped) == (1, 0, 3)
+        assert set(Journal(journal).load()) == set(JOB_URLS + [MISSING_URL])
+
+
+def test_batch_worker_processes():
+    with tempfile.TemporaryDirectory() as directory:
+        urls_path = os.path.join(directory, "urls.txt")
+        with open(urls_path, "w", encoding="utf-8") as f:
+            f.write("# jobs\n" + "\n".join(JOB_URLS + JOB_URLS[:1]) + "\n\n")
+        journal = os.path.join(directory, "run.jsonl")
+
+        stats = run_batch("job", read_urls(urls_path), journal, workers=2, factory=factory, login=login, progress=None)
+
+        assert (stats.total, stats.done, stats.failed) == (3, 3, 0)
+        records = Journal(journal).load()
+        assert sorted(records) == sorted(JOB_URLS)
+        assert all(record["data"]["company"] == "Acme Security" for record in records.values())
+
+
+def test_batch_journals_failed_logins():
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in (1, 2):
+            journal = os.path.join(directory, f"run{workers}.jsonl")
+
+            stats = run_batch("job", JOB_URLS, journal, workers=workers, factory=factory, login=failing_login, progress=None)
+
+            assert (stats.done, stats.failed) == (0, 3)
+            records = Journal(journal).load()
+            assert sorted(records) == sorted(JOB_URLS)
+            assert not any(record["ok"] for record in records.values())
+
+
+if __name__ == "__main__":
+    test_batch_resumes_from_journal()
+    test_batch_worker_processes()
+    test_batch_journals_failed_logins()
+    print("✅ Batch runner tests passed")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Company Employee Collection
+
+Checks that Company.get_employees reads each result <li> exactly once, in
+insertion order, while the people list grows under infinite scroll.
+"""
+
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from lxml import html as lxml_html
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.company import Company
+from linkedin_scraper.snapshot import select_one
+
+PEOPLE_URL = "https://www.linkedin.com/company/acme-security/people"
+
+
+class GrowingListDriver(FixtureDriver):
+    """FixtureDriver that appends one more result to the people list on each full scroll"""
+
+    def __init__(self, pages, extra):
+        super().__init__(pages)
+        self.extra = list(extra)
+        self.drained = 0
+
+    def _runtime_call(self, name, args):
+        if name == "scrollTo" and args[0] == 1 and self.extra:
+            select_one(self._root, ".list-style-none").append(lxml_html.fragment_fromstring(self.extra.pop(0)))
+        result = super()._runtime_call(name, args)
+        if name == "drain":
+            self.drained += len(result["rows"])
+        return result
+
+
+def test_get_employees_reads_each_result_once():
+    extra = [
+        '<li><a href="/in/omar-haddad/">Omar Haddad</a><div>· 2nd</div><div>2nd degree connection</div><div>Threat Hunter</div></li>',
+        '<li><a href="/in/mei-lin/">Mei Lin</a><div>· 3rd+</div><div>3rd+ degree connection</div><div>GRC Analyst</div></li>',
+    ]
+    driver = GrowingListDriver({PEOPLE_URL: load_fixture('company_people.html')}, extra)
+    company = Company(linkedin_url="https://www.linkedin.com/company/acme-security", driver=driver, scrape=False, get=False)
+
+    employees = company.get_employees(wait_time=0)
+
+    assert [employee['name'] for employee in employees] == ["Priya Raman", "Arjun Mehta", "Lena Fischer", "Omar Haddad", "Mei Lin"]
+    assert employees[0]['designation'] == "Detection Engineer at Acme Security"
+    assert employees[4]['linkedin_url'].endswith("/in/mei-lin/")
+    assert driver.drained == len(employees)
+    assert driver._observers == {}
+
+
+class SlowNextPageDriver(FixtureDriver):
+    """FixtureDriver whose Next button swaps in page 2's results only after a delay"""
+
+    NEXT = '<button aria-label="Next">Next</button>'
+    PAGE_2 = [
+        '<li><a href="/in/omar-haddad/">Omar Haddad</a><div>· 2nd</div><div>2nd degree connection</div><div>Threat Hunter</div></li>',
+        '<li><a href="/in/mei-lin/">Mei Lin</a><div>· 3rd+</div><div>3rd+ degree connection</div><div>GRC Analyst</div></li>',
+    ]
+
+    def __init__(self, pages, delay):
+        super().__init__(pages)
+        self.delay = delay
+        self.page_2_at = None
+
+    def get(self, url):
+        super().get(url)
+        select_one(self._root, "main").append(lxml_html.fragment_fromstring(self.NEXT))
+
+    def _clicked(self, node):
+        if node.get("aria-label") == "Next":
+            node.getparent().remove(node)  # the last page has no Next button
+            self.page_2_at = time.monotonic() + self.delay
+
+    def _runtime_call(self, name, args):
+        if self.page_2_at is not None and time.monotonic() >= self.page_2_at:
+            self.page_2_at = None
+            results = select_one(self._root, ".list-style-none")
+            for item in list(results):
+                results.remove(item)
+            for item in self.PAGE_2:
+                results.append(lxml_html.fragment_fromstring(item))
+        return super()._runtime_call(name, args)
+
+
+def test_get_employees_waits_for_next_page():
+    driver = SlowNextPageDriver({PEOPLE_URL: load_fixture('company_people.html')}, delay=0.5)
+    company = Company(linkedin_url="https://www.linkedin.com/company/acme-security", driver=driver, scrape=False, get=False)
+
+    employees = company.get_employees(wait_time=5)
+
+    assert [employee['name'] for employee in employees] == ["Priya Raman", "Arjun Mehta", "Lena Fischer", "Omar Haddad", "Mei Lin"]
+
+
+if __name__ == "__main__":
+    test_get_employees_reads_each_result_once()
+    test_get_employees_waits_for_next_page()
+    print("✅ Company employee tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test Scrape Deadlines
+
+Checks that a time budget clips waits and scroll loops, and that
+Person.scrape_logged_in skips sections it has no time for and flags them.
+"""
+
+import os
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import Person
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.readiness import Deadline
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+
+def profile_pages():
+    return {
+        PROFILE_URL: load_fixture('person/profile.html'),
+        os.path.join(PROFILE_URL, "details/experience"): load_fixture('person/experience.html'),
+        os.path.join(PROFILE_URL, "details/education"): load_fixture('person/education.html'),
+    }
+
+
+def test_deadline_clips_timeouts():
+    assert Deadline().clip(5) == 5 and not Deadline().expired()
+    assert 0 < Deadline(1).clip(5) <= 1
+    assert Deadline(0).clip(5) == 0 and Deadline(0).expired()
+
+    scraper = Scraper(driver=FixtureDriver(load_fixture('company_people.html')))
+    assert scraper.time_left(5) == 5
+    scraper.deadline = Deadline(0)
+    started = time.monotonic()
+    assert scraper.scroll_until(".list-style-none li", max_delay=3) == 3
+    assert time.monotonic() - started < 0.5
+
+
+def test_sections_without_time_are_skipped():
+    driver = FixtureDriver(profile_pages())
+    driver.get(PROFILE_URL)
+    person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+    person.deadline = Deadline(0)
+
+    person.scrape_logged_in(close_on_complete=False)
+
+    assert person.name
+    assert person.experiences == [] and person.educations == []
+    assert person.partial_sections == ["experiences", "educations", "connections"]  # the fixture has no legacy sections
+
+
+def test_sections_with_time_run():
+    driver = FixtureDriver(profile_pages())
+    driver.get(PROFILE_URL)
+    person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+    person.deadline = Deadline(60)
+
+    person._scrape_section("experiences", person.get_experiences)
+
+    assert len(person.experiences) == 3
+    assert person.partial_sections == []
+
+
+if __name__ == "__main__":
+    test_deadline_clips_timeouts()
+    test_sections_without_time_are_skipped()
+    test_sections_with_time_run()
+    print("✅ Deadline tests passed")
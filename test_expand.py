@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test Bulk Expansion
+
+Checks that Scraper.expand_all clicks every matching expander in one
+round-trip and only waits for the page when something was expanded.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import Job
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.selectors import SHOW_MORE_BUTTONS
+
+
+def test_expand_all_single_round_trip():
+    driver = FixtureDriver(load_fixture('job_view.html'))
+    scraper = Scraper(driver=driver)
+    scraper.call("height")
+
+    calls = driver.calls
+    assert scraper.expand_all(SHOW_MORE_BUTTONS, before=(("scrollTo", 0.5), ("scrollTo", 1))) == 0
+    assert driver.calls - calls == 1  # nothing expanded, so no wait
+
+    assert scraper.expand_all("//button[contains(@class, 'jobs-description__footer-button')]") == 1
+
+
+def test_job_description_expanded():
+    driver = FixtureDriver({"job": load_fixture('job_view.html')})
+    job = Job("job", driver=driver, scrape=False)
+
+    job.scrape_logged_in(close_on_complete=False)
+
+    assert job.job_title == "Detection Engineer"
+    assert "Sigma rules" in job.job_description
+
+
+if __name__ == "__main__":
+    test_expand_all_single_round_trip()
+    test_job_description_expanded()
+    print("✅ Bulk expansion tests passed")
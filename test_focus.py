@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test Focus Emulation
+
+Checks that Scraper.focus switches DevTools focus emulation on once per
+session and only falls back to the alert() trick without DevTools access.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.objects import Scraper
+
+
+class NoDevToolsDriver(FixtureDriver):
+    """FixtureDriver standing in for a browser without DevTools access"""
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        raise AttributeError("execute_cdp_cmd")
+
+
+def test_focus_emulated_once_per_session():
+    driver = FixtureDriver({"a": load_fixture('activity_reactions.html'), "b": load_fixture('activity_comments.html')})
+    scraper = Scraper(driver=driver)
+
+    driver.get("a")
+    scraper.focus()
+    calls = driver.calls
+    scraper.focus()
+    driver.get("b")
+    scraper.focus()
+
+    assert driver.cdp_commands == [("Emulation.setFocusEmulationEnabled", {"enabled": True})]
+    assert driver.calls - calls == 1  # only the navigation
+
+
+def test_focus_falls_back_to_alert():
+    driver = NoDevToolsDriver(load_fixture('activity_reactions.html'))
+    scraper = Scraper(driver=driver)
+
+    calls = driver.calls
+    scraper.focus()
+
+    assert driver.calls - calls == 2  # alert() and its accept
+
+
+if __name__ == "__main__":
+    test_focus_emulated_once_per_session()
+    test_focus_falls_back_to_alert()
+    print("✅ Focus emulation tests passed")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test Job Card Extraction
+
+Checks the one-call job card reader used by Job.get_company_jobs against a
+saved search results page: no per-card clicks, canonical job URLs.
+"""
+
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.jobs import Job, canonical_job_url
+
+
+def test_canonical_job_url():
+    assert canonical_job_url("https://www.linkedin.com/jobs/view/security-engineer-at-acme-2-3990000001?refId=x") == \
+        "https://www.linkedin.com/jobs/view/3990000001/"
+    assert canonical_job_url("https://www.linkedin.com/jobs/search/?currentJobId=3990000002") == \
+        "https://www.linkedin.com/jobs/view/3990000002/"
+    assert canonical_job_url("https://www.linkedin.com/company/initech", "urn:li:jobPosting:3990000003") == \
+        "https://www.linkedin.com/jobs/view/3990000003/"
+    assert canonical_job_url("https://www.linkedin.com/company/initech") is None
+
+
+def test_extract_result_cards():
+    driver = FixtureDriver(load_fixture('job_results_public.html'))
+
+    jobs = Job.extract_result_cards(driver, company_name="Acme", max_jobs=25)
+
+    assert driver.calls == 2  # runtime install on first use, then one call for every card
+    assert [job.linkedin_url for job in jobs] == [
+        "https://www.linkedin.com/jobs/view/3990000001/",
+        "https://www.linkedin.com/jobs/view/3990000002/",
+        "https://www.linkedin.com/jobs/view/3990000003/",
+    ]
+    assert [job.job_title for job in jobs] == ["Security Engineer", "Senior Application Security Engineer", "Cloud Security Engineer"]
+    assert [job.company for job in jobs] == ["Acme Security", "Globex", "Acme"]
+    assert [job.location for job in jobs] == ["Bengaluru, Karnataka, India", "Remote", "Unknown Location"]
+
+
+def test_extract_result_cards_limit():
+    driver = FixtureDriver(load_fixture('job_results_public.html'))
+    assert len(Job.extract_result_cards(driver, max_jobs=2)) == 2
+
+
+SEARCH_FORM = '<input aria-label="Search by title, skill, or company"><button aria-label="Search">Search</button>'
+
+
+def test_get_company_jobs_fast_does_not_sleep():
+    driver = FixtureDriver(load_fixture('job_results_public.html').replace("<body>", "<body>" + SEARCH_FORM, 1))
+
+    started = time.monotonic()
+    jobs = Job.get_company_jobs(driver, job_title="security engineer", max_jobs=25, fast=True)
+
+    assert len(jobs) == 3
+    # The fixed pauses alone came to 10 seconds; a loaded page only waits for the scroll to run dry
+    assert time.monotonic() - started < 4
+
+
+if __name__ == "__main__":
+    test_canonical_job_url()
+    test_extract_result_cards()
+    test_extract_result_cards_limit()
+    test_get_company_jobs_fast_does_not_sleep()
+    print("✅ Job card tests passed")
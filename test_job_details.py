@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test Job Detail Scraping
+
+Checks that Job.scrape_details loads job pages a bounded number of tabs
+ahead, fills the jobs in input order and keeps the basic info of a job
+whose page fails.
+"""
+
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import Job
+from linkedin_scraper.readiness import RateLimiter
+
+JOB_URLS = [f"https://www.linkedin.com/jobs/view/39900000{n}/" for n in range(1, 6)]
+BROKEN_URL = JOB_URLS[2]
+
+
+class TabCountingDriver(FixtureDriver):
+    """FixtureDriver that records the most tabs open at once"""
+
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.most_tabs = 1
+
+    def _new_tab(self):
+        super()._new_tab()
+        self.most_tabs = max(self.most_tabs, len(self.window_handles))
+
+
+def test_details_in_order_with_bounded_tabs():
+    pages = {url: load_fixture('job_view.html') for url in JOB_URLS}
+    pages[BROKEN_URL] = "<html><body><main>This job is no longer available</main></body></html>"
+    driver = TabCountingDriver(pages)
+    jobs = [Job(url, job_title=f"Basic {i}", driver=driver, scrape=False) for i, url in enumerate(JOB_URLS)]
+    for job in jobs:
+        job.WAIT_FOR_ELEMENT_TIMEOUT = 0.2
+
+    scraped = Job.scrape_details(driver, jobs, tabs=2)
+
+    assert scraped == jobs
+    assert [job.job_title for job in scraped] == ["Detection Engineer"] * 2 + ["Basic 2"] + ["Detection Engineer"] * 2
+    assert sorted(driver.loads) == sorted(JOB_URLS)  # every page loaded once, in its tab
+    assert driver.most_tabs == 3  # the starting tab plus two loading ahead
+    assert driver.window_handles == ["tab-0"] and driver.current_window_handle == "tab-0"
+
+
+def test_rate_limiter_spaces_loads():
+    limiter = RateLimiter(per_second=20)
+    started = time.monotonic()
+    for _ in range(4):
+        limiter.wait()
+    assert time.monotonic() - started >= 0.15
+
+
+if __name__ == "__main__":
+    test_details_in_order_with_bounded_tabs()
+    test_rate_limiter_spaces_loads()
+    print("✅ Job detail tests passed")
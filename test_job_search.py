@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test Job Search
+
+Checks that JobSearch.search reads the cards of each results page once,
+pages through start= offsets, and stops at its limit.
+"""
+
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from lxml import html as lxml_html
+
+from fixture_driver import FixtureDriver, load_fixture, select_all
+
+from linkedin_scraper import JobSearch
+
+SEARCH_URL = "https://www.linkedin.com/jobs/search?keywords=security%20engineer&refresh=true"
+
+
+class PagedDriver(FixtureDriver):
+    """FixtureDriver serving a second results page that repeats a card of the first"""
+
+    def __init__(self):
+        first = load_fixture('job_search_results.html')
+        second = first.replace("3990000001", "3990000004").replace("Detection Engineer", "Threat Hunter") \
+                      .replace("3990000002", "3990000005").replace("3990000003", "3990000006")
+        super().__init__({SEARCH_URL: first, SEARCH_URL + "&start=25": second, SEARCH_URL + "&start=50": second})
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        super().get(url)
+
+
+def test_search_pages_through_offsets():
+    driver = PagedDriver()
+    job_search = JobSearch(driver=driver, base_url="https://www.linkedin.com/jobs/", scrape=False)
+
+    jobs = job_search.search("security engineer", pages=3)
+
+    assert [job.job_title for job in jobs] == [
+        "Detection Engineer", "Security Analyst", "Cloud Security Engineer",
+        "Threat Hunter", "Security Analyst", "Cloud Security Engineer",
+    ]
+    assert len({job.linkedin_url for job in jobs}) == 6
+    # the third page brought nothing new, so paging stopped there
+    assert driver.visited == [SEARCH_URL, SEARCH_URL + "&start=25", SEARCH_URL + "&start=50"]
+    assert driver._observers == {}
+
+
+def test_search_limit():
+    driver = PagedDriver()
+    job_search = JobSearch(driver=driver, base_url="https://www.linkedin.com/jobs/", scrape=False)
+
+    jobs = job_search.search("security engineer", limit=2, pages=3)
+
+    assert [job.job_title for job in jobs] == ["Detection Engineer", "Security Analyst"]
+    assert driver.visited == [SEARCH_URL]
+
+
+class PlaceholderDriver(FixtureDriver):
+    """FixtureDriver whose second card renders after a delay and whose last card never does"""
+
+    PLACEHOLDER = '<li class="job-card-list jobs-search-results__list-item"></li>'
+
+    def __init__(self, delay):
+        super().__init__({SEARCH_URL: load_fixture('job_search_results.html')})
+        self.delay = delay
+
+    def get(self, url):
+        super().get(url)
+        cards = select_all(self._root, ".job-card-list")
+        self.second_card = lxml_html.tostring(cards[1], encoding="unicode")
+        cards[1].getparent().replace(cards[1], lxml_html.fragment_fromstring(self.PLACEHOLDER))
+        cards[2].getparent().append(lxml_html.fragment_fromstring(self.PLACEHOLDER))
+        self.renders_at = time.monotonic() + self.delay
+
+    def _runtime_call(self, name, args):
+        if self.renders_at is not None and time.monotonic() >= self.renders_at:
+            self.renders_at = None
+            placeholder = select_all(self._root, ".job-card-list")[1]
+            for child in lxml_html.fragment_fromstring(self.second_card):
+                placeholder.append(child)
+        return super()._runtime_call(name, args)
+
+
+def test_search_skips_placeholder_cards():
+    driver = PlaceholderDriver(delay=0.3)
+    job_search = JobSearch(driver=driver, base_url="https://www.linkedin.com/jobs/", scrape=False)
+    job_search.WAIT_FOR_ELEMENT_TIMEOUT = 1
+
+    jobs = job_search.search("security engineer")
+
+    # the late card is read once it renders; the one that never does is left out
+    assert [job.job_title for job in jobs] == ["Detection Engineer", "Cloud Security Engineer", "Security Analyst"]
+    assert all(job.linkedin_url for job in jobs)
+
+
+if __name__ == "__main__":
+    test_search_pages_through_offsets()
+    test_search_limit()
+    test_search_skips_placeholder_cards()
+    print("✅ Job search tests passed")
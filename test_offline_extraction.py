@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test Offline Extraction
+
+Checks that Person, Company and Job can be filled from saved HTML without
+a browser, and that the offline parsers agree with the WebDriver walk.
+"""
+
+import os
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, FIXTURES_DIR, load_fixture
+
+from linkedin_scraper import Person, Company, Job
+from linkedin_scraper.offline import extract, extract_many
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+PERSON_DIR = os.path.join(FIXTURES_DIR, 'person')
+
+
+def person_pages():
+    return {
+        os.path.join(PROFILE_URL, "details/experience"): load_fixture('person/experience.html'),
+        os.path.join(PROFILE_URL, "details/education"): load_fixture('person/education.html'),
+    }
+
+
+def test_person_offline_matches_webdriver():
+    """Experiences and educations parsed offline equal the WebDriver walk"""
+    driver = FixtureDriver(person_pages())
+    live = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+    live.get_experiences(snapshot=False)
+    live.get_educations(snapshot=False)
+
+    offline = Person.from_html(PERSON_DIR)
+
+    assert len(offline.experiences) == 3
+    assert len(offline.educations) == 2
+    assert offline.experiences == live.experiences
+    assert offline.educations == live.educations
+
+
+def test_person_offline_values():
+    """Spot-check the top card and the multi-role experience"""
+    person = Person.from_html(PERSON_DIR)
+
+    assert person.linkedin_url == PROFILE_URL
+    assert person.name == "Shashank N"
+    assert person.location == "Bengaluru, Karnataka, India"
+    assert person.about == "Blue teamer building detections for cloud workloads.\nPreviously incident response."
+    assert person.open_to_work is True
+
+    first, senior, analyst = person.experiences
+    assert (first.position_title, first.from_date, first.to_date, first.duration) == ("Security Engineer", "Jan 2022", "Present", "2 yrs 9 mos")
+    assert first.linkedin_url == "https://www.linkedin.com/company/acme-security/"
+    assert (senior.position_title, senior.institution_name, senior.location) == ("Senior SOC Analyst", "Globex", "Pune, Maharashtra, India")
+    assert (analyst.from_date, analyst.to_date, analyst.duration) == ("Dec 2017", "Dec 2019", "2 yrs 1 mo")
+
+    iisc, rvce = person.educations
+    assert (iisc.from_date, iisc.to_date, iisc.degree) == ("2015", "2017", "Master of Technology, Computer Science")
+    assert (rvce.from_date, rvce.to_date, rvce.description) == (None, None, "")
+
+
+def test_company_offline_values():
+    company = Company.from_html(os.path.join(FIXTURES_DIR, 'company_about.html'))
+
+    assert company.linkedin_url == "https://www.linkedin.com/company/acme-security/"
+    assert company.name == "Acme Security"
+    assert company.about_us.startswith("Acme Security builds managed detection")
+    assert company.website == "https://acme-security.example"
+    assert company.company_size == "201-500 employees"
+    assert company.headquarters == "Bengaluru, Karnataka"  # shifted past the extra members <dd>
+    assert company.founded == "2016"
+    assert company.specialties == "Detection Engineering\nIncident Response\nCloud Security"
+    assert company.headcount == 312
+    assert company.employees == []
+
+
+def test_job_offline_values():
+    job = Job.from_html(load_fixture('job_view.html'))
+
+    assert job.linkedin_url == "https://www.linkedin.com/jobs/view/3990000001/"
+    assert (job.job_title, job.company) == ("Detection Engineer", "Acme Security")
+    assert job.company_linkedin_url == "https://www.linkedin.com/company/acme-security/life/"
+    assert (job.location, job.posted_date) == ("Bengaluru, Karnataka, India", "3 days ago")
+    assert job.applicant_count == "48 applicants"
+    assert "Sigma rules" in job.job_description
+    assert job.benefits == "Medical insurance, 401(k)"
+
+
+def test_extract_many_keeps_order():
+    sources = [PERSON_DIR, {"profile": load_fixture('person/profile.html')}]
+    people = extract_many("person", sources, processes=2)
+
+    assert [p.name for p in people] == ["Shashank N", "Shashank N"]
+    assert len(people[0].experiences) == 3 and people[1].experiences == []
+    assert extract("job", load_fixture('job_view.html')).job_title == "Detection Engineer"
+
+
+if __name__ == "__main__":
+    test_person_offline_matches_webdriver()
+    test_person_offline_values()
+    test_company_offline_values()
+    test_job_offline_values()
+    test_extract_many_keeps_order()
+    print("✅ Offline extraction tests passed")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test Pipelined Scraping
+
+Checks that run_pipeline builds the same objects as offline extraction,
+keeps input order and loads every page once.
+"""
+
+import os
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import Job, Person
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.pipeline import run_pipeline
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+JOB_URLS = [f"https://www.linkedin.com/jobs/view/39900000{n}/" for n in range(1, 7)]
+
+
+def test_pipeline_person_matches_offline():
+    driver = FixtureDriver({
+        PROFILE_URL: load_fixture('person/profile.html'),
+        os.path.join(PROFILE_URL, "details/experience"): load_fixture('person/experience.html'),
+        os.path.join(PROFILE_URL, "details/education"): load_fixture('person/education.html'),
+    })
+
+    [person] = run_pipeline(driver, "person", [PROFILE_URL], lookahead=2)
+    offline = Person.from_html(os.path.join(os.path.dirname(__file__), "fixtures", "person"))
+
+    assert person.linkedin_url == PROFILE_URL
+    assert person.name == offline.name
+    assert person.experiences == offline.experiences and len(person.experiences) == 3
+    assert person.educations == offline.educations
+    assert driver.window_handles == ["tab-0"]
+
+
+def test_pipeline_jobs_in_order():
+    driver = FixtureDriver({url: load_fixture('job_view.html') for url in JOB_URLS})
+
+    jobs = run_pipeline(driver, "job", JOB_URLS, parsers=3, queue_size=1)
+
+    assert [job.linkedin_url for job in jobs] == JOB_URLS
+    assert all(isinstance(job, Job) and job.job_title == "Detection Engineer" for job in jobs)
+    assert driver.loads == JOB_URLS
+
+
+def test_pipeline_missing_page_gives_none():
+    driver = FixtureDriver({JOB_URLS[0]: load_fixture('job_view.html'), JOB_URLS[1]: "<html><body></body></html>"})
+    Scraper.WAIT_FOR_ELEMENT_TIMEOUT, timeout = 0.2, Scraper.WAIT_FOR_ELEMENT_TIMEOUT
+    try:
+        jobs = run_pipeline(driver, "job", JOB_URLS[:2])
+    finally:
+        Scraper.WAIT_FOR_ELEMENT_TIMEOUT = timeout
+
+    assert jobs[0].job_title == "Detection Engineer" and jobs[1] is None
+
+
+if __name__ == "__main__":
+    test_pipeline_person_matches_offline()
+    test_pipeline_jobs_in_order()
+    test_pipeline_missing_page_gives_none()
+    print("✅ Pipeline tests passed")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test Driver Pool
+
+Checks that DriverPool signs its sessions in once, lends them out
+concurrently, keeps results in input order and replaces sessions that
+come back signed out.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver
+
+from linkedin_scraper import DriverPool
+
+SIGNED_IN = '<html><body><a class="global-nav__primary-link">Home</a><main>{}</main></body></html>'
+PAGES = {
+    "login": SIGNED_IN.format("Feed"),
+    "a": SIGNED_IN.format("Profile A"),
+    "b": SIGNED_IN.format("Profile B"),
+    "c": SIGNED_IN.format("Profile C"),
+    "authwall": "<html><body><main>Sign in to view</main></body></html>",
+}
+
+
+class SessionDriver(FixtureDriver):
+    """FixtureDriver that counts logins and can be quit"""
+
+    def __init__(self):
+        super().__init__(PAGES)
+        self.logins = 0
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+def login(driver):
+    driver.logins += 1
+    driver.get("login")
+
+
+def visit(driver, url):
+    driver.get(url)
+    return driver.find_element("tag name", "main").text
+
+
+def test_pool_reuses_sessions():
+    drivers = []
+
+    def factory():
+        drivers.append(SessionDriver())
+        return drivers[-1]
+
+    with DriverPool(size=2, factory=factory, login=login) as pool:
+        texts = pool.map(visit, ["a", "b", "c", "a"])
+
+    assert texts == ["Profile A", "Profile B", "Profile C", "Profile A"]
+    assert len(drivers) == 2 and all(d.logins == 1 for d in drivers)
+    assert pool.recycled == 0
+    assert all(d.closed for d in drivers)
+
+
+def test_pool_recycles_signed_out_sessions():
+    drivers = []
+
+    def factory():
+        drivers.append(SessionDriver())
+        return drivers[-1]
+
+    pool = DriverPool(size=1, factory=factory, login=login)
+    pool.HEALTH_CHECK_TIMEOUT = 0.2
+    texts = pool.map(visit, ["a", "authwall", "b"])
+
+    assert texts == ["Profile A", "Sign in to view", "Profile B"]
+    assert pool.recycled == 1
+    assert len(drivers) == 2 and drivers[0].closed and not drivers[1].closed
+    pool.close()
+    assert drivers[1].closed
+
+
+class LoginFailed(Exception):
+    pass
+
+
+def test_pool_start_failure_quits_started_sessions():
+    drivers = []
+
+    def factory():
+        drivers.append(SessionDriver())
+        return drivers[-1]
+
+    def flaky_login(driver):
+        if len(drivers) == 2 and driver is drivers[1]:
+            raise LoginFailed("checkpoint")
+        login(driver)
+
+    try:
+        DriverPool(size=2, factory=factory, login=flaky_login)
+    except LoginFailed:
+        pass
+    else:
+        raise AssertionError("the login error should be raised")
+
+    assert len(drivers) == 2 and all(d.closed for d in drivers)
+
+
+def test_pool_keeps_slot_when_replacement_fails():
+    drivers = []
+    logins = {"fail": False}
+
+    def factory():
+        drivers.append(SessionDriver())
+        return drivers[-1]
+
+    def flaky_login(driver):
+        if logins["fail"]:
+            raise LoginFailed("checkpoint")
+        login(driver)
+
+    pool = DriverPool(size=1, factory=factory, login=flaky_login)
+    pool.HEALTH_CHECK_TIMEOUT = 0.2
+    logins["fail"] = True
+
+    def signed_out(driver, url):
+        driver.get("authwall")
+        raise ValueError("job failed")
+
+    try:
+        pool.map(signed_out, ["a"])
+    except ValueError:
+        pass  # the job's own error, not the failed login
+    else:
+        raise AssertionError("the job error should be raised")
+
+    # The slot is empty, not lost: the next checkout opens a new session
+    try:
+        pool.map(visit, ["b"])
+    except LoginFailed:
+        pass
+    else:
+        raise AssertionError("the login error should be raised")
+    logins["fail"] = False
+    assert pool.map(visit, ["b"]) == ["Profile B"]
+    assert [d.closed for d in drivers] == [True, True, True, False]
+    pool.close()
+
+
+if __name__ == "__main__":
+    test_pool_reuses_sessions()
+    test_pool_recycles_signed_out_sessions()
+    test_pool_start_failure_quits_started_sessions()
+    test_pool_keeps_slot_when_replacement_fails()
+    print("✅ Driver pool tests passed")
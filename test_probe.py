@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test Selector Probing
+
+Checks that optional-field lookups never sit out the driver's implicit
+wait: selectors are probed in one call and the implicit wait is zeroed
+around the fallback cascades, then restored.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from selenium.webdriver.common.by import By
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import selectors
+from linkedin_scraper import person as person_module
+from linkedin_scraper.person import Person
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+
+def make_person(fixture, implicit_wait):
+    driver = FixtureDriver(load_fixture(fixture))
+    driver.implicitly_wait(implicit_wait)
+    return driver, Person(linkedin_url=PROFILE_URL, name="Shashank N", driver=driver, get=False, scrape=False)
+
+
+def test_probe_reports_present_selectors():
+    driver, person = make_person('activity_reactions.html', 0)
+    assert person.probe([".feed-shared-actor__name", ".missing", "time", "time"]) == {".feed-shared-actor__name", "time"}
+
+
+def test_reaction_cascades_do_not_stall():
+    driver, person = make_person('activity_reactions.html', 10)
+    elements = driver.find_elements(By.CSS_SELECTOR, selectors.REACTION_CONTAINERS[0])
+
+    reactions = [person._extract_reaction_data(e) for e in elements]
+
+    assert driver.stalls == 0
+    assert driver.implicit_wait == 10
+    assert [r['post_author'] for r in reactions] == ["Priya Raman", "Open Source Security Foundation"]
+
+
+def test_comment_cascades_do_not_stall():
+    driver, person = make_person('activity_comments.html', 10)
+    elements = driver.find_elements(By.CSS_SELECTOR, selectors.COMMENT_CONTAINERS[0])
+
+    comments = [person._extract_comment_data(e) for e in elements]
+
+    assert driver.stalls == 0
+    assert driver.implicit_wait == 10
+    assert comments[1]['content'] == "CFBR, if you want to build something really cool do apply."
+
+
+LEGACY_PROFILE = """
+<html><body><main>
+  <section class="pv-top-card"><h1>Legacy Person</h1></section>
+  <section class="pv-profile-section pv-interests-section artdeco-container-card artdeco-card ember-view"></section>
+</main></body></html>
+"""
+
+
+class ScriptCountingDriver(FixtureDriver):
+    """FixtureDriver that counts the selectors sent to the probe primitive"""
+
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.probed = []
+
+    def _runtime_call(self, name, args):
+        if name == "probe":
+            self.probed.append(len(args[0]))
+        return super()._runtime_call(name, args)
+
+
+def test_probe_sections_cached_per_layout():
+    person_module._layout_sections.clear()
+    modern = ScriptCountingDriver(load_fixture('person/profile.html'))
+    legacy = ScriptCountingDriver(LEGACY_PROFILE)
+    markers, everything = len(selectors.PROFILE_LAYOUTS), len(selectors.PROFILE_LAYOUTS) + len(selectors.PROFILE_SECTIONS)
+
+    assert Person(linkedin_url=PROFILE_URL, driver=modern, get=False, scrape=False).probe_sections() == frozenset()
+    assert Person(linkedin_url=PROFILE_URL, driver=legacy, get=False, scrape=False).probe_sections() == {"interests"}
+    # a layout seen before only needs its markers probed
+    assert Person(linkedin_url=PROFILE_URL, driver=legacy, get=False, scrape=False).probe_sections() == {"interests"}
+    assert modern.probed == [everything]
+    assert legacy.probed == [markers, len(selectors.PROFILE_SECTIONS), markers]
+    person_module._layout_sections.clear()
+
+
+if __name__ == "__main__":
+    test_probe_reports_present_selectors()
+    test_reaction_cascades_do_not_stall()
+    test_comment_cascades_do_not_stall()
+    test_probe_sections_cached_per_layout()
+    print("✅ Probe tests passed")
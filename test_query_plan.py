@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test Query Plans
+
+Checks the query-plan API on Scraper against saved HTML fixtures: the
+batched lookups must return what the per-element WebDriver code returns,
+in a single round-trip.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from selenium.webdriver.common.by import By
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import selectors, Query, JobSearch
+from linkedin_scraper.company import Company
+from linkedin_scraper.person import Person
+from linkedin_scraper.selectors import SelectorChain
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+COMPANY_LISTS = """
+<html><body>
+  <div class="company-list">
+    <div class="org-company-card">
+      <a class="company-name-link" href="/showcase/acme-labs/"> Acme Labs </a>
+      <span class="company-followers-count">1,024 followers</span>
+    </div>
+  </div>
+  <div class="company-list">
+    <div class="org-company-card">
+      <a class="company-name-link" href="/company/acme-cloud/">Acme Cloud</a>
+      <span class="company-followers-count">88 followers</span>
+    </div>
+  </div>
+</body></html>
+"""
+
+
+def test_query_plan_fallbacks_and_defaults():
+    driver = FixtureDriver(load_fixture('activity_reactions.html'))
+    person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+    chain = SelectorChain('test_author', [".missing", ".feed-shared-actor__name"])
+
+    result = person.run_query_plan([
+        Query("author", chain=chain),
+        Query("date", "time", attribute=("datetime", "text")),
+        Query("url", ["a.nothing", "a"], attribute="href", contains=("/feed/update/",)),
+        Query("post", ["a", "a[href*='/posts/']"], attribute="href", contains=("/posts/",)),
+        Query("absent", ".absent", default="n/a"),
+    ])
+
+    assert driver.calls == 2  # the first call on a page installs the runtime
+    assert result == {
+        "author": "Priya Raman",
+        "date": "2024-09-21T10:00:00Z",
+        "url": "https://www.linkedin.com/feed/update/urn:li:activity:7242000000000000001/",
+        "post": "https://www.linkedin.com/posts/openssf_scorecard-v5-activity-7242000000000000002-abcd/",
+        "absent": "n/a",
+    }
+    assert chain.stats == {".missing": [0, 1], ".feed-shared-actor__name": [1, 0]}
+
+
+def test_job_search_cards():
+    driver = FixtureDriver(load_fixture('job_search_results.html'))
+    job_search = JobSearch(driver=driver, scrape=False)
+    listing = driver.find_element(By.CLASS_NAME, "jobs-search-results-list")
+    job_search.call("height")
+    calls = driver.calls
+
+    jobs = job_search.scrape_job_cards(".job-card-list", base=listing)
+
+    assert driver.calls - calls == 1
+    assert [(job.job_title, job.company) for job in jobs] == [
+        ("Detection Engineer", "Acme Security"), ("Security Analyst", "Globex"), ("Cloud Security Engineer", "Initech")]
+    assert jobs[0].linkedin_url == "https://www.linkedin.com/jobs/view/3990000001/?refId=abc"
+    assert (jobs[1].location, jobs[2].location) == ("Remote", "")
+
+
+def test_company_cards():
+    driver = FixtureDriver(COMPANY_LISTS)
+    company = Company(linkedin_url="https://www.linkedin.com/company/acme/", driver=driver, scrape=False, get=False)
+    showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
+
+    showcase_pages = company._Company__get_company_cards(showcase)
+    affiliated_companies = company._Company__get_company_cards(affiliated)
+
+    assert [(c.name, c.followers) for c in showcase_pages] == [("Acme Labs", "1,024 followers")]
+    assert affiliated_companies[0].linkedin_url == "https://www.linkedin.com/company/acme-cloud/"
+
+
+def test_reaction_plan_matches_webdriver():
+    driver = FixtureDriver(load_fixture('activity_reactions.html'))
+    person = Person(linkedin_url=PROFILE_URL, name="Shashank N", driver=driver, get=False, scrape=False)
+    live = [person._extract_reaction_data(e) for e in driver.find_elements(By.CSS_SELECTOR, selectors.REACTION_CONTAINERS[0])]
+    person.call("height")
+    calls = driver.calls
+
+    rows = person.run_query_plan(person._reaction_queries(), container=selectors.REACTION_CONTAINERS, limit=5)
+    planned = [person._reaction_data_from_values(values) for values in rows]
+
+    assert driver.calls - calls == 1
+    assert planned == live
+    assert planned[0]['reaction_type'] == "celebrate"
+    assert planned[1]['post_preview'] == "Open Source Security Foundation"
+
+
+if __name__ == "__main__":
+    test_query_plan_fallbacks_and_defaults()
+    test_job_search_cards()
+    test_company_cards()
+    test_reaction_plan_matches_webdriver()
+    print("✅ Query plan tests passed")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test Readiness Waits
+
+Checks that the readiness waits return as soon as the page is ready, keep
+polling while it is busy, and give up at their deadline without raising.
+"""
+
+import sys
+import time
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import readiness
+from linkedin_scraper.objects import Scraper
+
+
+class BusyDriver(FixtureDriver):
+    """FixtureDriver whose page reports a pending request for the first ``busy_polls`` polls"""
+
+    def __init__(self, pages, busy_polls):
+        super().__init__(pages)
+        self.busy_polls = busy_polls
+        self.polls = 0
+
+    def _runtime_call(self, name, args):
+        state = super()._runtime_call(name, args)
+        if name == "ready":
+            self.polls += 1
+            if self.polls <= self.busy_polls:
+                state.update(pending=1, idleMs=0, quietMs=0)
+        return state
+
+
+class EarlyRequestDriver(FixtureDriver):
+    """
+    FixtureDriver with a request sent before the runtime was installed.
+
+    The runtime cannot see it as pending; it only learns of it from its
+    resource timing entry, ``duration`` seconds after the first poll.
+    """
+
+    def __init__(self, pages, duration):
+        super().__init__(pages)
+        self.duration = duration
+        self.installed = None
+
+    def _runtime_call(self, name, args):
+        state = super()._runtime_call(name, args)
+        if name == "ready":
+            now = time.monotonic()
+            if self.installed is None:
+                self.installed = now
+            network = self.installed + self.duration if now >= self.installed + self.duration else self.installed
+            state.update(idleMs=(now - network) * 1000)
+        return state
+
+
+def test_ready_page_returns_at_once():
+    driver = FixtureDriver(load_fixture('activity_reactions.html'))
+    scraper = Scraper(driver=driver)
+
+    started = time.monotonic()
+    assert scraper.wait_until_settled(timeout=5)
+    assert readiness.wait_for_document_complete(driver, timeout=5)
+    assert time.monotonic() - started < 0.5
+
+
+def test_busy_page_is_polled_until_settled():
+    driver = BusyDriver(load_fixture('activity_reactions.html'), busy_polls=3)
+
+    assert readiness.wait_until_settled(driver, timeout=5)
+    assert driver.polls == 4
+
+
+def test_request_pending_before_install_restarts_quiet_period():
+    driver = EarlyRequestDriver(load_fixture('activity_reactions.html'), duration=0.4)
+
+    started = time.monotonic()
+    assert readiness.wait_until_settled(driver, timeout=5, quiet_ms=500)
+    # quiet from the moment the request finished, not from the install
+    assert time.monotonic() - started >= 0.9
+
+
+def test_deadline_returns_false():
+    driver = BusyDriver(load_fixture('activity_reactions.html'), busy_polls=1000)
+
+    started = time.monotonic()
+    assert not readiness.wait_until_settled(driver, timeout=0.3)
+    assert not readiness.wait_for_network_idle(driver, timeout=0.3)
+    assert time.monotonic() - started < 2
+
+
+def test_count_stable():
+    driver = FixtureDriver(load_fixture('activity_reactions.html'))
+
+    assert readiness.wait_for_count_stable(driver, ".feed-shared-update-v2", timeout=2, stable_ms=200)
+
+
+class InteractiveDriver(FixtureDriver):
+    """FixtureDriver whose page is parsed but still loading images (the eager strategy's return point)"""
+
+    def _runtime_call(self, name, args):
+        state = super()._runtime_call(name, args)
+        if name == "ready":
+            state.update(state="interactive")
+        return state
+
+
+def test_settled_does_not_wait_for_load_event():
+    driver = InteractiveDriver(load_fixture('activity_reactions.html'))
+
+    assert readiness.wait_until_settled(driver, timeout=0.3)
+
+
+def test_navigate_waits_for_target_only():
+    driver = FixtureDriver({"feed": load_fixture('activity_reactions.html')})
+    scraper = Scraper(driver=driver)
+
+    main = scraper.navigate("feed", "main")
+
+    assert main.tag_name == "main"
+    assert driver.current_url == "feed"
+    assert scraper.navigate("feed", None) is None
+
+
+if __name__ == "__main__":
+    test_ready_page_returns_at_once()
+    test_busy_page_is_polled_until_settled()
+    test_request_pending_before_install_restarts_quiet_period()
+    test_deadline_returns_false()
+    test_count_stable()
+    test_settled_does_not_wait_for_load_event()
+    test_navigate_waits_for_target_only()
+    print("✅ Readiness tests passed")
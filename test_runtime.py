@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test In-Page Runtime
+
+Checks that the helper runtime is installed once per document, that
+primitives can be called by name and chained into one round-trip, and that
+the FixtureDriver stand-ins answer like the runtime script itself.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append('linkedin_scraper')
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.runtime import RUNTIME_JS
+
+
+class RecordingDriver(FixtureDriver):
+    """FixtureDriver that keeps the scripts it was sent"""
+
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return super().execute_script(script, *args)
+
+
+def test_runtime_installed_once_per_document():
+    driver = RecordingDriver({"a": load_fixture('activity_reactions.html'), "b": load_fixture('activity_comments.html')})
+    scraper = Scraper(driver=driver)
+
+    driver.get("a")
+    scraper.scroll_to_half()
+    scraper.scroll_to_bottom()
+    assert scraper.call("count", ".feed-shared-update-v2") == 2
+    driver.get("b")
+    assert scraper.call("count", ".comments-comment-entity") == 2
+
+    installs = [script for script in driver.scripts if script.startswith(RUNTIME_JS)]
+    assert len(installs) == 2
+    assert len(driver.scripts) == 6  # one miss per new document, then name-only calls
+    assert all(len(script) < 200 for script in driver.scripts if not script.startswith(RUNTIME_JS))
+
+
+def test_call_chain_single_round_trip():
+    driver = FixtureDriver(load_fixture('activity_reactions.html'))
+    scraper = Scraper(driver=driver)
+    scraper.call("height")
+    calls = driver.calls
+
+    results = scraper.call_chain(("scrollTo", 1), ("count", "time"), ("count", ".missing"))
+
+    assert driver.calls - calls == 1
+    assert results == [0, 1, 0]
+
+
+# Just enough of a DOM for RUNTIME_JS to install and observe lists under node:
+# ".empty" is a list without items, ".full" one with two, anything else is missing
+NODE_DOM_JS = """
+globalThis.window = globalThis;
+globalThis.Node = {ELEMENT_NODE: 1};
+const item = () => ({nodeType: 1, isConnected: true, matches: () => true, querySelectorAll: () => [], querySelector: () => null});
+const lists = {'.empty': {querySelectorAll: () => []}, '.full': {querySelectorAll: () => [item(), item()]}};
+globalThis.document = {documentElement: {}, readyState: 'complete', querySelector: selector => lists[selector] || null};
+globalThis.MutationObserver = class { observe() {} disconnect() {} };
+globalThis.XMLHttpRequest = class {};
+XMLHttpRequest.prototype.send = () => {};
+"""
+
+OBSERVE_CALLS = [("missing", ".missing", "li"), ("empty", ".empty", "li"), ("full", ".full", "li")]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the runtime script")
+def test_fixture_observe_matches_runtime_js():
+    calls = ", ".join(f"window.__ss.observe({json.dumps(list(args))[1:-1]})" for args in OBSERVE_CALLS)
+    script = NODE_DOM_JS + RUNTIME_JS + f"console.log(JSON.stringify([{calls}]));"
+    in_page = json.loads(subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout)
+
+    driver = FixtureDriver('<html><body><ul class="empty"></ul><ul class="full"><li>a</li><li>b</li></ul></body></html>')
+    scraper = Scraper(driver=driver)
+    fake = [scraper.observe(*args) for args in OBSERVE_CALLS]
+
+    assert in_page == fake == [-1, 0, 2]
+
+
+if __name__ == "__main__":
+    test_runtime_installed_once_per_document()
+    test_call_chain_single_round_trip()
+    test_fixture_observe_matches_runtime_js()
+    print("✅ Runtime tests passed")
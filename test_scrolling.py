@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test Adaptive Scrolling
+
+Checks that Scraper.scroll_until stops at its target, at its stop
+predicate, and when a scroll brings no new items, and that Person.get_posts
+scrolls exactly until its time window is exhausted.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append('linkedin_scraper')
+
+from lxml import html as lxml_html
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper.objects import Scraper
+from linkedin_scraper.person import Person
+from linkedin_scraper.snapshot import select_one
+
+ITEM = ".list-style-none li"
+
+
+class InfiniteListDriver(FixtureDriver):
+    """FixtureDriver that appends ``batch`` results on each scroll to the bottom, ``batches`` times"""
+
+    def __init__(self, pages, batches, batch=2):
+        super().__init__(pages)
+        self.batches = batches
+        self.batch = batch
+        self.scrolls = 0
+
+    def _runtime_call(self, name, args):
+        if name == "scrollTo" and args[0] == 1:
+            self.scrolls += 1
+            if self.batches:
+                self.batches -= 1
+                for _ in range(self.batch):
+                    select_one(self._root, ".list-style-none").append(lxml_html.fragment_fromstring("<li>Someone</li>"))
+        return super()._runtime_call(name, args)
+
+
+def test_scroll_until_target():
+    driver = InfiniteListDriver(load_fixture('company_people.html'), batches=10)
+    scraper = Scraper(driver=driver)
+
+    assert scraper.scroll_until(ITEM, target=7) == 7
+    assert driver.scrolls == 2
+
+
+def test_scroll_until_stop_predicate():
+    driver = InfiniteListDriver(load_fixture('company_people.html'), batches=10)
+    scraper = Scraper(driver=driver)
+
+    assert scraper.scroll_until(ITEM, stop=lambda count: count >= 9) == 9
+    assert driver.scrolls == 3
+
+
+def test_scroll_until_list_runs_dry():
+    driver = InfiniteListDriver(load_fixture('company_people.html'), batches=2)
+    scraper = Scraper(driver=driver)
+
+    started = time.monotonic()
+    assert scraper.scroll_until(ITEM, max_delay=0.5) == 7
+    # two batches, then a short wait and one full-delay retry before giving up
+    assert driver.scrolls == 4
+    assert time.monotonic() - started < 2
+
+
+def test_scroll_until_max_scrolls():
+    driver = InfiniteListDriver(load_fixture('company_people.html'), batches=10)
+    scraper = Scraper(driver=driver)
+
+    assert scraper.scroll_until(ITEM, max_scrolls=1) == 5
+
+
+class OlderPostsDriver(FixtureDriver):
+    """FixtureDriver whose feed appends a post ``step_hours`` older than the last on each scroll"""
+
+    def __init__(self, step_hours):
+        super().__init__("<html><body><main></main></body></html>")
+        self.step_hours = step_hours
+        self.scrolls = 0
+
+    def _runtime_call(self, name, args):
+        if name == "scrollTo" and args[0] == 1:
+            self.scrolls += 1
+            self._append_post(self.scrolls * self.step_hours)
+        return super()._runtime_call(name, args)
+
+    def _append_post(self, hours_ago):
+        posted = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+        select_one(self._root, "main").append(lxml_html.fragment_fromstring(
+            f'<div class="feed-shared-update-v2" data-urn="urn:li:activity:{hours_ago}"><time datetime="{posted}">{hours_ago}h</time></div>'
+        ))
+
+
+def test_posts_scroll_stops_past_cutoff():
+    driver = OlderPostsDriver(step_hours=10)
+    driver.get("https://www.linkedin.com/in/someone/recent-activity/all/")
+    driver._append_post(0)
+    person = Person(linkedin_url="https://www.linkedin.com/in/someone/", driver=driver, get=False, scrape=False)
+
+    assert person._scroll_posts_past(datetime.now() - timedelta(hours=24)) == 4
+    assert driver.scrolls == 3  # the post 30h old ends the window
+    assert driver._observers == {}
+
+
+if __name__ == "__main__":
+    test_scroll_until_target()
+    test_scroll_until_stop_predicate()
+    test_scroll_until_list_runs_dry()
+    test_scroll_until_max_scrolls()
+    test_posts_scroll_stops_past_cutoff()
+    print("✅ Scrolling tests passed")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test Selector Chain
+
+Checks that SelectorChain promotes the selector that keeps matching and
+that its statistics survive a save/load round-trip, also when several
+processes save at once.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append('linkedin_scraper')
+
+from linkedin_scraper.selectors import SelectorChain, selector_chain, save_selector_stats
+
+
+def test_winner_moves_to_front():
+    chain = SelectorChain('test_dates', ['time', '.sub-description time', "[aria-label*='ago']"])
+    assert list(chain) == ['time', '.sub-description time', "[aria-label*='ago']"]
+
+    # The current layout only matches the last selector
+    order = chain.ordered()
+    chain.record_winner(order, order.index("[aria-label*='ago']"))
+
+    assert list(chain)[0] == "[aria-label*='ago']"
+
+
+def test_untried_selectors_keep_declared_order():
+    chain = SelectorChain('test_order', ['a', 'b', 'c'])
+    chain.miss('a')
+    assert list(chain) == ['b', 'c', 'a']
+
+
+def test_stats_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'stats.json')
+        chain = selector_chain('test_round_trip', ['.x', '.y'])
+        chain.miss('.x')
+        chain.hit('.y')
+        save_selector_stats(path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        restored = SelectorChain('test_round_trip', ['.x', '.y', '.z'], saved['test_round_trip'])
+
+        assert restored.stats == {'.x': [0, 1], '.y': [1, 0], '.z': [0, 0]}
+        assert list(restored) == ['.y', '.z', '.x']
+
+
+def save_from_worker(path, worker):
+    chain = selector_chain(f'test_worker_{worker}', ['.a', '.b'])
+    for _ in range(20):
+        chain.hit('.a')
+        save_selector_stats(path)
+
+
+def test_concurrent_saves_keep_every_process():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'stats.json')
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(save_from_worker, [path] * 4, range(4)))
+
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert {f'test_worker_{worker}' for worker in range(4)} <= set(saved)
+        assert all(saved[f'test_worker_{worker}']['.a'] == [20, 0] for worker in range(4))
+        assert [name for name in os.listdir(tmp) if name.endswith('.tmp')] == []
+
+
+if __name__ == "__main__":
+    test_winner_moves_to_front()
+    test_untried_selectors_keep_declared_order()
+    test_stats_round_trip()
+    test_concurrent_saves_keep_every_process()
+    print("✅ SelectorChain reorders and persists its statistics")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test Snapshot Extraction
+
+Checks that the snapshot-and-parse path (outerHTML + lxml) returns exactly
+what the WebDriver path returns, using saved HTML fixtures instead of a
+live LinkedIn session.
+"""
+
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from selenium.webdriver.common.by import By
+
+from fixture_driver import FixtureDriver, load_fixture
+from dataclasses import fields
+
+from linkedin_scraper import selectors, Comment
+from linkedin_scraper.person import Person
+from linkedin_scraper.snapshot import parse_html, select_all, take_snapshot
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+
+def make_person(driver):
+    return Person(linkedin_url=PROFILE_URL, name="Shashank N", driver=driver, get=False, scrape=False)
+
+
+def test_post_snapshot_matches_webdriver():
+    """Both extraction paths agree on every post in the fixture"""
+    driver = FixtureDriver(load_fixture('activity_posts.html'))
+    person = make_person(driver)
+
+    main = driver.find_element(By.TAG_NAME, "main")
+    live = [person._extract_post_data(e) for e in main.find_elements(By.CSS_SELECTOR, selectors.POST)]
+
+    root = parse_html(take_snapshot(driver, main))
+    parsed = [person._parse_post_data(n) for n in select_all(root, selectors.POST)]
+
+    assert len(parsed) == 4
+    assert parsed == live
+
+
+def test_post_snapshot_values():
+    """Spot-check the parsed values against the fixture"""
+    driver = FixtureDriver(load_fixture('activity_posts.html'))
+    person = make_person(driver)
+    root = parse_html(take_snapshot(driver))
+    first, second, third, fourth = [person._parse_post_data(n) for n in select_all(root, selectors.POST)]
+
+    assert first['content'] == "Shipping a new detection rule today.\nDetails in the thread below."
+    assert first['posted_date'] == "2024-09-20T08:15:00Z"
+    assert (first['likes_count'], first['comments_count'], first['shares_count']) == (1204, 37, 5)
+    assert first['author_url'] == "https://www.linkedin.com/in/shashank-n-security/"
+    assert first['post_url'].startswith("https://www.linkedin.com/posts/")
+
+    assert second['media_type'] == 'image'
+    assert second['author_name'] == "Shashank N"  # no actor link, falls back to the profile
+    assert third['content'] == ""  # hidden element has no rendered text
+    assert third['media_type'] == 'video'
+    assert fourth['media_type'] == 'document'
+
+
+def test_comment_batch_data_matches_webdriver():
+    """The one-round-trip comment query plan builds the same data as the WebDriver path"""
+    driver = FixtureDriver(load_fixture('activity_comments.html'))
+    person = make_person(driver)
+    live = [person._extract_comment_data(e) for e in driver.find_elements(By.CSS_SELECTOR, selectors.COMMENT_CONTAINERS[0])]
+
+    calls = driver.calls
+    rows = person._extract_comments_batch()
+    assert driver.calls - calls == 1
+    batched = [person._comment_data_from_script(row) for row in rows]
+
+    assert batched == live
+    assert set(batched[0]) == {f.name for f in fields(Comment)}
+    assert batched[0]['post_author'] == "Jane Analyst"
+    assert batched[0]['post_url'] == "https://www.linkedin.com/feed/update/urn:li:activity:7241111111111111111/"
+    assert batched[1]['content'] == "CFBR, if you want to build something really cool do apply."
+    assert (batched[0]['likes_count'], batched[1]['replies_count']) == (4, 2)
+
+
+def test_details_snapshot_matches_webdriver():
+    """get_experiences/get_educations build the same objects from one snapshot, in fewer round-trips"""
+    for fixture, method, attribute in (('person/experience.html', 'get_experiences', 'experiences'),
+                                       ('person/education.html', 'get_educations', 'educations')):
+        results = {}
+        for snapshot in (False, True):
+            driver = FixtureDriver(load_fixture(fixture))
+            person = make_person(driver)
+            getattr(person, method)(snapshot=snapshot)
+            results[snapshot] = (getattr(person, attribute), driver.calls)
+
+        (walked, walk_calls), (parsed, snapshot_calls) = results[False], results[True]
+        assert parsed and parsed == walked
+        assert snapshot_calls < walk_calls
+
+
+if __name__ == "__main__":
+    test_post_snapshot_matches_webdriver()
+    test_post_snapshot_values()
+    test_comment_batch_data_matches_webdriver()
+    test_details_snapshot_matches_webdriver()
+    print("✅ Snapshot extraction matches WebDriver extraction")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test Parallel Tabs
+
+Checks that Person.scrape_logged_in with parallel_tabs loads every page up
+front in a tab of its own, reads the same data as the sequential scrape and
+closes its tabs afterwards.
+"""
+
+import os
+import sys
+
+sys.path.append('linkedin_scraper')
+
+from selenium.webdriver.common.by import By
+
+from fixture_driver import FixtureDriver, load_fixture
+
+from linkedin_scraper import Person
+from linkedin_scraper.person import CONNECTIONS_URL
+
+PROFILE_URL = "https://www.linkedin.com/in/shashank-n-security/"
+
+
+def profile_pages():
+    return {
+        PROFILE_URL: load_fixture('person/profile.html'),
+        os.path.join(PROFILE_URL, "details/experience"): load_fixture('person/experience.html'),
+        os.path.join(PROFILE_URL, "details/education"): load_fixture('person/education.html'),
+        CONNECTIONS_URL: '<html><body><main><div class="mn-connections"></div></main></body></html>',
+    }
+
+
+def scrape(parallel_tabs):
+    driver = FixtureDriver(profile_pages())
+    driver.get(PROFILE_URL)
+    person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+    person.scrape_logged_in(close_on_complete=False, parallel_tabs=parallel_tabs)
+    return person, driver
+
+
+def test_parallel_tabs_match_sequential():
+    sequential, _ = scrape(parallel_tabs=False)
+    parallel, driver = scrape(parallel_tabs=True)
+
+    assert parallel.name == sequential.name
+    assert parallel.experiences == sequential.experiences and len(parallel.experiences) == 3
+    assert parallel.educations == sequential.educations
+    assert driver.loads == [PROFILE_URL] + parallel.section_urls()  # each page loaded once, all up front
+    assert driver.window_handles == ["tab-0"] and driver.current_window_handle == "tab-0"
+    assert parallel.tabs is None
+
+
+def test_navigate_outside_tabs_loads_page():
+    driver = FixtureDriver(profile_pages())
+    driver.get(PROFILE_URL)
+    person = Person(linkedin_url=PROFILE_URL, driver=driver, get=False, scrape=False)
+
+    person.open_tabs([CONNECTIONS_URL])
+    person.navigate(CONNECTIONS_URL, "mn-connections", By.CLASS_NAME)
+    person.navigate(PROFILE_URL, "main")
+
+    assert driver.loads == [PROFILE_URL, CONNECTIONS_URL, PROFILE_URL]
+    person.close_tabs()
+    assert driver.window_handles == ["tab-0"]
+
+
+if __name__ == "__main__":
+    test_parallel_tabs_match_sequential()
+    test_navigate_outside_tabs_loads_page()
+    print("✅ Parallel tab tests passed")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test Activity Timestamps
+
+Checks that creation times are decoded from activity and comment URNs, and
+that displayed dates are only parsed when no URN is available.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.append('linkedin_scraper')
+
+from linkedin_scraper.timestamps import id_to_datetime, urn_datetime, parse_date_text, activity_time
+from linkedin_scraper.person import Person
+
+NOW = datetime(2024, 9, 20, 12, 0, tzinfo=timezone.utc)
+
+
+def test_id_to_datetime():
+    assert id_to_datetime("7241234567890123456") == datetime(2024, 9, 16, 0, 0, 56, 617000, tzinfo=timezone.utc)
+
+
+def test_urn_datetime():
+    assert urn_datetime("urn:li:activity:7241234567890123456") == id_to_datetime(7241234567890123456)
+    # a comment is dated by its own id, not its post's
+    assert urn_datetime("urn:li:comment:(activity:7239000000000000000,7241234567890123456)") == \
+        id_to_datetime(7241234567890123456)
+    # URL-encoded, and from the first source that holds an id
+    assert urn_datetime("", "https://www.linkedin.com/feed/update/urn%3Ali%3Aactivity%3A7239000000000000000/") == \
+        id_to_datetime(7239000000000000000)
+    assert urn_datetime(None, "https://www.linkedin.com/in/someone/", "12345") is None
+
+
+def test_parse_date_text():
+    assert parse_date_text("2024-09-20T08:15:00Z") == datetime(2024, 9, 20, 8, 15, tzinfo=timezone.utc)
+    assert parse_date_text("2h ago", NOW) == NOW - timedelta(hours=2)
+    assert parse_date_text("1w •", NOW) == NOW - timedelta(weeks=1)
+    assert parse_date_text("3mo", NOW) == NOW - timedelta(days=90)
+    assert parse_date_text("5 minutes ago", NOW) == NOW - timedelta(minutes=5)
+    assert parse_date_text("Edited", NOW) is None
+
+
+def test_urn_wins_over_text():
+    assert activity_time(["urn:li:activity:7241234567890123456"], "1m") == id_to_datetime(7241234567890123456)
+    assert activity_time([""], "") is None
+
+
+def test_time_limit_uses_urn():
+    person = Person(linkedin_url="https://www.linkedin.com/in/someone/", driver=object(), get=False, scrape=False)
+    cutoff = datetime.now() - timedelta(hours=24)
+
+    # "1m" alone would pass; the URN shows the post is from 2024
+    assert not person._is_within_time_limit("1m", cutoff, ("urn:li:activity:7241234567890123456",))
+    assert person._is_within_time_limit("1m", cutoff)
+    assert not person._is_within_time_limit("2w", cutoff)
+    assert person._is_within_time_limit("", cutoff)
+
+
+if __name__ == "__main__":
+    test_id_to_datetime()
+    test_urn_datetime()
+    test_parse_date_text()
+    test_urn_wins_over_text()
+    test_time_limit_uses_urn()
+    print("✅ Timestamp tests passed")